@@ -4,9 +4,9 @@ from pathlib import Path
 from typing import Iterable
 
 import click
-import yaml
 
 from linkml._version import __version__
+from linkml.utils import yaml_utils
 
 from .config.datamodel.config import RuleLevel
 from .formatters import JsonFormatter, MarkdownFormatter, TerminalFormatter, TsvFormatter
@@ -111,7 +111,7 @@ def main(
 
     if config_file:
         with open(config_file) as f:
-            config_dict = yaml.safe_load(f)
+            config_dict = yaml_utils.safe_load(f)
     else:
         config_dict = {"extends": "recommended"}
 
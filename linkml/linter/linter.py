@@ -6,7 +6,6 @@ from pathlib import Path
 from typing import Any, Dict, Iterable, Union
 
 import jsonschema
-import yaml
 from jsonschema.exceptions import best_match
 from jsonschema.protocols import Validator
 from linkml_runtime import SchemaView
@@ -14,6 +13,7 @@ from linkml_runtime.dumpers import yaml_dumper
 from linkml_runtime.linkml_model import SchemaDefinition
 
 from linkml.generators.jsonschemagen import JsonSchemaGenerator
+from linkml.utils import yaml_utils
 
 from .. import LOCAL_METAMODEL_YAML_FILE
 from .config.datamodel.config import Config, ExtendableConfigs, RuleLevel
@@ -32,7 +32,7 @@ class LinterProblem:
 def get_named_config(name: str) -> Dict[str, Any]:
     config_path = str(Path(__file__).parent / f"config/{name}.yaml")
     with open(config_path) as config_file:
-        return yaml.safe_load(config_file)
+        return yaml_utils.safe_load(config_file)
 
 
 @lru_cache
@@ -89,7 +89,7 @@ class Linter:
     @staticmethod
     def validate_schema(schema_path: str):
         with open(schema_path) as schema_file:
-            schema = yaml.safe_load(schema_file)
+            schema = yaml_utils.safe_load(schema_file)
 
         validator = get_metamodel_validator()
         for err in validator.iter_errors(schema):
@@ -4,7 +4,6 @@ import pathlib
 import sys
 
 import click
-import yaml
 from linkml_runtime.linkml_model import Prefix
 from linkml_runtime.utils import inference_utils
 from linkml_runtime.utils.compile_python import compile_python
@@ -13,7 +12,7 @@ from linkml_runtime.utils.schemaview import SchemaView
 
 from linkml._version import __version__
 from linkml.generators.pythongen import PythonGenerator
-from linkml.utils import datautils, validation
+from linkml.utils import datautils, validation, yaml_utils
 from linkml.utils.datautils import (
     _get_context,
     _get_format,
@@ -124,7 +123,7 @@ def cli(
         if not prefix_path.exists():
             raise Exception(f"Path {prefix_file} to prefix map does not exists.")
         with open(prefix_path, "r") as prefix_stream:
-            raw_prefix_map = yaml.safe_load(prefix_stream)
+            raw_prefix_map = yaml_utils.safe_load(prefix_stream)
         prefix_file_map = raw_prefix_map.get("prefixes", None)
         if prefix_file_map is None:
             raise Exception("Provided prefix file does not contain the prefixes key.")
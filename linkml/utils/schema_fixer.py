@@ -20,6 +20,8 @@ from linkml_runtime.linkml_model import (
 from linkml_runtime.utils.formatutils import camelcase, underscore
 from linkml_runtime.utils.yamlutils import YAMLRoot
 
+from linkml.utils import yaml_utils
+
 logger = logging.getLogger(__name__)
 
 pattern = re.compile(r"(?<!^)(?=[A-Z])")
@@ -415,7 +417,7 @@ def main(verbose: int, quiet: bool):
 def fix_names(input_schema, **kwargs):
     """Fix element names to conform to naming conventions"""
     with open(input_schema) as f:
-        schema_dict = yaml.safe_load(f)
+        schema_dict = yaml_utils.safe_load(f)
     sv = SchemaView(input_schema)
     fixer = SchemaFixer()
     schema = fixer.fix_element_names(sv.schema, schema_dict, **kwargs)
@@ -433,7 +435,7 @@ def fix_names(input_schema, **kwargs):
 def implicit_slots(input_schema, **kwargs):
     """Find implicit slots in schema"""
     with open(input_schema) as f:
-        yaml.safe_load(f)
+        yaml_utils.safe_load(f)
     sv = SchemaView(input_schema)
     fixer = SchemaFixer()
     slots = fixer.implicit_slots(sv.schema)
@@ -0,0 +1,121 @@
+"""
+The ``linkml.utils.validation_client`` module contains the client of the validation server in
+:mod:`linkml.validator.server` and the ``linkml-validate`` entry point. It only uses the standard
+library, so that an invocation which is forwarded to a running server does not pay for importing
+the validator, its plugins and the generators they use.
+"""
+
+import json
+import os
+import socket
+import sys
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+#: Address used by ``linkml-validate --serve`` and ``--server`` if none is given
+DEFAULT_ADDRESS = "localhost:8765"
+
+#: Environment variable which sets the address of the server for ``linkml-validate``
+SERVER_ENVVAR = "LINKML_VALIDATE_SERVER"
+
+#: Passed as the context object to the CLI when forwarding was already attempted
+FORWARDING_ATTEMPTED = object()
+
+
+def parse_address(address: str) -> Tuple[int, Union[str, Tuple[str, int]]]:
+    """Parse a server address
+
+    An address is either ``unix:`` followed by the path of a Unix socket, or a TCP address of
+    the form ``host:port`` or ``port``, in which case the host is ``localhost``.
+
+    :param address: The address
+    :raises ValueError: If the address cannot be parsed
+    :return: Tuple of socket address family and socket address
+    """
+    if address.startswith("unix:"):
+        return socket.AF_UNIX, address[len("unix:") :]
+    host, _, port = address.rpartition(":")
+    try:
+        return socket.AF_INET, (host or "localhost", int(port))
+    except ValueError:
+        raise ValueError(f"Invalid server address: {address}") from None
+
+
+def send_request(address: str, request: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+    """Send a request to a validation server and wait for the response
+
+    :param address: Address of the server, see :func:`parse_address`
+    :param request: The request
+    :param timeout: Timeout in seconds for connecting and for each read. Defaults to ``None``
+        (wait indefinitely).
+    :raises OSError: If the server cannot be reached
+    :return: The decoded response
+    """
+    family, socket_address = parse_address(address)
+    if family == socket.AF_UNIX:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(timeout)
+        connection.connect(socket_address)
+    else:
+        connection = socket.create_connection(socket_address, timeout=timeout)
+    with connection, connection.makefile("rb") as response_file:
+        connection.sendall(json.dumps(request).encode() + b"\n")
+        return json.loads(response_file.readline())
+
+
+def forward(address: str, argv: List[str]) -> Optional[Dict[str, Any]]:
+    """Run ``linkml-validate`` on a validation server if one is listening at the address
+
+    :param address: Address of the server, see :func:`parse_address`
+    :param argv: Command line arguments. Relative paths are resolved against the current
+        working directory.
+    :return: The response with ``output``, ``error_output`` and ``exit_code``, or ``None`` if no
+        server is listening at the address
+    """
+    try:
+        return send_request(address, {"argv": argv, "cwd": os.getcwd()})
+    except (ConnectionError, FileNotFoundError, socket.timeout):
+        return None
+
+
+def split_server_option(argv: List[str]) -> Tuple[Optional[str], List[str]]:
+    """Take the ``--server`` option out of command line arguments
+
+    :param argv: Command line arguments
+    :return: Tuple of the value of the last ``--server`` option, or ``None`` if there is none, and
+        the remaining arguments
+    """
+    address = None
+    remaining = []
+    arguments = iter(argv)
+    for arg in arguments:
+        if arg == "--server":
+            address = next(arguments, None)
+        elif arg.startswith("--server="):
+            address = arg[len("--server=") :]
+        else:
+            remaining.append(arg)
+    return address, remaining
+
+
+def main() -> None:
+    """Run ``linkml-validate``
+
+    If a validation server is given with ``--server`` or the ``LINKML_VALIDATE_SERVER``
+    environment variable and one is listening there, the invocation is forwarded to it before
+    anything else is imported. Otherwise, the data is validated locally.
+    """
+    address, argv = split_server_option(sys.argv[1:])
+    address = address or os.environ.get(SERVER_ENVVAR)
+    serving = any(arg == "--serve" or arg.startswith("--serve=") for arg in argv)
+    if address and not serving:
+        response = forward(address, argv)
+        if response is not None:
+            sys.stdout.write(response.get("output", ""))
+            sys.stderr.write(response.get("error_output", ""))
+            if "error" in response:
+                sys.stderr.write(response["error"] + "\n")
+            sys.exit(response["exit_code"])
+
+    from linkml.validator.cli import cli
+
+    cli(obj=FORWARDING_ATTEMPTED)
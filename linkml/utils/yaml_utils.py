@@ -0,0 +1,82 @@
+"""
+Fast loading of YAML data.
+
+PyYAML's ``yaml.safe_load`` uses a parser written in Python. When PyYAML is built with libyaml,
+the functions in this module use its C parser instead, which is many times faster. They
+otherwise behave like their ``yaml.safe_*`` counterparts.
+"""
+
+from typing import IO, Any, Iterator, Union
+
+import yaml
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.events import SequenceEndEvent, SequenceStartEvent, StreamEndEvent
+from yaml.resolver import Resolver
+
+#: The fastest available loader which only constructs standard YAML tags
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+try:
+    from yaml._yaml import CParser
+except ImportError:
+    _StreamingLoader = yaml.SafeLoader
+else:
+
+    class _StreamingLoader(CParser, Composer, SafeConstructor, Resolver):
+        # Events come from the C parser, while nodes are composed in Python so that the
+        # composition of a document can be stopped and resumed at each item of its root sequence
+        def __init__(self, stream: Union[str, bytes, IO]) -> None:
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+
+def safe_load(stream: Union[str, bytes, IO]) -> Any:
+    """Load the single YAML document in a stream, like ``yaml.safe_load``
+
+    :param stream: YAML string or file object
+    :return: The document as Python objects
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_load_all(stream: Union[str, bytes, IO]) -> Iterator[Any]:
+    """Lazily load all YAML documents in a stream, like ``yaml.safe_load_all``
+
+    :param stream: YAML string or file object
+    :return: Iterator over the documents as Python objects
+    """
+    return yaml.load_all(stream, Loader=SafeLoader)
+
+
+def iter_safe_load_items(stream: Union[str, bytes, IO]) -> Iterator[Any]:
+    """Lazily load the items of the YAML documents in a stream
+
+    If the root of a document is a sequence, each item of the sequence is yielded as soon as it
+    has been parsed, so only one item at a time is held in memory. Otherwise, the root of the
+    document is yielded. Aliases may refer to anchors in earlier items of the same document.
+
+    :param stream: YAML string or file object
+    :return: Iterator over sequence items and documents as Python objects
+    """
+    loader = _StreamingLoader(stream)
+    try:
+        # Skip the stream start event
+        loader.get_event()
+        while not loader.check_event(StreamEndEvent):
+            # Skip the document start event
+            loader.get_event()
+            if loader.check_event(SequenceStartEvent):
+                loader.get_event()
+                while not loader.check_event(SequenceEndEvent):
+                    yield loader.construct_document(loader.compose_node(None, None))
+                loader.get_event()
+            else:
+                yield loader.construct_document(loader.compose_node(None, None))
+            # Skip the document end event
+            loader.get_event()
+            loader.anchors = {}
+    finally:
+        loader.dispose()
@@ -9,12 +9,18 @@ from pathlib import Path
 from typing import Any, Optional, Union
 
 from linkml_runtime.linkml_model import SchemaDefinition
-from linkml_runtime.loaders import yaml_loader
 
 from linkml.validator.loaders import default_loader_for_file
-from linkml.validator.plugins import JsonschemaValidationPlugin
 from linkml.validator.report import ValidationReport
 from linkml.validator.validator import Validator
+from linkml.validator.validator_cache import (
+    ValidatorCache,
+    ValidatorCacheInfo,
+    create_default_validator,
+    validator_cache_key,
+)
+
+_default_validators = ValidatorCache(maxsize=32)
 
 
 def _get_default_validator(
@@ -22,22 +28,9 @@ def _get_default_validator(
     *,
     strict: bool = False,
 ) -> Validator:
-    try:
-        if isinstance(schema, Path):
-            schema = str(schema)
-        if isinstance(schema, dict):
-            schema = SchemaDefinition(**schema)
-        elif isinstance(schema, str):
-            schema = yaml_loader.load(schema, target_class=SchemaDefinition)
-
-        if not isinstance(schema, SchemaDefinition):
-            raise ValueError(f"Schema could not be loaded from {schema}")
-    except ValueError as e:
-        raise ValueError(f"Invalid schema: {schema}") from e
-
-    validation_plugins = [JsonschemaValidationPlugin(closed=True)]
-
-    return Validator(schema, validation_plugins=validation_plugins, strict=strict)
+    return _default_validators.get(
+        validator_cache_key(schema, strict), lambda: create_default_validator(schema, strict=strict)
+    )
 
 
 def validate(
@@ -53,6 +46,10 @@ def validate(
     validator on a single instance. To have more control over the type of validation performed,
     see the :class:`Validator` class.
 
+    Validators, including the JSON Schema generated from the schema, are reused across calls
+    with the same schema (see :func:`clear_validator_cache`), so repeated calls only pay the
+    cost of validation.
+
     :param instance: The instance to validate
     :param schema: The schema used to validate the instance. If a string is
         it will be interpreted as a path, URL, or other loadable location.
@@ -84,11 +81,14 @@ def validate_file(
 
     This function provides a simple interface to do basic validation performed by a JSON Schema
     validator on instances loaded from a file. Loading is done according to the file's extension.
-    Accepted file extensions are: ``.csv``, ``.tsv``, ``.yaml``, ``.yml``, and ``.json``.
-    Individual rows of CSV and TSV files are treated as instances to validate. Each document
-    within a YAML file is treated as an individual instance to validate. If the top-level of a
-    JSON file is an array, each element of the array is treated as an instance to validate.
-    Otherwise, if the top-level is an object it is treated as a single instance to validate.
+    Accepted file extensions are: ``.csv``, ``.tsv``, ``.yaml``, ``.yml``, ``.json``, ``.jsonl``,
+    and ``.ndjson``. Individual rows of CSV and TSV files are treated as instances to validate.
+    Each document within a YAML file is treated as an individual instance to validate. If the
+    top-level of a JSON file is an array, each element of the array is treated as an instance to
+    validate. Otherwise, if the top-level is an object it is treated as a single instance to
+    validate. Each line of a JSON Lines file is treated as an instance to validate. Files may
+    additionally be compressed with gzip, bzip2, or xz (e.g. ``.json.gz``), in which case they
+    are decompressed on the fly.
 
     To have more control over the type of validation performed, see the :class:`Validator` class.
 
@@ -111,4 +111,40 @@ def validate_file(
     return validator.validate_source(loader, target_class)
 
 
-__all__ = ["Validator", "validate", "validate_file"]
+def clear_validator_cache() -> None:
+    """Discard all validators reused by :func:`validate` and :func:`validate_file`
+
+    Validators are reused based on the schema's path and modification time, or its content.
+    Changes to schemas imported by a schema file are not detected, so call this function after
+    changing them.
+    """
+    _default_validators.clear()
+
+
+def set_validator_cache_size(maxsize: int) -> None:
+    """Set how many validators are reused by :func:`validate` and :func:`validate_file`
+
+    When more schemas than this are in use, the least recently used validator is discarded.
+    Setting the size to ``0`` disables reuse. The default size is 32.
+
+    :param maxsize: Maximum number of validators to keep
+    """
+    _default_validators.resize(maxsize)
+
+
+def validator_cache_info() -> ValidatorCacheInfo:
+    """Statistics about validators reused by :func:`validate` and :func:`validate_file`
+
+    :return: A named tuple of ``hits``, ``misses``, ``maxsize`` and ``currsize``
+    """
+    return _default_validators.info()
+
+
+__all__ = [
+    "Validator",
+    "clear_validator_cache",
+    "set_validator_cache_size",
+    "validate",
+    "validate_file",
+    "validator_cache_info",
+]
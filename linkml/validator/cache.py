@@ -0,0 +1,272 @@
+"""
+The ``linkml.validator.cache`` module provides on-disk caches for artifacts that are expensive to
+generate from a schema, such as JSON Schema, and for the results of validating individual
+records. Entries are keyed by a hash of the schema content (including its imports) and the
+generation or validation options, so a cached entry is never used for a schema that has changed
+since it was created.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from linkml_runtime import SchemaView
+from linkml_runtime.dumpers import json_dumper
+
+from linkml._version import __version__
+
+
+def default_cache_directory() -> Path:
+    """The default directory for LinkML caches
+
+    This is ``$XDG_CACHE_HOME/linkml`` if the ``XDG_CACHE_HOME`` environment variable is set,
+    otherwise ``~/.cache/linkml``.
+
+    :return: Path to the default cache directory
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "linkml"
+
+
+def schema_content_hash(schema_view: SchemaView) -> str:
+    """Compute a hash over the content of a schema and all of the schemas it imports
+
+    :param schema_view: View over the schema
+    :return: Hex digest of the hash
+    """
+    digest = hashlib.sha256()
+    for name in sorted(schema_view.imports_closure()):
+        digest.update(name.encode())
+        digest.update(json_dumper.dumps(schema_view.schema_map[name]).encode())
+    return digest.hexdigest()
+
+
+def cache_key(*parts: Any) -> str:
+    """Compute a cache key from a schema hash and generation options
+
+    The installed LinkML version is always included in the key because generated artifacts may
+    change between versions.
+
+    :param parts: JSON-serializable values which identify the artifact
+    :return: Hex digest usable as a cache key
+    """
+    return hashlib.sha256(json.dumps([__version__, *parts]).encode()).hexdigest()
+
+
+class JsonSchemaCache:
+    """An on-disk cache of generated JSON Schema documents
+
+    The number of cache hits and misses since the cache object was created are available as the
+    ``hits`` and ``misses`` attributes.
+
+    :param directory: Directory to store cache entries in. It is created if it does not exist.
+        If ``None``, :func:`default_cache_directory` is used. Defaults to ``None``.
+    """
+
+    def __init__(self, directory: Optional[Union[str, os.PathLike]] = None) -> None:
+        self.directory = Path(directory) if directory is not None else default_cache_directory()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / "jsonschema" / f"{key}.json"
+
+    def get(self, key: str) -> Optional[dict]:
+        """Load a cached JSON Schema
+
+        :param key: Cache key as returned by :func:`cache_key`
+        :return: The cached JSON Schema or ``None`` if there is no (readable) entry for the key
+        """
+        try:
+            with open(self._path(key)) as cache_file:
+                json_schema = json.load(cache_file)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json_schema
+
+    def put(self, key: str, json_schema: dict) -> None:
+        """Store a JSON Schema in the cache
+
+        The entry is written to a temporary file first and then moved into place, so that
+        concurrent readers never see a partially written entry.
+
+        :param key: Cache key as returned by :func:`cache_key`
+        :param json_schema: The JSON Schema to store
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(json_schema, tmp_file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def record_hash(instance: Any) -> Optional[str]:
+    """Compute a hash over the canonical JSON serialization of a data record
+
+    Raw JSON documents (``bytes``) are hashed as they are.
+
+    :param instance: The record
+    :return: Hex digest of the hash, or ``None`` if the record cannot be serialized as JSON
+    """
+    if isinstance(instance, bytes):
+        return hashlib.sha256(instance).hexdigest()
+    try:
+        canonical = json.dumps(instance, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def remove_sqlite_database(path: Union[str, os.PathLike]) -> None:
+    """Remove a SQLite database together with its write-ahead log, if they exist
+
+    :param path: Path of the database
+    """
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.unlink(f"{path}{suffix}")
+        except FileNotFoundError:
+            pass
+
+
+class ResultCache:
+    """An on-disk cache of the validation results of individual records
+
+    Entries are stored in a SQLite database. Each entry holds the results of validating one
+    record and is keyed by a :func:`cache_key` built from the schema hash, the configuration of
+    the validation plugins and the :func:`record_hash` of the record, so records which have not
+    changed since a previous run do not need to be validated again.
+
+    Entries are evicted when the database is opened, which happens the first time the cache is
+    used in a process. The number of cache hits and misses since the cache object was created
+    are available as the ``hits`` and ``misses`` attributes.
+
+    The cache may be used from several threads, e.g. by the asynchronous methods of
+    :class:`linkml.validator.Validator`, which then share one connection to the database.
+
+    :param path: Path of the SQLite database. It is created if it does not exist. If ``None``,
+        ``results.sqlite`` in :func:`default_cache_directory` is used. Defaults to ``None``.
+    :param max_age: If set, entries which have not been used for this many seconds are evicted.
+        Defaults to ``None``.
+    :param max_entries: If set, the least recently used entries are evicted so that at most this
+        many remain. Defaults to ``None``.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, os.PathLike]] = None,
+        *,
+        max_age: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        self.path = Path(path) if path is not None else default_cache_directory() / "results.sqlite"
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._connection: Optional[sqlite3.Connection] = None
+        # Serializes the use of the connection, which may be shared between threads
+        self._lock = threading.RLock()
+
+    def __getstate__(self) -> dict:
+        # Each process opens its own connection
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=60, isolation_level=None, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, results TEXT NOT NULL, used REAL NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+            self.evict()
+        return self._connection
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, List[dict]]:
+        """Load the cached results for several records
+
+        :param keys: Cache keys as returned by :func:`cache_key`
+        :return: Dictionary of cached results for the keys which have an entry
+        """
+        keys = list(keys)
+        found = {}
+        with self._lock:
+            # Stay well below SQLite's limit on the number of query parameters
+            for start in range(0, len(keys), 500):
+                batch = keys[start : start + 500]
+                placeholders = ",".join("?" * len(batch))
+                query = f"SELECT key, results FROM results WHERE key IN ({placeholders})"
+                found.update((key, json.loads(results)) for key, results in self._db.execute(query, batch).fetchall())
+            if found:
+                now = time.time()
+                # In autocommit mode each update would otherwise be a transaction of its own
+                with self._db:
+                    self._db.execute("BEGIN")
+                    self._db.executemany("UPDATE results SET used = ? WHERE key = ?", [(now, key) for key in found])
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, entries: Dict[str, List[dict]]) -> None:
+        """Store the results for several records
+
+        :param entries: Dictionary of cache keys and the results of the corresponding records
+        """
+        now = time.time()
+        rows = [(key, json.dumps(results), now) for key, results in entries.items()]
+        with self._lock, self._db:
+            self._db.execute("BEGIN")
+            self._db.executemany("INSERT OR REPLACE INTO results (key, results, used) VALUES (?, ?, ?)", rows)
+
+    def evict(self) -> int:
+        """Remove entries according to ``max_age`` and ``max_entries``
+
+        :return: Number of entries removed
+        """
+        removed = 0
+        with self._lock:
+            if self.max_age is not None:
+                cursor = self._db.execute("DELETE FROM results WHERE used < ?", (time.time() - self.max_age,))
+                removed += cursor.rowcount
+            if self.max_entries is not None:
+                cursor = self._db.execute(
+                    "DELETE FROM results WHERE key NOT IN (SELECT key FROM results ORDER BY used DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+                removed += cursor.rowcount
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._db.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        """Close the connection to the database"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -1,19 +1,30 @@
 import importlib
+import json
 import sys
 from collections import Counter
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import click
-import yaml
+from linkml_runtime import SchemaView
 from pydantic import BaseModel, Field
 
 from linkml._version import __version__
-from linkml.utils import datautils
+from linkml.utils import datautils, yaml_utils
+from linkml.utils.validation_client import (
+    DEFAULT_ADDRESS,
+    FORWARDING_ATTEMPTED,
+    SERVER_ENVVAR,
+    forward,
+    split_server_option,
+)
 from linkml.validator import Validator
-from linkml.validator.loaders import Loader, default_loader_for_file
+from linkml.validator.cache import JsonSchemaCache, ResultCache, default_cache_directory
+from linkml.validator.loaders import CsvLoader, Loader, TsvLoader, default_loader_for_file
 from linkml.validator.plugins import ValidationPlugin
-from linkml.validator.report import Severity
+from linkml.validator.report import Severity, ValidationStats, ValidationSummary
+from linkml.validator.server import ValidationServer
+from linkml.validator.validator_cache import validator_cache_key
 
 
 class Config(BaseModel):
@@ -21,6 +32,8 @@ class Config(BaseModel):
     target_class: Optional[str] = None
     data_sources: Iterable[Union[str, Dict[str, Dict[str, str]]]] = []
     plugins: Optional[Dict[str, Optional[Dict[str, Any]]]] = {"JsonschemaValidationPlugin": {"closed": True}}
+    cache_dir: Optional[Union[str, Path]] = None
+    result_cache: Union[bool, Dict[str, Any]] = False
 
 
 def _resolve_class(full_class_name: str, default_package: str, **kwargs):
@@ -45,7 +58,11 @@ def _resolve_plugins(plugin_config: Dict[str, Dict[str, Any]]) -> List[Validatio
     return plugins
 
 
-def _resolve_loaders(loader_config: Iterable[Union[str, Dict[str, Dict[str, str]]]]) -> List[Loader]:
+def _resolve_loaders(
+    loader_config: Iterable[Union[str, Dict[str, Dict[str, str]]]],
+    schema_path: Optional[Union[str, Path]] = None,
+    target_class: Optional[str] = None,
+) -> List[Loader]:
     loaders = []
     for entry in loader_config:
         if isinstance(entry, str):
@@ -58,13 +75,31 @@ def _resolve_loaders(loader_config: Iterable[Union[str, Dict[str, Dict[str, str]
         else:
             raise click.ClickException("Invalid config. Data sources must be specified as a string or as dictionary.")
         loaders.append(loader)
+
+    # A schema view cannot be given in a config file, so CSV and TSV columns are decoded according
+    # to the schema being validated against. The schema is only loaded here if it is needed.
+    delimited_loaders = [
+        loader for loader in loaders if isinstance(loader, (CsvLoader, TsvLoader)) and loader.schema_view is None
+    ]
+    if delimited_loaders and schema_path is not None:
+        schema_view = SchemaView(str(schema_path))
+        for loader in delimited_loaders:
+            loader.schema_view = schema_view
+            loader.target_class = loader.target_class or target_class
     return loaders
 
 
 DEPRECATED = "[DEPRECATED: only used in legacy mode]"
 
 
-@click.command(name="validate")
+class _ValidateCommand(click.Command):
+    def parse_args(self, ctx: click.Context, args: List[str]) -> List[str]:
+        # Keep the raw arguments so that they can be forwarded to a validation server
+        ctx.meta["linkml.validator.argv"] = list(args)
+        return super().parse_args(ctx, args)
+
+
+@click.command(name="validate", cls=_ValidateCommand)
 @click.option(
     "-s",
     "--schema",
@@ -87,6 +122,102 @@ DEPRECATED = "[DEPRECATED: only used in legacy mode]"
     default=False,
     help="Exit after the first validation failure is found. If not specified all validation failures are reported.",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes used to validate data instances in parallel.",
+)
+@click.option(
+    "--unordered",
+    is_flag=True,
+    default=False,
+    help="When validating in parallel, report results as soon as a chunk of instances is validated "
+    "instead of in input order.",
+)
+@click.option(
+    "--cache-dir",
+    is_flag=False,
+    flag_value=str(default_cache_directory()),
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Cache generated JSON Schema in this directory and reuse it in later runs. If given "
+    f"without a value, {default_cache_directory()} is used.",
+)
+@click.option(
+    "--result-cache",
+    is_flag=True,
+    default=False,
+    help="Cache the validation results of each data instance in the cache directory and only validate "
+    "new or changed instances in later runs.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Do not use or update any cache, even if one is configured.",
+)
+@click.option(
+    "--sample-rate",
+    type=click.FloatRange(min=0, max=1, min_open=True),
+    help="Only validate a random fraction of the data instances, e.g. 0.01 to validate about one in a hundred.",
+)
+@click.option(
+    "--sample-size",
+    type=click.IntRange(min=1),
+    help="Only validate a uniformly random sample of this many data instances from each data source.",
+)
+@click.option(
+    "--sample-seed",
+    type=int,
+    help="Seed for the random choice of instances when sampling.",
+)
+@click.option(
+    "--max-errors",
+    type=click.IntRange(min=1),
+    help="Stop validating a data source after this many errors.",
+)
+@click.option(
+    "--max-errors-per-type",
+    type=click.IntRange(min=1),
+    help="Only report this many validation results of each type.",
+)
+@click.option(
+    "--stats",
+    is_flag=True,
+    default=False,
+    help="After validating, print timing and throughput statistics for the loaders and plugins as JSON "
+    "to standard error.",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    help="After validating, write timing and throughput statistics for the loaders and plugins as JSON "
+    "to this file.",
+)
+@click.option(
+    "--serve",
+    is_flag=False,
+    flag_value=DEFAULT_ADDRESS,
+    help="Instead of validating, run a validation server which keeps schemas and generated artifacts warm between "
+    "requests. The address is either host:port or unix: followed by the path of a Unix socket. If given without "
+    f"a value, {DEFAULT_ADDRESS} is used.",
+)
+@click.option(
+    "--allow-remote-clients",
+    is_flag=True,
+    default=False,
+    help="Allow --serve to listen on an address which is not a loopback address. The server has no "
+    "authentication, and any client which can connect can make it read files and run arbitrary code as the "
+    "user running it.",
+)
+@click.option(
+    "--server",
+    envvar=SERVER_ENVVAR,
+    help="Forward this invocation to the validation server at this address if one is running, otherwise "
+    "validate locally. Can also be set with the LINKML_VALIDATE_SERVER environment variable.",
+)
 @click.option(
     "--legacy-mode",
     is_flag=True,
@@ -125,6 +256,21 @@ def cli(
     config: Optional[str],
     data_sources: Tuple[str],
     exit_on_first_failure: bool,
+    jobs: int,
+    unordered: bool,
+    cache_dir: Optional[Path],
+    result_cache: bool,
+    no_cache: bool,
+    sample_rate: Optional[float],
+    sample_size: Optional[int],
+    sample_seed: Optional[int],
+    max_errors: Optional[int],
+    max_errors_per_type: Optional[int],
+    stats: bool,
+    profile_output: Optional[Path],
+    serve: Optional[str],
+    allow_remote_clients: bool,
+    server: Optional[str],
     legacy_mode: bool,
     module: Optional[str],
     input_format: Optional[str],
@@ -135,6 +281,36 @@ def cli(
     """
     Validate data according to a LinkML Schema
     """
+    # When running inside a validation server, the context object is the server
+    parent_server = context.obj if isinstance(context.obj, ValidationServer) else None
+
+    if serve is not None:
+        if parent_server is not None:
+            raise click.ClickException("The --serve option cannot be used with a validation server.")
+        try:
+            validation_server = ValidationServer(serve, allow_remote=allow_remote_clients)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        click.echo(f"Serving validation requests on {validation_server.address}")
+        try:
+            validation_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            validation_server.close()
+        return
+
+    # The linkml-validate entry point tries to forward before the validator is imported
+    if server is not None and parent_server is None and context.obj is not FORWARDING_ATTEMPTED:
+        _, argv = split_server_option(context.meta["linkml.validator.argv"])
+        response = forward(server, argv)
+        if response is not None:
+            click.echo(response.get("output", ""), nl=False)
+            click.echo(response.get("error_output", ""), nl=False, err=True)
+            if "error" in response:
+                click.echo(response["error"], err=True)
+            sys.exit(response["exit_code"])
+
     if legacy_mode:
         from linkml.validators import jsonschemavalidator
 
@@ -173,10 +349,12 @@ def cli(
         "schema": schema,
         "target_class": target_class,
         "data_sources": data_sources,
+        "cache_dir": cache_dir,
+        "result_cache": result_cache,
     }
     if config:
         with open(config) as config_file:
-            config_raw = yaml.safe_load(config_file)
+            config_raw = yaml_utils.safe_load(config_file)
             config_args.update(config_raw)
 
     if config_args.get("schema") is None:
@@ -186,17 +364,80 @@ def cli(
         )
     config = Config(**config_args)
 
-    plugins = _resolve_plugins(config.plugins) if config.plugins else []
-    loaders = _resolve_loaders(config.data_sources)
-    validator = Validator(config.schema_path, validation_plugins=plugins, strict=exit_on_first_failure)
+    if sample_rate is not None and sample_size is not None:
+        raise click.ClickException("The --sample-rate and --sample-size options cannot be combined.")
+
+    json_schema_cache = None
+    results_cache = None
+    if not no_cache:
+        if config.cache_dir:
+            json_schema_cache = JsonSchemaCache(config.cache_dir)
+        if config.result_cache:
+            cache_directory = Path(config.cache_dir) if config.cache_dir else default_cache_directory()
+            eviction = config.result_cache if isinstance(config.result_cache, dict) else {}
+            max_age_days = eviction.get("max_age_days")
+            results_cache = ResultCache(
+                cache_directory / "results.sqlite",
+                max_age=max_age_days * 86400 if max_age_days is not None else None,
+                max_entries=eviction.get("max_entries"),
+            )
+
+    loaders = _resolve_loaders(config.data_sources, config.schema_path, config.target_class)
+    validator_options = {
+        "strict": exit_on_first_failure,
+        "workers": jobs,
+        "ordered": not unordered,
+        "collect_stats": stats or profile_output is not None,
+        "sample_rate": sample_rate,
+        "sample_size": sample_size,
+        "sample_seed": sample_seed,
+        "max_errors": max_errors,
+        "max_errors_per_type": max_errors_per_type,
+    }
+
+    def create_validator() -> Validator:
+        return Validator(
+            config.schema_path,
+            validation_plugins=_resolve_plugins(config.plugins) if config.plugins else [],
+            json_schema_cache=json_schema_cache,
+            result_cache=results_cache,
+            context_registry=parent_server.contexts if parent_server is not None else None,
+            **validator_options,
+        )
+
+    if parent_server is not None:
+        validator_config = [config.plugins, config.cache_dir, config.result_cache, no_cache, validator_options]
+        validator = parent_server.validators.get(
+            (
+                validator_cache_key(config.schema_path, False),
+                json.dumps(validator_config, sort_keys=True, default=str),
+            ),
+            create_validator,
+        )
+    else:
+        validator = create_validator()
     severity_counter = Counter()
-    for loader in loaders:
-        for result in validator.iter_results_from_source(loader, config.target_class):
-            severity_counter[result.severity] += 1
-            click.echo(f"[{result.severity.value}] [{loader.source}/{result.instance_index}] {result.message}")
-            if include_context:
-                for ctx in result.context:
-                    click.echo(f"[CONTEXT] {ctx}")
+    total_stats = ValidationStats()
+    try:
+        for loader in loaders:
+            for result in validator.iter_results_from_source(loader, config.target_class):
+                severity_counter[result.severity] += 1
+                click.echo(f"[{result.severity.value}] [{loader.source}/{result.instance_index}] {result.message}")
+                if include_context:
+                    for ctx in result.context:
+                        click.echo(f"[CONTEXT] {ctx}")
+            if validator.last_summary is not None:
+                _echo_summary(loader, validator.last_summary)
+            if validator.last_stats is not None:
+                total_stats.add(validator.last_stats)
+    finally:
+        if validator.result_cache is not None:
+            validator.result_cache.close()
+
+    if stats:
+        click.echo(total_stats.model_dump_json(indent=2), err=True)
+    if profile_output is not None:
+        profile_output.write_text(total_stats.model_dump_json(indent=2))
 
     if sum(severity_counter.values()) == 0:
         click.echo("No issues found")
@@ -205,5 +446,23 @@ def cli(
     sys.exit(exit_code)
 
 
+def _echo_summary(loader: Loader, summary: ValidationSummary) -> None:
+    line = f"[SUMMARY] [{loader.source}] Examined {summary.instances_examined}"
+    if summary.fraction_examined is not None:
+        line += f" of {summary.instances_seen} instances ({summary.fraction_examined:.1%})"
+    else:
+        line += " instances"
+    if summary.error_rate is not None:
+        line += f", {summary.instances_with_errors} with errors ({summary.error_rate:.1%}"
+        if summary.estimated_instances_with_errors is not None:
+            line += f", an estimated {summary.estimated_instances_with_errors:.0f} of the instances seen"
+        line += ")"
+    if summary.stopped_early:
+        line += ", stopped early"
+    click.echo(line)
+    for result_type, count in summary.suppressed_results.items():
+        click.echo(f"[SUMMARY] [{loader.source}] {count} further results of type '{result_type}' not reported")
+
+
 if __name__ == "__main__":
     cli()
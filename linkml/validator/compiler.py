@@ -0,0 +1,506 @@
+"""
+The ``linkml.validator.compiler`` module turns a schema into plain Python functions which check
+instances directly against LinkML semantics, without generating JSON Schema first. The functions
+are built once per schema and target class by walking the schema with a
+:class:`linkml_runtime.SchemaView`; all lookups (induced slots, ranges, enums, patterns,
+identifiers and type designators) happen at that point rather than while instances are checked.
+"""
+
+import datetime
+import itertools
+import re
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from linkml_runtime import SchemaView
+from linkml_runtime.linkml_model.meta import PresenceEnum, SlotDefinition
+
+from linkml.generators.common.type_designators import get_accepted_type_designator_values
+from linkml.generators.jsonschemagen import json_schema_types
+from linkml.utils.helpers import get_range_associated_slots
+
+#: A problem found in an instance, as a tuple of JSON Pointer location and message
+Error = Tuple[str, str]
+
+#: A compiled check, called with a value and its location
+Check = Callable[[Any, str], Iterator[Error]]
+
+#: A problem found in a batch of instances, as a tuple of the position of the instance in the
+#: batch, JSON Pointer location and message
+BatchError = Tuple[int, str, str]
+
+
+def _is_integer(value: Any) -> bool:
+    # Like JSON Schema, numbers with a zero fractional part are integers
+    if isinstance(value, float):
+        return value.is_integer()
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_boolean(value: Any) -> bool:
+    return isinstance(value, bool)
+
+
+def _is_string(value: Any) -> bool:
+    return isinstance(value, str)
+
+
+_JSON_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "integer": _is_integer,
+    "number": _is_number,
+    "boolean": _is_boolean,
+    "string": _is_string,
+}
+
+_NUMERIC_TYPES = frozenset((bool, int, float))
+
+# RFC 3339 dates and date-times, which are narrower than what ``fromisoformat`` accepts
+_DATE = re.compile(r"(\d{4})-(\d{2})-(\d{2})", re.ASCII)
+_DATE_TIME = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[Tt](\d{2}):(\d{2}):(\d{2})(?:\.\d+)?(?:[Zz]|[+-](\d{2}):(\d{2}))", re.ASCII
+)
+
+
+def _parse_date(value: str) -> datetime.date:
+    match = _DATE.fullmatch(value)
+    if match is None:
+        raise ValueError(f"Invalid date: {value!r}")
+    return datetime.date(*map(int, match.groups()))
+
+
+def _parse_date_time(value: str) -> datetime.date:
+    match = _DATE_TIME.fullmatch(value)
+    if match is None:
+        raise ValueError(f"Invalid date-time: {value!r}")
+    year, month, day, hour, minute, second, offset_hour, offset_minute = match.groups()
+    # A second of 60 is a leap second
+    if int(hour) > 23 or int(minute) > 59 or int(second) > 60:
+        raise ValueError(f"Invalid date-time: {value!r}")
+    if offset_hour is not None and (int(offset_hour) > 23 or int(offset_minute) > 59):
+        raise ValueError(f"Invalid date-time: {value!r}")
+    return datetime.date(int(year), int(month), int(day))
+
+
+_FORMAT_PARSERS: Dict[str, Callable[[str], Any]] = {
+    "date": _parse_date,
+    "date-time": _parse_date_time,
+}
+
+
+def _no_errors(value: Any, location: str) -> Iterator[Error]:
+    return iter(())
+
+
+class SchemaCompiler:
+    """Compile the classes of a schema into functions which check instances
+
+    Functions are compiled lazily, once per class, and reused for every instance. Recursive
+    class structures are supported.
+
+    :param schema_view: View over the schema
+    :param closed: If ``True``, properties which are not slots of a class are reported.
+        Defaults to ``False``.
+    """
+
+    def __init__(self, schema_view: SchemaView, *, closed: bool = False) -> None:
+        self.schema_view = schema_view
+        self.closed = closed
+        self._class_checks: Dict[Tuple[str, bool], Check] = {}
+        self._types = schema_view.all_types()
+        self._enums = schema_view.all_enums()
+        self._classes = schema_view.all_classes()
+
+    def compile(self, class_name: str) -> Callable[[Any], List[Error]]:
+        """Compile a function which checks instances of a class
+
+        :param class_name: Name of the class
+        :return: A function which takes an instance and returns a list of errors
+        """
+        check = self._class_check(class_name)
+
+        def validate(instance: Any) -> List[Error]:
+            return list(check(instance, ""))
+
+        return validate
+
+    def compile_columns(self, class_name: str) -> Callable[[List[Any]], List[BatchError]]:
+        """Compile a function which checks a batch of instances of a class column by column
+
+        Instead of checking each instance in turn, the values of each slot are collected from
+        all instances in the batch and each distinct value is checked once. This is much faster
+        for tabular data, where most columns have few distinct values or consist of scalars. The
+        function finds the same problems as the one returned by :meth:`compile`, in the same
+        order. Values which are not hashable (lists and objects) and classes with a type
+        designator are checked instance by instance.
+
+        :param class_name: Name of the class
+        :return: A function which takes a list of instances and returns a list of errors
+        """
+        sv = self.schema_view
+        check_instance = self._class_check(class_name)
+        designated = any(slot.designates_type for slot in sv.class_induced_slots(class_name))
+        id_slot = sv.get_identifier_slot(class_name, use_key=True)
+        required = []
+        disallowed = []
+        slot_checks: Dict[str, Check] = {}
+        for slot in sv.class_induced_slots(class_name):
+            name = slot.alias or slot.name
+            if slot.value_presence == PresenceEnum(PresenceEnum.ABSENT):
+                disallowed.append(name)
+            elif (
+                slot.required
+                or slot.value_presence == PresenceEnum(PresenceEnum.PRESENT)
+                or (id_slot is not None and slot.name == id_slot.name)
+            ):
+                required.append(name)
+            slot_checks[name] = self._slot_check(slot)
+        closed = self.closed
+
+        def check_instances(instances: List[Any]) -> List[BatchError]:
+            if designated:
+                return [
+                    (i, location, message)
+                    for i, instance in enumerate(instances)
+                    for location, message in check_instance(instance, "")
+                ]
+            # Errors are collected with a sort key of (instance, phase, position) so that they
+            # can be put in the same order as when instances are checked one at a time
+            errors: List[Tuple[Tuple[int, int, int], str, str]] = []
+            rows = []
+            for i, instance in enumerate(instances):
+                if isinstance(instance, dict):
+                    rows.append(i)
+                else:
+                    errors.extend(((i, 0, 0), location, message) for location, message in check_instance(instance, ""))
+            dicts = [instances[i] for i in rows]
+            key_positions: Dict[int, Dict[str, int]] = {}
+
+            def key_position(row: int, key: str) -> int:
+                # Problems with the properties of an instance are ordered like its own keys
+                positions = key_positions.get(row)
+                if positions is None:
+                    positions = key_positions[row] = {k: i for i, k in enumerate(instances[row])}
+                return positions[key]
+
+            for position, name in enumerate(required):
+                column = [d.get(name) for d in dicts]
+                if None in column:
+                    message = f"'{name}' is a required property"
+                    errors.extend(((row, 1, position), "", message) for row, v in zip(rows, column) if v is None)
+            for position, name in enumerate(disallowed):
+                message = f"'{name}' must not be present"
+                errors.extend(((row, 2, position), "", message) for row, d in zip(rows, dicts) if name in d)
+            for key in dict.fromkeys(itertools.chain.from_iterable(dicts)):
+                slot_check = slot_checks.get(key)
+                if slot_check is None:
+                    if closed:
+                        message = f"Additional properties are not allowed ('{key}' was unexpected)"
+                        errors.extend(
+                            ((row, 3, key_position(row, key)), "", message) for row, d in zip(rows, dicts) if key in d
+                        )
+                    continue
+                location = "/" + _escape(key)
+                column = [d.get(key) for d in dicts]
+                try:
+                    distinct = set(column)
+                except TypeError:
+                    # Lists and objects are checked one at a time
+                    distinct = None
+                # Numbers of different types which are equal (e.g. True, 1 and 1.0) would share
+                # the result of a single check
+                if distinct is None or len(_NUMERIC_TYPES.intersection(map(type, column))) > 1:
+                    for row, value in zip(rows, column):
+                        if value is not None:
+                            errors.extend(
+                                ((row, 3, key_position(row, key)), loc, message)
+                                for loc, message in slot_check(value, location)
+                            )
+                    continue
+                distinct.discard(None)
+                invalid = {}
+                for value in distinct:
+                    value_errors = list(slot_check(value, location))
+                    if value_errors:
+                        invalid[value] = value_errors
+                if invalid:
+                    for row, value in zip(rows, column):
+                        if value in invalid:
+                            errors.extend(
+                                ((row, 3, key_position(row, key)), loc, message) for loc, message in invalid[value]
+                            )
+            errors.sort(key=lambda error: error[0])
+            return [(order[0], location, message) for order, location, message in errors]
+
+        return check_instances
+
+    def _class_check(self, class_name: str, identifier_optional: bool = False) -> Check:
+        key = (class_name, identifier_optional)
+        if key not in self._class_checks:
+            # Register a forwarding check first so that recursive references resolve to the
+            # compiled check once it exists
+            compiled: List[Check] = []
+
+            def forward(value: Any, location: str) -> Iterator[Error]:
+                return compiled[0](value, location)
+
+            self._class_checks[key] = forward
+            compiled.append(self._compile_class(class_name, identifier_optional))
+            self._class_checks[key] = compiled[0]
+        return self._class_checks[key]
+
+    def _compile_class(self, class_name: str, identifier_optional: bool) -> Check:
+        sv = self.schema_view
+        id_slot = sv.get_identifier_slot(class_name, use_key=True)
+        required = []
+        disallowed = []
+        slot_checks: Dict[str, Check] = {}
+        designator = None
+        for slot in sv.class_induced_slots(class_name):
+            name = slot.alias or slot.name
+            is_id = id_slot is not None and slot.name == id_slot.name
+            if slot.value_presence == PresenceEnum(PresenceEnum.ABSENT):
+                disallowed.append(name)
+            elif slot.required or slot.value_presence == PresenceEnum(PresenceEnum.PRESENT) or is_id:
+                if not (is_id and identifier_optional):
+                    required.append(name)
+            slot_checks[name] = self._slot_check(slot)
+            if slot.designates_type:
+                designator = (name, self._designated_classes(slot, class_name))
+        required = tuple(required)
+        disallowed = tuple(disallowed)
+        closed = self.closed
+
+        def check(value: Any, location: str) -> Iterator[Error]:
+            if not isinstance(value, dict):
+                yield location, f"{value!r} is not of type 'object'"
+                return
+            if designator is not None:
+                designated = value.get(designator[0])
+                if designated is not None:
+                    designated_class = designator[1].get(designated) if isinstance(designated, str) else None
+                    if designated_class is None:
+                        yield location + "/" + designator[0], f"{designated!r} is not a valid type for {class_name}"
+                        return
+                    if designated_class != class_name:
+                        yield from self._class_check(designated_class, identifier_optional)(value, location)
+                        return
+            for name in required:
+                if value.get(name) is None:
+                    yield location, f"'{name}' is a required property"
+            for name in disallowed:
+                if name in value:
+                    yield location, f"'{name}' must not be present"
+            for key, item in value.items():
+                slot_check = slot_checks.get(key)
+                if slot_check is None:
+                    if closed:
+                        yield location, f"Additional properties are not allowed ('{key}' was unexpected)"
+                    continue
+                if item is not None:
+                    yield from slot_check(item, f"{location}/{_escape(key)}")
+
+        return check
+
+    def _designated_classes(self, slot: SlotDefinition, class_name: str) -> Dict[Any, str]:
+        sv = self.schema_view
+        designated = {}
+        for descendant in sv.class_descendants(class_name):
+            for value in get_accepted_type_designator_values(sv, slot, sv.get_class(descendant)):
+                designated.setdefault(value, descendant)
+        return designated
+
+    def _slot_check(self, slot: SlotDefinition) -> Check:
+        sv = self.schema_view
+        if slot.array:
+            # Array slots are not checked beyond being present
+            return _no_errors
+
+        if slot.multivalued and slot.range in self._classes and sv.is_inlined(slot) and not slot.inlined_as_list:
+            range_id_slot, simple_dict_value_slot, range_required_slots = get_range_associated_slots(sv, slot.range)
+            if range_id_slot is not None:
+                return self._inlined_dict_check(slot, simple_dict_value_slot, not range_required_slots)
+
+        element_check = self._value_check(slot)
+        if not slot.multivalued:
+            return element_check
+        min_items = slot.minimum_cardinality
+        max_items = slot.maximum_cardinality
+
+        def check(value: Any, location: str) -> Iterator[Error]:
+            if not isinstance(value, list):
+                yield location, f"{value!r} is not of type 'array'"
+                return
+            if min_items is not None and len(value) < min_items:
+                yield location, f"{value!r} should have at least {min_items} items"
+            if max_items is not None and len(value) > max_items:
+                yield location, f"{value!r} should have at most {max_items} items"
+            for i, item in enumerate(value):
+                yield from element_check(item, f"{location}/{i}")
+
+        return check
+
+    def _inlined_dict_check(
+        self, slot: SlotDefinition, simple_dict_value_slot: Optional[SlotDefinition], null_allowed: bool
+    ) -> Check:
+        object_check = self._class_check(slot.range, identifier_optional=True)
+        simple_value_check = self._value_check(simple_dict_value_slot) if simple_dict_value_slot else None
+        min_items = slot.minimum_cardinality
+        max_items = slot.maximum_cardinality
+
+        def check(value: Any, location: str) -> Iterator[Error]:
+            if not isinstance(value, dict):
+                yield location, f"{value!r} is not of type 'object'"
+                return
+            if min_items is not None and len(value) < min_items:
+                yield location, f"{value!r} should have at least {min_items} properties"
+            if max_items is not None and len(value) > max_items:
+                yield location, f"{value!r} should have at most {max_items} properties"
+            for key, item in value.items():
+                item_location = f"{location}/{_escape(key)}"
+                if item is None:
+                    if not null_allowed:
+                        yield item_location, "None is not of type 'object'"
+                elif isinstance(item, dict) or simple_value_check is None:
+                    yield from object_check(item, item_location)
+                else:
+                    yield from simple_value_check(item, item_location)
+
+        return check
+
+    def _value_check(self, slot) -> Check:
+        """Compile a check for a single value of a slot or anonymous slot expression"""
+        checks = []
+        boolean_checks = [
+            (getattr(slot, operator), combine)
+            for operator, combine in (
+                ("any_of", lambda n, total: n < total),
+                ("all_of", lambda n, total: n == 0),
+                ("exactly_one_of", lambda n, total: n == total - 1),
+                ("none_of", lambda n, total: n == total),
+            )
+        ]
+        has_boolean = any(expressions for expressions, _ in boolean_checks)
+        # With boolean expressions the range is given by the expressions, and the slot's own
+        # range is usually just the default range
+        if slot.range is not None and not has_boolean:
+            checks.append(self._range_check(slot))
+        checks.extend(self._constraint_checks(slot))
+        for expressions, combine in boolean_checks:
+            if expressions:
+                checks.append(self._boolean_check([self._value_check(e) for e in expressions], combine))
+
+        if len(checks) == 1:
+            return checks[0]
+
+        def check(value: Any, location: str) -> Iterator[Error]:
+            for c in checks:
+                yield from c(value, location)
+
+        return check
+
+    def _range_check(self, slot) -> Check:
+        sv = self.schema_view
+        range_name = slot.range
+        if range_name in self._types:
+            induced_type = sv.induced_type(range_name)
+            json_type, fmt = json_schema_types.get(induced_type.base.lower(), ("string", None))
+            is_type = _JSON_TYPE_CHECKS[json_type]
+            parse = _FORMAT_PARSERS.get(fmt)
+            type_checks = self._constraint_checks(induced_type)
+
+            def check(value: Any, location: str) -> Iterator[Error]:
+                if not is_type(value):
+                    yield location, f"{value!r} is not of type '{json_type}'"
+                    return
+                if parse is not None:
+                    try:
+                        parse(value)
+                    except ValueError:
+                        yield location, f"{value!r} is not a '{fmt}'"
+                for c in type_checks:
+                    yield from c(value, location)
+
+            return check
+
+        if range_name in self._enums:
+            permissible_values = frozenset(sv.get_enum(range_name).permissible_values or ())
+            if not permissible_values:
+                return _no_errors
+            listed = sorted(permissible_values)
+
+            def check(value: Any, location: str) -> Iterator[Error]:
+                if not isinstance(value, str) or value not in permissible_values:
+                    yield location, f"{value!r} is not one of {listed}"
+
+            return check
+
+        if range_name in self._classes:
+            if isinstance(slot, SlotDefinition) and sv.is_inlined(slot):
+                return self._class_check(range_name)
+            id_slot = sv.get_identifier_slot(range_name)
+            if id_slot is None:
+                return self._class_check(range_name)
+            # A reference to an object is checked like the identifier of that object
+            return self._range_check(id_slot)
+
+        return _no_errors
+
+    def _constraint_checks(self, element) -> List[Check]:
+        checks = []
+        pattern = element.pattern
+        if pattern:
+            compiled = re.compile(pattern)
+
+            def check_pattern(value: Any, location: str) -> Iterator[Error]:
+                if isinstance(value, str) and not compiled.search(value):
+                    yield location, f"{value!r} does not match {pattern!r}"
+
+            checks.append(check_pattern)
+
+        minimum = element.minimum_value
+        maximum = element.maximum_value
+        if minimum is not None or maximum is not None:
+
+            def check_range(value: Any, location: str) -> Iterator[Error]:
+                if not _is_number(value):
+                    return
+                if minimum is not None and value < minimum:
+                    yield location, f"{value!r} is less than the minimum of {minimum}"
+                if maximum is not None and value > maximum:
+                    yield location, f"{value!r} is greater than the maximum of {maximum}"
+
+            checks.append(check_range)
+
+        allowed = None
+        if element.equals_string is not None:
+            allowed = frozenset([element.equals_string])
+        elif element.equals_number is not None:
+            allowed = frozenset([element.equals_number])
+        elif getattr(element, "equals_string_in", None):
+            allowed = frozenset(element.equals_string_in)
+        if allowed is not None:
+            listed = sorted(allowed, key=str)
+
+            def check_equals(value: Any, location: str) -> Iterator[Error]:
+                # Lists and objects are not hashable, and never equal to a string or number
+                if not isinstance(value, Hashable) or value not in allowed:
+                    yield location, f"{value!r} is not one of {listed}"
+
+            checks.append(check_equals)
+        return checks
+
+    @staticmethod
+    def _boolean_check(alternatives: List[Check], combine: Callable[[int, int], bool]) -> Check:
+        def check(value: Any, location: str) -> Iterator[Error]:
+            failing = sum(1 for alternative in alternatives if any(True for _ in alternative(value, location)))
+            if not combine(failing, len(alternatives)):
+                yield location, f"{value!r} is not valid under the boolean slot expressions"
+
+        return check
+
+
+def _escape(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
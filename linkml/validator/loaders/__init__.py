@@ -8,30 +8,48 @@ instance from a source. Instances of these classes are passed to
 import os
 from typing import Union
 
+from linkml.validator.loaders.arrow_loader import ArrowIpcLoader, ParquetLoader
+from linkml.validator.loaders.compression import split_compression_extension
 from linkml.validator.loaders.delimited_file_loader import CsvLoader, TsvLoader
+from linkml.validator.loaders.json_lines_loader import JsonLinesLoader
 from linkml.validator.loaders.json_loader import JsonLoader
 from linkml.validator.loaders.loader import Loader
+from linkml.validator.loaders.ntriples_loader import NTriplesLoader
+from linkml.validator.loaders.sqlite_loader import SqliteLoader
 from linkml.validator.loaders.yaml_loader import YamlLoader
 
 
 def default_loader_for_file(file: Union[str, bytes, os.PathLike]) -> Loader:
-    _, ext = os.path.splitext(file)
+    # A compression extension (e.g. data.json.gz) is handled by the loader itself
+    uncompressed, _ = split_compression_extension(file)
+    _, ext = os.path.splitext(uncompressed)
     if ext == ".csv":
         return CsvLoader(file, skip_empty_rows=True)
     elif ext == ".tsv":
         return TsvLoader(file, skip_empty_rows=True)
     elif ext == ".json":
         return JsonLoader(str(file))
+    elif ext in (".jsonl", ".ndjson"):
+        return JsonLinesLoader(file)
     elif ext in (".yaml", ".yml"):
         return YamlLoader(file)
+    elif ext == ".parquet":
+        return ParquetLoader(file)
+    elif ext in (".arrow", ".arrows", ".feather", ".ipc"):
+        return ArrowIpcLoader(file)
 
     raise ValueError(f"Could not find loader for file: {file}")
 
 
 __all__ = [
+    "ArrowIpcLoader",
     "CsvLoader",
+    "JsonLinesLoader",
     "JsonLoader",
     "Loader",
+    "NTriplesLoader",
+    "ParquetLoader",
+    "SqliteLoader",
     "TsvLoader",
     "YamlLoader",
     "default_loader_for_file",
@@ -0,0 +1,276 @@
+import base64
+import datetime
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from linkml_runtime import SchemaView
+
+from linkml.utils.datautils import infer_root_class
+from linkml.validator.loaders.loader import Loader
+
+# Magic bytes at the start of a file in the Arrow IPC file format (as opposed to the stream format)
+_ARROW_FILE_MAGIC = b"ARROW1"
+
+
+def _isoformat(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, (datetime.date, datetime.time)) else value
+
+
+def _iso_duration(value: datetime.timedelta) -> str:
+    microseconds = value // datetime.timedelta(microseconds=1)
+    seconds, fraction = divmod(abs(microseconds), 1_000_000)
+    text = str(seconds)
+    if fraction:
+        text += f".{fraction:06d}".rstrip("0")
+    return f"{'-' if microseconds < 0 else ''}PT{text}S"
+
+
+def _decode_binary(value: bytes) -> str:
+    try:
+        return value.decode("utf-8")
+    except UnicodeDecodeError:
+        return base64.b64encode(value).decode("ascii")
+
+
+def _without_nanoseconds(data_type):
+    """The type of a column with nanosecond timestamps, times and durations truncated to microseconds
+
+    Values with nanosecond resolution cannot be converted to Python objects without pandas, so
+    columns are cast to this type first.
+
+    :param data_type: The ``pyarrow.DataType`` of the column
+    :return: The type to cast the column to, which is ``data_type`` itself if no cast is needed
+    """
+    import pyarrow as pa
+
+    if getattr(data_type, "unit", None) == "ns":
+        if pa.types.is_timestamp(data_type):
+            return pa.timestamp("us", data_type.tz)
+        if pa.types.is_time64(data_type):
+            return pa.time64("us")
+        if pa.types.is_duration(data_type):
+            return pa.duration("us")
+    if pa.types.is_dictionary(data_type):
+        value_type = _without_nanoseconds(data_type.value_type)
+        # Dictionary encoded values are decoded by the cast
+        return value_type if value_type != data_type.value_type else data_type
+    if pa.types.is_struct(data_type):
+        return pa.struct([field.with_type(_without_nanoseconds(field.type)) for field in data_type])
+    if pa.types.is_map(data_type):
+        return pa.map_(data_type.key_type, data_type.item_field.with_type(_without_nanoseconds(data_type.item_type)))
+    if pa.types.is_list(data_type):
+        return pa.list_(data_type.value_field.with_type(_without_nanoseconds(data_type.value_type)))
+    if pa.types.is_large_list(data_type):
+        return pa.large_list(data_type.value_field.with_type(_without_nanoseconds(data_type.value_type)))
+    if pa.types.is_fixed_size_list(data_type):
+        return pa.list_(
+            data_type.value_field.with_type(_without_nanoseconds(data_type.value_type)), data_type.list_size
+        )
+    return data_type
+
+
+def _value_converter(data_type) -> Optional[Callable[[Any], Any]]:
+    """Compile a function which converts a Python value of an Arrow column to its JSON-like form
+
+    :param data_type: The ``pyarrow.DataType`` of the column
+    :return: The function, or ``None`` if values need no conversion
+    """
+    import pyarrow as pa
+
+    if pa.types.is_dictionary(data_type):
+        return _value_converter(data_type.value_type)
+    if pa.types.is_date(data_type) or pa.types.is_timestamp(data_type) or pa.types.is_time(data_type):
+        return _isoformat
+    if pa.types.is_duration(data_type):
+        return _iso_duration
+    if pa.types.is_decimal(data_type):
+        return float
+    if pa.types.is_binary(data_type) or pa.types.is_large_binary(data_type) or pa.types.is_fixed_size_binary(data_type):
+        return _decode_binary
+    if pa.types.is_struct(data_type):
+        fields = [(field.name, _value_converter(field.type)) for field in data_type]
+
+        def convert_struct(value: dict) -> dict:
+            # Absent fields of a nested object are null in Arrow; leave them out like in a
+            # JSON or YAML document
+            return {
+                name: (convert(value[name]) if convert is not None else value[name])
+                for name, convert in fields
+                if value.get(name) is not None
+            }
+
+        return convert_struct
+    if pa.types.is_map(data_type):
+        convert_item = _value_converter(data_type.item_type)
+
+        def convert_map(value: list) -> dict:
+            return {k: (convert_item(v) if convert_item is not None and v is not None else v) for k, v in value}
+
+        return convert_map
+    if pa.types.is_list(data_type) or pa.types.is_large_list(data_type) or pa.types.is_fixed_size_list(data_type):
+        convert_element = _value_converter(data_type.value_type)
+        if convert_element is None:
+            return None
+
+        def convert_list(value: list) -> list:
+            return [convert_element(v) if v is not None else v for v in value]
+
+        return convert_list
+    return None
+
+
+class _ArrowLoader(Loader, ABC):
+    """Base class for loaders of Arrow record batches"""
+
+    def __init__(
+        self,
+        source,
+        *,
+        columns: Optional[List[str]] = None,
+        schema_view: Optional[SchemaView] = None,
+        target_class: Optional[str] = None,
+        batch_size: int = 65536,
+    ) -> None:
+        super().__init__(source)
+        self.columns = columns
+        self.schema_view = schema_view
+        self.target_class = target_class
+        self.batch_size = batch_size
+
+    @abstractmethod
+    def _column_names(self) -> List[str]:
+        """Names of all columns in the source"""
+        pass
+
+    @abstractmethod
+    def _iter_batches(self, columns: List[str]) -> Iterator:
+        """Yield record batches with the given columns from the source"""
+        pass
+
+    def projected_columns(self) -> List[str]:
+        """The columns which are read from the source
+
+        These are ``columns`` if it was given. Otherwise, if ``schema_view`` was given, these are
+        the columns which correspond to a slot of the target class. Otherwise, all columns are
+        read.
+
+        :return: List of column names, in the order in which they appear in the source
+        """
+        names = self._column_names()
+        if self.columns is not None:
+            wanted = set(self.columns)
+        elif self.schema_view is not None:
+            class_name = self.target_class or infer_root_class(self.schema_view)
+            wanted = {slot.alias or slot.name for slot in self.schema_view.class_induced_slots(class_name)}
+        else:
+            return names
+        return [name for name in names if name in wanted]
+
+    def iter_instances(self) -> Iterator[Dict[str, Any]]:
+        """Lazily yield instances from the source, one per row
+
+        Null values are left out of instances. Struct columns become nested objects, list
+        columns become lists and map columns become dictionaries, so they can be validated
+        against inlined and multivalued slots. Dates, times and durations are converted to ISO
+        8601 strings and decimals to floats. Nanosecond timestamps, times and durations are
+        truncated to microseconds, the resolution of Python's ``datetime``. Binary values are
+        decoded as UTF-8 text, or encoded with Base64 if they are not valid UTF-8. If no
+        columns are projected, an empty instance is yielded for each row.
+
+        :return: Iterator over data instances
+        :rtype: Iterator[Dict[str, Any]]
+        """
+        converters = None
+        for batch in self._iter_batches(self.projected_columns()):
+            names = batch.schema.names
+            if converters is None:
+                cast_types = [_without_nanoseconds(field.type) for field in batch.schema]
+                converters = [_value_converter(cast_type) for cast_type in cast_types]
+            columns = []
+            for column, cast_type, convert in zip(batch.columns, cast_types, converters):
+                if column.type != cast_type:
+                    column = column.cast(cast_type, safe=False)
+                values = column.to_pylist()
+                if convert is not None:
+                    values = [convert(v) if v is not None else v for v in values]
+                columns.append(values)
+            for row in range(batch.num_rows):
+                yield {name: values[row] for name, values in zip(names, columns) if values[row] is not None}
+
+
+class ParquetLoader(_ArrowLoader):
+    """A loader for instances stored as rows of a Parquet file
+
+    The file is read in record batches and only the projected columns (see
+    :meth:`projected_columns`) are read from disk. Requires the ``pyarrow`` package.
+
+    :param source: Path to Parquet file
+    :param columns: If provided, only read these columns. Defaults to ``None``.
+    :param schema_view: If provided (and ``columns`` is not), only read the columns which
+        correspond to a slot of ``target_class`` in this schema. Note that columns which are not
+        read are not reported by plugins which do not allow additional properties. Defaults to
+        ``None``.
+    :param target_class: Name of the class that rows instantiate. If ``None``, the class will be
+        inferred from the schema by looking for a class with ``tree_root: true``. Only used with
+        ``schema_view``. Defaults to ``None``.
+    :param batch_size: Maximum number of rows read at a time. Defaults to ``65536``.
+    """
+
+    def _column_names(self) -> List[str]:
+        import pyarrow.parquet as pq
+
+        with open(self.source, "rb") as source:
+            return pq.ParquetFile(source).schema_arrow.names
+
+    def _iter_batches(self, columns: List[str]) -> Iterator:
+        import pyarrow.parquet as pq
+
+        with open(self.source, "rb") as source:
+            yield from pq.ParquetFile(source).iter_batches(batch_size=self.batch_size, columns=columns)
+
+
+class ArrowIpcLoader(_ArrowLoader):
+    """A loader for instances stored as rows of an Arrow IPC (Feather version 2) file or stream
+
+    The source is memory-mapped and record batches are read as they were written, so
+    ``batch_size`` does not apply. Only the projected columns (see :meth:`projected_columns`)
+    are converted into instances. Requires the ``pyarrow`` package.
+
+    :param source: Path to Arrow IPC file or stream
+    :param columns: If provided, only read these columns. Defaults to ``None``.
+    :param schema_view: If provided (and ``columns`` is not), only read the columns which
+        correspond to a slot of ``target_class`` in this schema. Note that columns which are not
+        read are not reported by plugins which do not allow additional properties. Defaults to
+        ``None``.
+    :param target_class: Name of the class that rows instantiate. If ``None``, the class will be
+        inferred from the schema by looking for a class with ``tree_root: true``. Only used with
+        ``schema_view``. Defaults to ``None``.
+    """
+
+    def _open(self, source):
+        import pyarrow as pa
+
+        if source.read(len(_ARROW_FILE_MAGIC)) == _ARROW_FILE_MAGIC:
+            source.seek(0)
+            reader = pa.ipc.open_file(source)
+            return reader.schema, (reader.get_batch(i) for i in range(reader.num_record_batches))
+        source.seek(0)
+        reader = pa.ipc.open_stream(source)
+        return reader.schema, iter(reader)
+
+    def _column_names(self) -> List[str]:
+        import pyarrow as pa
+
+        with pa.memory_map(str(self.source)) as source:
+            schema, _ = self._open(source)
+            return schema.names
+
+    def _iter_batches(self, columns: List[str]) -> Iterator:
+        import pyarrow as pa
+
+        # The memory map is not closed explicitly because the batches yielded refer to it
+        schema, batches = self._open(pa.memory_map(str(self.source)))
+        indices = [schema.get_field_index(name) for name in columns]
+        for batch in batches:
+            # Columns which are not selected are never touched, so their pages are not read
+            yield batch.select(indices)
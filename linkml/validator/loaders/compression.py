@@ -0,0 +1,81 @@
+"""
+Helpers for reading data sources that are compressed with a format supported by the Python
+standard library (gzip, bzip2 and xz/lzma). Compression is detected from the file extension or,
+failing that, from the magic bytes at the start of the file.
+"""
+
+import bz2
+import gzip
+import lzma
+import os
+from typing import IO, Optional, Tuple, Union
+
+COMPRESSION_EXTENSIONS = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".lzma": "xz",
+}
+
+_OPENERS = {
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open,
+}
+
+
+def split_compression_extension(path: Union[str, bytes, os.PathLike]) -> Tuple[str, Optional[str]]:
+    """Split a compression extension (e.g. ``.gz``) off a path
+
+    :param path: Path to a file
+    :return: A tuple of the path without the compression extension and the name of the
+        compression format, or the unchanged path and ``None`` if the extension does not
+        indicate compression
+    """
+    path = os.fsdecode(path)
+    root, ext = os.path.splitext(path)
+    compression = COMPRESSION_EXTENSIONS.get(ext.lower())
+    if compression is None:
+        return path, None
+    return root, compression
+
+
+def detect_compression(path: Union[str, bytes, os.PathLike]) -> Optional[str]:
+    """Detect whether a file is compressed
+
+    :param path: Path to a file
+    :return: The name of the compression format (``gzip``, ``bz2`` or ``xz``) or ``None`` if
+        the file is not compressed or cannot be read
+    """
+    _, compression = split_compression_extension(path)
+    if compression is not None:
+        return compression
+    try:
+        with open(path, "rb") as file:
+            magic = file.read(6)
+    except (OSError, TypeError, ValueError):
+        return None
+    if magic.startswith(b"\x1f\x8b"):
+        return "gzip"
+    if magic.startswith(b"BZh") and magic[3:4].isdigit():
+        return "bz2"
+    if magic.startswith(b"\xfd7zXZ\x00"):
+        return "xz"
+    return None
+
+
+def open_source(path: Union[str, bytes, os.PathLike], mode: str = "rt", **kwargs) -> IO:
+    """Open a file, decompressing it on the fly if needed
+
+    :param path: Path to a file
+    :param mode: Mode in which to open the file. Only reading modes make sense here.
+        Defaults to ``"rt"``.
+    :param kwargs: Additional keyword arguments passed to :func:`open` (or its
+        decompressing counterpart) such as ``encoding`` or ``newline``
+    :return: A file object yielding decompressed content
+    """
+    compression = detect_compression(path)
+    if compression is None:
+        return open(path, mode, **kwargs)
+    return _OPENERS[compression](path, mode, **kwargs)
@@ -1,10 +1,22 @@
 import csv
 import re
 from abc import ABC, abstractmethod
-from typing import Iterator, Optional
+from typing import Any, Callable, Dict, Iterator, Optional
 
+from linkml_runtime import SchemaView
+
+from linkml.utils.datautils import infer_root_class
+from linkml.validator.loaders.compression import open_source
 from linkml.validator.loaders.loader import Loader
 
+_TRUE_VALUES = frozenset(("true", "t", "yes", "y", "1"))
+_FALSE_VALUES = frozenset(("false", "f", "no", "n", "0"))
+
+# Numbers as written in JSON (with an optional leading plus sign), so that strings which Python's
+# int and float also accept, such as "1_000", "nan" and "inf", are left for validation to report
+_INTEGER = re.compile(r"[+-]?[0-9]+", re.ASCII)
+_FLOAT = re.compile(r"[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?", re.ASCII)
+
 
 def _parse_numeric(value: str):
     if not isinstance(value, str) or not re.search(r"[0-9]", value):
@@ -19,6 +31,86 @@ def _parse_numeric(value: str):
         return value
 
 
+def _parse_integer(value: str):
+    if _INTEGER.fullmatch(value) is None:
+        return value
+    return int(value)
+
+
+def _parse_float(value: str):
+    if _FLOAT.fullmatch(value) is None:
+        return value
+    parsed = float(value)
+    # Numbers too large for a float would otherwise become infinity
+    return parsed if parsed not in (float("inf"), float("-inf")) else value
+
+
+def _parse_boolean(value: str):
+    lowered = value.lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    return value
+
+
+def _identity(value: str):
+    return value
+
+
+# Decoders for the builtin LinkML types whose values are not represented as strings in JSON.
+# Values of every other type (string, date, datetime, uri, etc.), enums and class references
+# are passed through as strings.
+_TYPE_DECODERS = {
+    "integer": _parse_integer,
+    "float": _parse_float,
+    "double": _parse_float,
+    "decimal": _parse_float,
+    "boolean": _parse_boolean,
+}
+
+
+def _multivalued_decoder(decode: Callable[[str], Any], delimiter: str) -> Callable[[str], Any]:
+    def decode_list(value: str):
+        if value.startswith("[") and value.endswith("]"):
+            value = value[1:-1]
+        return [decode(item.strip()) for item in value.split(delimiter) if item.strip()]
+
+    return decode_list
+
+
+def compile_column_decoders(
+    schema_view: SchemaView, class_name: str, *, list_delimiter: str = "|"
+) -> Dict[str, Callable[[str], Any]]:
+    """Compile one decoder function per slot of a class
+
+    Each decoder converts the string value of a cell into the representation expected for the
+    slot's range: integers, floats and booleans are parsed, values of multivalued slots are
+    split into lists, and everything else (strings, dates, enums, references, etc.) is passed
+    through unchanged. A value that cannot be parsed is also passed through unchanged so that
+    validation can report it.
+
+    :param schema_view: View over the schema
+    :param class_name: Name of the class whose induced slots describe the columns
+    :param list_delimiter: Delimiter between values of multivalued slots. Values may
+        optionally be wrapped in square brackets (e.g. ``[a|b]``). Defaults to ``|``.
+    :return: Mapping from slot name to decoder function
+    """
+    all_types = schema_view.all_types()
+    decoders = {}
+    for slot in schema_view.class_induced_slots(class_name):
+        decode = _identity
+        if slot.range in all_types:
+            for ancestor in schema_view.type_ancestors(slot.range):
+                if ancestor in _TYPE_DECODERS:
+                    decode = _TYPE_DECODERS[ancestor]
+                    break
+        if slot.multivalued:
+            decode = _multivalued_decoder(decode, list_delimiter)
+        decoders[slot.name] = decode
+    return decoders
+
+
 class _DelimitedFileLoader(Loader, ABC):
     """Base class for TSV and CSV loaders"""
 
@@ -27,18 +119,42 @@ class _DelimitedFileLoader(Loader, ABC):
     def delimiter(self):
         pass
 
-    def __init__(self, source, *, skip_empty_rows: bool = False, index_slot_name: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        source,
+        *,
+        skip_empty_rows: bool = False,
+        index_slot_name: Optional[str] = None,
+        schema_view: Optional[SchemaView] = None,
+        target_class: Optional[str] = None,
+        list_delimiter: str = "|",
+    ) -> None:
         super().__init__(source)
         self.skip_empty_rows = skip_empty_rows
         self.index_slot_name = index_slot_name
+        self.schema_view = schema_view
+        self.target_class = target_class
+        self.list_delimiter = list_delimiter
+
+    def _column_decoders(self) -> Optional[Dict[str, Callable[[str], Any]]]:
+        if self.schema_view is None:
+            return None
+        class_name = self.target_class or infer_root_class(self.schema_view)
+        if self.index_slot_name is not None:
+            class_name = self.schema_view.induced_slot(self.index_slot_name, class_name).range
+        return compile_column_decoders(self.schema_view, class_name, list_delimiter=self.list_delimiter)
 
     def _rows(self) -> Iterator[dict]:
-        with open(self.source) as file:
+        decoders = self._column_decoders()
+        with open_source(self.source) as file:
             reader: csv.DictReader = csv.DictReader(file, delimiter=self.delimiter, skipinitialspace=True)
             for row in reader:
                 if self.skip_empty_rows and not any(row.values()):
                     continue
-                yield {k: _parse_numeric(v) for k, v in row.items() if k is not None and v != ""}
+                if decoders is None:
+                    yield {k: _parse_numeric(v) for k, v in row.items() if k is not None and v != ""}
+                else:
+                    yield {k: decoders.get(k, _identity)(v) for k, v in row.items() if k is not None and v != ""}
 
     def iter_instances(self) -> Iterator[dict]:
         if self.index_slot_name is not None:
@@ -50,11 +166,27 @@ class _DelimitedFileLoader(Loader, ABC):
 class CsvLoader(_DelimitedFileLoader):
     """A loader for instances serialized as CSV
 
+    Sources compressed with gzip, bzip2 or xz are decompressed on the fly.
+
+    By default, any value that looks like a number is converted to an ``int`` or ``float``. If
+    ``schema_view`` is provided, values are instead decoded according to the range of the slot
+    that each column corresponds to, using decoders compiled once per file (see
+    :func:`compile_column_decoders`). Columns that do not correspond to a slot are left as
+    strings.
+
     :param skip_empty_rows: If ``True``, skip empty rows instead of yielding empty dicts. Defaults
         to ``False``.
     :param index_slot_name: If provided, ``iter_instances`` will yield one dict where all rows of
         the CSV file are collected into a list with ``index_slot_name`` as the key. If ``None``,
         ``iter_instances`` will yield each row as a dict individually. Defaults to ``None``.
+    :param schema_view: If provided, decode values according to the slots of ``target_class``
+        in this schema. Defaults to ``None``.
+    :param target_class: Name of the class that rows instantiate. If ``index_slot_name`` is
+        provided, this is instead the class that has the index slot, and rows instantiate the
+        range of that slot. If ``None``, the class will be inferred from the schema by looking
+        for a class with ``tree_root: true``. Only used with ``schema_view``. Defaults to ``None``.
+    :param list_delimiter: Delimiter between values of multivalued slots. Only used with
+        ``schema_view``. Defaults to ``|``.
     """
 
     @property
@@ -65,11 +197,27 @@ class CsvLoader(_DelimitedFileLoader):
 class TsvLoader(_DelimitedFileLoader):
     """A loader for instances serialized as TSV
 
+    Sources compressed with gzip, bzip2 or xz are decompressed on the fly.
+
+    By default, any value that looks like a number is converted to an ``int`` or ``float``. If
+    ``schema_view`` is provided, values are instead decoded according to the range of the slot
+    that each column corresponds to, using decoders compiled once per file (see
+    :func:`compile_column_decoders`). Columns that do not correspond to a slot are left as
+    strings.
+
     :param skip_empty_rows: If ``True``, skip empty rows instead of yielding empty dicts. Defaults
         to ``False``.
     :param index_slot_name: If provided, ``iter_instances`` will yield one dict where all rows of
         the TSV file are collected into a list with ``index_slot_name`` as the key. If ``None``,
         ``iter_instances`` will yield each row as a dict individually. Defaults to ``None``.
+    :param schema_view: If provided, decode values according to the slots of ``target_class``
+        in this schema. Defaults to ``None``.
+    :param target_class: Name of the class that rows instantiate. If ``index_slot_name`` is
+        provided, this is instead the class that has the index slot, and rows instantiate the
+        range of that slot. If ``None``, the class will be inferred from the schema by looking
+        for a class with ``tree_root: true``. Only used with ``schema_view``. Defaults to ``None``.
+    :param list_delimiter: Delimiter between values of multivalued slots. Only used with
+        ``schema_view``. Defaults to ``|``.
     """
 
     @property
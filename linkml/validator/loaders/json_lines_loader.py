@@ -0,0 +1,120 @@
+import json
+import mmap
+import os
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Tuple, Union
+
+from linkml.validator.loaders.compression import detect_compression, open_source
+from linkml.validator.loaders.loader import Loader
+
+
+class JsonLinesLoader(Loader):
+    """A loader for instances serialized as JSON Lines (also known as NDJSON)
+
+    Each non-blank line of the source is decoded as one instance. The file is memory-mapped and
+    lines are only decoded as they are requested. The index reported for each instance is its
+    zero-based line number in the file, so blank lines are accounted for.
+
+    Sources compressed with gzip, bzip2 or xz are decompressed on the fly. Such sources cannot
+    be memory-mapped, so they are read line by line instead and are not :attr:`splittable`.
+
+    :param source: Path to JSON Lines source
+    :param chunk_size: Approximate size in bytes of the ranges produced by
+        :meth:`iter_byte_ranges`. Ranges always end on a line boundary. Defaults to 4 MiB.
+    :param raw: If ``True``, yield the undecoded bytes of each line instead of the decoded
+        instance. This is only useful with plugins which accept raw JSON, such as
+        :class:`linkml.validator.plugins.PydanticValidationPlugin` with ``from_json=True``.
+        Defaults to ``False``.
+    """
+
+    def __init__(self, source, *, chunk_size: int = 1 << 22, raw: bool = False) -> None:
+        super().__init__(source)
+        self.chunk_size = chunk_size
+        self.raw = raw
+        self.compression = detect_compression(source)
+
+    @property
+    def splittable(self) -> bool:
+        """Whether the source can be split into byte ranges with :meth:`iter_byte_ranges`"""
+        return self.compression is None
+
+    def iter_instances(self) -> Iterator[Any]:
+        """Lazily yield instances from JSON Lines source.
+
+        :return: Iterator over data instances
+        :rtype: Iterator[Any]
+        """
+        for _, instance in self.iter_indexed_instances():
+            yield instance
+
+    def iter_indexed_instances(self, byte_range: Optional[Tuple[int, int, int]] = None) -> Iterator[Tuple[int, Any]]:
+        """Lazily yield instances from JSON Lines source along with their line number.
+
+        :param byte_range: If provided, a ``(start, end, first_line)`` tuple as produced by
+            :meth:`iter_byte_ranges`. Only instances on lines within that range are yielded.
+            Otherwise, yield instances from the whole file.
+        :return: Iterator over tuples of zero-based line number and data instance
+        :rtype: Iterator[Tuple[int, Any]]
+        """
+        if self.compression is not None:
+            if byte_range is not None:
+                raise ValueError(f"Compressed source cannot be read by byte range: {self.source}")
+            with open_source(self.source, "rb") as source_file:
+                for line_number, line in enumerate(source_file):
+                    if line.strip():
+                        yield line_number, self._decode(line, line_number)
+            return
+
+        with _open_mapped(self.source) as data:
+            start, end, line_number = byte_range if byte_range is not None else (0, len(data), 0)
+            while start < end:
+                line_end = data.find(b"\n", start, end)
+                if line_end == -1:
+                    line_end = end
+                line = data[start:line_end]
+                if line.strip():
+                    yield line_number, self._decode(line, line_number)
+                start = line_end + 1
+                line_number += 1
+
+    def iter_byte_ranges(self) -> Iterator[Tuple[int, int, int]]:
+        """Split the source into ranges of whole lines
+
+        Each range is a ``(start, end, first_line)`` tuple of byte offsets and the zero-based
+        number of the first line in the range. Ranges can be passed to
+        :meth:`iter_indexed_instances` (for example in another process) to decode only the
+        lines within them.
+
+        :raises ValueError: If the source is not :attr:`splittable`
+        :return: Iterator over byte ranges
+        :rtype: Iterator[Tuple[int, int, int]]
+        """
+        if not self.splittable:
+            raise ValueError(f"Compressed source cannot be split into byte ranges: {self.source}")
+        with _open_mapped(self.source) as data:
+            start, line_number = 0, 0
+            while start < len(data):
+                end = data.find(b"\n", min(start + self.chunk_size, len(data)) - 1)
+                end = len(data) if end == -1 else end + 1
+                yield start, end, line_number
+                line_number += data[start:end].count(b"\n")
+                start = end
+
+    def _decode(self, line: bytes, line_number: int) -> Any:
+        if self.raw:
+            return bytes(line)
+        try:
+            return json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON on line {line_number + 1} of {self.source}: {e}") from e
+
+
+@contextmanager
+def _open_mapped(path) -> Iterator[Union[mmap.mmap, bytes]]:
+    with open(path, "rb") as source_file:
+        # Empty files cannot be memory-mapped
+        if os.fstat(source_file.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
@@ -1,30 +1,208 @@
-from typing import Any, Iterator
+import json
+import re
+from typing import Any, Iterator, List, Optional, TextIO
 
 from linkml_runtime.loaders import json_loader
 
+from linkml.validator.loaders.compression import detect_compression, open_source
 from linkml.validator.loaders.loader import Loader
 
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRUCTURAL = re.compile(r'["\[\]{}]')
+_STRING_END = re.compile(r'["\\]')
+_DELIMITERS = frozenset(" \t\n\r,:]}")
+
 
 class JsonLoader(Loader):
     """A loader for instances serialized as JSON
 
+    Local sources compressed with gzip, bzip2 or xz are decompressed on the fly, also in
+    streaming mode.
+
     :param source: Path or URL to JSON source
+    :param streaming: If ``True``, the JSON source is parsed incrementally and elements of the
+        selected array are yielded one at a time as soon as they have been parsed. Peak memory
+        use is then bounded by the size of the largest element instead of the size of the whole
+        document. Only local files are supported in this mode. Defaults to ``False``.
+    :param json_pointer: A JSON Pointer (e.g. ``/persons``) selecting the value within the
+        document to yield instances from. If ``None``, the root of the document is used.
+        Defaults to ``None``.
     """
 
-    def __init__(self, source) -> None:
+    def __init__(self, source, *, streaming: bool = False, json_pointer: Optional[str] = None) -> None:
         super().__init__(source)
+        self.streaming = streaming
+        self.json_pointer = json_pointer
 
     def iter_instances(self) -> Iterator[Any]:
         """Lazily yield instance from JSON source.
 
-        If the root of the JSON is an array, yield each element of the array. Otherwise,
-        yield the root element itself.
+        If the selected value (by default the root of the JSON) is an array, yield each element
+        of the array. Otherwise, yield the value itself.
 
         :return: Iterator over data instances
         :rtype: Iterator[Any]
         """
-        data = json_loader.load_as_dict(self.source)
+        if self.streaming:
+            with open_source(self.source) as source_file:
+                yield from _JsonStreamReader(source_file).iter_values(_parse_json_pointer(self.json_pointer))
+            return
+
+        if detect_compression(self.source) is not None:
+            with open_source(self.source) as source_file:
+                data = json_loader.json_clean(json.load(source_file))
+        else:
+            data = json_loader.load_as_dict(self.source)
+        for token in _parse_json_pointer(self.json_pointer):
+            if isinstance(data, list):
+                data = data[int(token)]
+            else:
+                data = data[token]
         if isinstance(data, list):
             yield from data
         else:
             yield data
+
+
+def _parse_json_pointer(json_pointer: Optional[str]) -> List[str]:
+    if not json_pointer:
+        return []
+    if not json_pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer: {json_pointer}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in json_pointer[1:].split("/")]
+
+
+class _JsonStreamReader:
+    """Incrementally parse a JSON document from a text stream
+
+    Only the part of the document that is currently being parsed is kept in memory. Values
+    that are skipped over while navigating to the selected array are scanned without being
+    decoded.
+    """
+
+    def __init__(self, file: TextIO, block_size: int = 1 << 16) -> None:
+        self._file = file
+        self._block_size = block_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._offset = 0
+        self._eof = False
+
+    def iter_values(self, pointer: List[str]) -> Iterator[Any]:
+        for token in pointer:
+            self._enter(token)
+        if self._peek() == "[":
+            self._pos += 1
+            if self._peek() == "]":
+                return
+            while True:
+                yield json_loader.json_clean(self._read_value())
+                char = self._peek()
+                self._pos += 1
+                if char == "]":
+                    return
+                if char != ",":
+                    self._error("Expected ',' or ']'")
+        else:
+            yield json_loader.json_clean(self._read_value())
+
+    def _enter(self, token: str) -> None:
+        char = self._peek()
+        self._pos += 1
+        if char == "{":
+            if self._peek() != "}":
+                while True:
+                    key = self._read_value()
+                    if self._peek() != ":":
+                        self._error("Expected ':'")
+                    self._pos += 1
+                    if key == token:
+                        return
+                    self._skip_value()
+                    if self._peek() != ",":
+                        break
+                    self._pos += 1
+        elif char == "[" and token.isdigit():
+            index = int(token)
+            if self._peek() != "]":
+                for _ in range(index):
+                    self._skip_value()
+                    if self._peek() != ",":
+                        break
+                    self._pos += 1
+                else:
+                    return
+        raise ValueError(f"JSON pointer token '{token}' not found")
+
+    def _fill(self, size: int) -> bool:
+        if self._eof:
+            return False
+        chunk = self._file.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._offset += self._pos
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill(self._block_size):
+                return ""
+
+    def _read_value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A number at the end of the buffer (e.g. "1." or "1e") may continue in the next block
+                if self._eof or (end < len(self._buffer) and self._buffer[end] in _DELIMITERS):
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            # Grow the buffer geometrically so that large values are not re-decoded too often
+            self._fill(max(self._block_size, len(self._buffer) - self._pos))
+
+    def _skip_value(self) -> None:
+        if self._peek() not in ("[", "{"):
+            self._read_value()
+            return
+        depth = 0
+        pattern = _STRUCTURAL
+        while True:
+            match = pattern.search(self._buffer, self._pos)
+            if match is None:
+                self._pos = len(self._buffer)
+                if not self._fill(self._block_size):
+                    self._error("Unexpected end of document")
+                continue
+            char = match.group()
+            self._pos = match.end()
+            if pattern is _STRING_END:
+                if char == '"':
+                    pattern = _STRUCTURAL
+                elif self._pos == len(self._buffer):
+                    # Keep the backslash so that the escaped character is skipped after refilling
+                    self._pos -= 1
+                    if not self._fill(self._block_size):
+                        self._error("Unexpected end of document")
+                else:
+                    self._pos += 1
+            elif char == '"':
+                pattern = _STRING_END
+            elif char in "[{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def _error(self, message: str) -> None:
+        raise ValueError(f"{message} at character {self._offset + self._pos} of JSON document")
@@ -1,11 +1,15 @@
+import asyncio
+import itertools
 from abc import ABC, abstractmethod
-from typing import Any, Iterator
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Iterator, Optional, Tuple
 
 
 class Loader(ABC):
     """Abstract base class for instance data loaders.
 
-    Subclasses must implement the iter_instances method.
+    Subclasses must implement the iter_instances method. Subclasses which can read their source
+    without blocking an asyncio event loop may also override the aiter_indexed_instances method.
 
     :param source: Path or URL to load instances from
     """
@@ -21,3 +25,36 @@ class Loader(ABC):
         :rtype: Iterator[Any]
         """
         pass
+
+    def iter_indexed_instances(self) -> Iterator[Tuple[int, Any]]:
+        """Lazily load data instances from the source along with their index
+
+        The index is reported as the ``instance_index`` of validation results. By default,
+        instances are numbered consecutively starting from zero. Subclasses may override this
+        method to report a more meaningful position within the source, such as a line number.
+
+        :return: Iterator over tuples of index and data instance
+        :rtype: Iterator[Tuple[int, Any]]
+        """
+        return enumerate(self.iter_instances())
+
+    async def aiter_indexed_instances(
+        self, executor: Optional[Executor] = None, chunk_size: int = 100
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """Asynchronously load data instances from the source along with their index
+
+        By default, ``iter_indexed_instances`` is run in an executor so that reading the source
+        does not block the event loop. Instances are read ``chunk_size`` at a time to limit the
+        number of hand-offs between the event loop and the executor.
+
+        :param executor: The executor to read the source in. If ``None``, the default executor
+            of the event loop is used. Defaults to ``None``.
+        :param chunk_size: Number of instances read at a time. Defaults to ``100``.
+        :return: Asynchronous iterator over tuples of index and data instance
+        :rtype: AsyncIterator[Tuple[int, Any]]
+        """
+        loop = asyncio.get_running_loop()
+        iterator = iter(self.iter_indexed_instances())
+        while chunk := await loop.run_in_executor(executor, list, itertools.islice(iterator, chunk_size)):
+            for item in chunk:
+                yield item
@@ -0,0 +1,266 @@
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from linkml_runtime import SchemaView
+from linkml_runtime.linkml_model import SchemaDefinition
+
+from linkml.utils.datautils import infer_root_class
+from linkml.validator.loaders.compression import open_source
+from linkml.validator.loaders.loader import Loader
+
+_RDF_TYPE = "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"
+_XSD = "http://www.w3.org/2001/XMLSchema#"
+
+# Kinds of terms which are not literals. The kind of a literal is its datatype IRI, or None
+_IRI = "iri"
+_BLANK_NODE = "blank node"
+
+_TERM = re.compile(
+    r'\s*(?:<([^>]*)>|_:([\w-]+(?:\.[\w-]+)*)|"((?:[^"\\]|\\.)*)"(?:@[A-Za-z]+(?:-[A-Za-z0-9]+)*|\^\^<([^>]*)>)?)'
+)
+_END = re.compile(r"\s*\.\s*(?:#.*)?$")
+_ESCAPE = re.compile(r"\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))")
+_ESCAPED_CHARACTERS = {"t": "\t", "b": "\b", "n": "\n", "r": "\r", "f": "\f", '"': '"', "'": "'", "\\": "\\"}
+
+_INTEGER_DATATYPES = {
+    _XSD + name
+    for name in (
+        "integer",
+        "int",
+        "long",
+        "short",
+        "byte",
+        "nonNegativeInteger",
+        "nonPositiveInteger",
+        "positiveInteger",
+        "negativeInteger",
+        "unsignedInt",
+        "unsignedLong",
+        "unsignedShort",
+        "unsignedByte",
+    )
+}
+_FLOAT_DATATYPES = {_XSD + "decimal", _XSD + "double", _XSD + "float"}
+_BOOLEAN_DATATYPE = _XSD + "boolean"
+
+Term = Tuple[str, Optional[str]]
+
+
+def _unescape(value: str) -> str:
+    if "\\" not in value:
+        return value
+
+    def replace(match: re.Match) -> str:
+        code = match.group(1) or match.group(2)
+        return chr(int(code, 16)) if code else _ESCAPED_CHARACTERS.get(match.group(3), match.group(0))
+
+    return _ESCAPE.sub(replace, value)
+
+
+def _parse_line(line: str, line_number: int, source) -> Optional[List[Term]]:
+    """Parse the terms of a line of N-Triples or N-Quads
+
+    :return: The subject, predicate, object and, for N-Quads, graph as ``(value, kind)`` tuples,
+        or ``None`` for blank lines and comments
+    """
+    stripped = line.strip()
+    if not stripped or stripped.startswith("#"):
+        return None
+    terms = []
+    position = 0
+    while len(terms) < 4:
+        match = _TERM.match(line, position)
+        if match is None:
+            break
+        iri, blank_node, literal, datatype = match.groups()
+        if iri is not None:
+            terms.append((_unescape(iri), _IRI))
+        elif blank_node is not None:
+            terms.append(("_:" + blank_node, _BLANK_NODE))
+        else:
+            terms.append((_unescape(literal), datatype and _unescape(datatype)))
+        position = match.end()
+    if len(terms) < 3 or terms[1][1] != _IRI or _END.match(line, position) is None:
+        raise ValueError(f"Invalid N-Triples statement on line {line_number + 1} of {source}: {stripped}")
+    return terms
+
+
+class NTriplesLoader(Loader):
+    """A loader for instances serialized as RDF in N-Triples or N-Quads
+
+    The source is read line by line and consecutive triples with the same subject are grouped
+    into one instance, so the source must be sorted or grouped by subject. Only the triples of
+    one subject are held in memory at a time. The graph of N-Quads is ignored.
+
+    A subject is an instance if one of its ``rdf:type`` values is the class URI of the target
+    class or of one of its descendants. Objects of triples whose predicate is the slot URI of a
+    slot of that class become the values of that slot, and the subject becomes the value of
+    its identifier slot. IRIs are compacted to CURIEs using the prefixes of the schema, and
+    typed literals are converted to numbers and booleans. Objects which are not instances
+    themselves, such as inlined objects, are not merged into the instances which refer to them;
+    their CURIE or blank node label is used instead. Triples with a predicate which is not the
+    slot URI of a slot are kept under the CURIE of the predicate. The index reported for each
+    instance is the zero-based number of the line of its first triple.
+
+    Sources compressed with gzip, bzip2 or xz are decompressed on the fly.
+
+    :param source: Path to N-Triples or N-Quads source
+    :param schema: Schema which the data instantiates, as a path, ``SchemaDefinition`` or
+        ``SchemaView``
+    :param target_class: Name of the class of the instances to load. If ``None``, the class will
+        be inferred from the schema by looking for a class with ``tree_root: true``. Defaults to
+        ``None``.
+    """
+
+    def __init__(
+        self,
+        source,
+        schema: Union[str, Path, SchemaDefinition, SchemaView],
+        target_class: Optional[str] = None,
+    ) -> None:
+        super().__init__(source)
+        self.schema_view = schema if isinstance(schema, SchemaView) else SchemaView(schema)
+        self.target_class = target_class
+        self._prefixes: Optional[List[Tuple[str, str]]] = None
+        self._slot_maps: Dict[str, Dict[str, Tuple[str, bool, Optional[str]]]] = {}
+
+    def iter_instances(self) -> Iterator[Dict[str, Any]]:
+        """Lazily yield instances from N-Triples source.
+
+        :return: Iterator over data instances
+        :rtype: Iterator[Dict[str, Any]]
+        """
+        for _, instance in self.iter_indexed_instances():
+            yield instance
+
+    def iter_indexed_instances(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Lazily yield instances from N-Triples source along with the line number of their first triple.
+
+        :return: Iterator over tuples of zero-based line number and data instance
+        :rtype: Iterator[Tuple[int, Dict[str, Any]]]
+        """
+        class_uris = self._class_uris()
+        subject, first_line, statements = None, 0, []
+        with open_source(self.source, "rt", encoding="utf-8") as source_file:
+            for line_number, line in enumerate(source_file):
+                terms = _parse_line(line, line_number, self.source)
+                if terms is None:
+                    continue
+                if terms[0] != subject:
+                    if statements:
+                        instance = self._instance(subject, statements, class_uris)
+                        if instance is not None:
+                            yield first_line, instance
+                    subject, first_line, statements = terms[0], line_number, []
+                statements.append((terms[1][0], terms[2]))
+        if statements:
+            instance = self._instance(subject, statements, class_uris)
+            if instance is not None:
+                yield first_line, instance
+
+    def _class_uris(self) -> Dict[str, Tuple[int, str]]:
+        """Map the class URIs of the target class and its descendants to their depth and name"""
+        view = self.schema_view
+        target_class = self.target_class or infer_root_class(view)
+        class_uris = {}
+        for class_name in view.class_descendants(target_class, reflexive=True):
+            depth = len(view.class_ancestors(class_name))
+            uri = view.get_uri(class_name, expand=True)
+            # The most specific class wins if classes share a URI
+            class_uris[uri] = max(class_uris.get(uri, (depth, class_name)), (depth, class_name))
+        return class_uris
+
+    def _slot_map(self, class_name: str) -> Dict[str, Tuple[str, bool, Optional[str]]]:
+        """Map slot URIs to the key, whether it is multivalued, and the base type of the slots of a class"""
+        if class_name not in self._slot_maps:
+            view = self.schema_view
+            slot_map = {}
+            for slot in view.class_induced_slots(class_name):
+                key = slot.alias or slot.name
+                if slot.identifier:
+                    slot_map[None] = (key, False, None)
+                    continue
+                base = None
+                range_name = slot.range
+                types = view.all_types()
+                while range_name in types:
+                    base = types[range_name].base
+                    if base is not None:
+                        break
+                    range_name = types[range_name].typeof
+                slot_map[view.get_uri(slot, expand=True)] = (key, bool(slot.multivalued), base)
+            self._slot_maps[class_name] = slot_map
+        return self._slot_maps[class_name]
+
+    def _instance(
+        self, subject: Term, statements: List[Tuple[str, Term]], class_uris: Dict[str, Tuple[int, str]]
+    ) -> Optional[Dict[str, Any]]:
+        # Of the classes of the subject, pick the most specific one
+        classes = [
+            class_uris[value]
+            for predicate, (value, kind) in statements
+            if predicate == _RDF_TYPE and kind == _IRI and value in class_uris
+        ]
+        if not classes:
+            return None
+        class_name = max(classes)[1]
+        slot_map = self._slot_map(class_name)
+        instance = {}
+        if None in slot_map:
+            instance[slot_map[None][0]] = self._compact(subject[0]) if subject[1] == _IRI else subject[0]
+        for predicate, term in statements:
+            mapping = slot_map.get(predicate)
+            if mapping is None:
+                if predicate == _RDF_TYPE:
+                    continue
+                key, multivalued, base = self._compact(predicate), False, None
+            else:
+                key, multivalued, base = mapping
+            if predicate == _RDF_TYPE and base not in ("URI", "URIorCURIE"):
+                # A type designator slot with a string range holds the name of the class
+                value = class_uris[term[0]][1] if term[0] in class_uris else self._convert(term, base)
+            else:
+                value = self._convert(term, base)
+            if key not in instance:
+                instance[key] = [value] if multivalued else value
+            elif isinstance(instance[key], list):
+                instance[key].append(value)
+            else:
+                # More than one value for a single-valued slot
+                instance[key] = [instance[key], value]
+        return instance
+
+    def _convert(self, term: Term, base: Optional[str]) -> Any:
+        value, kind = term
+        if kind == _IRI:
+            return value if base == "URI" else self._compact(value)
+        if kind == _BLANK_NODE:
+            return value
+        if kind is None or kind == _XSD + "string":
+            # Untyped literals are converted according to the range of the slot
+            kind = {"int": _XSD + "integer", "float": _XSD + "double", "Bool": _BOOLEAN_DATATYPE}.get(base)
+        try:
+            if kind in _INTEGER_DATATYPES:
+                return int(value)
+            if kind in _FLOAT_DATATYPES:
+                return float(value)
+        except ValueError:
+            return value
+        if kind == _BOOLEAN_DATATYPE and value in ("true", "false", "1", "0"):
+            return value in ("true", "1")
+        return value
+
+    def _compact(self, iri: str) -> str:
+        """Compact an IRI to a CURIE with the longest matching prefix of the schema"""
+        if self._prefixes is None:
+            namespaces = self.schema_view.namespaces()
+            self._prefixes = sorted(
+                ((prefix, str(namespaces[prefix])) for prefix in namespaces if not prefix.startswith("@")),
+                key=lambda item: len(item[1]),
+                reverse=True,
+            )
+        for prefix, expansion in self._prefixes:
+            if iri.startswith(expansion) and len(iri) > len(expansion):
+                return f"{prefix}:{iri[len(expansion):]}"
+        return iri
@@ -0,0 +1,260 @@
+import sqlite3
+from collections import defaultdict
+from copy import deepcopy
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from linkml_runtime import SchemaView
+from linkml_runtime.linkml_model import SchemaDefinition
+
+from linkml.transformers.relmodel_transformer import (
+    ManyToManyMapping,
+    MultivaluedScalar,
+    OneToAnyMapping,
+    RelationalModelTransformer,
+)
+from linkml.utils.datautils import infer_root_class
+from linkml.validator.loaders.loader import Loader
+
+# Number of values bound to the parameters of one ``IN (...)`` clause, well below the limit of
+# older SQLite versions
+_IN_CLAUSE_SIZE = 500
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+@dataclass
+class _Collection:
+    """How the values of a multivalued slot are stored"""
+
+    #: Key of the slot in the reassembled object
+    key: str
+    #: Table which holds one row per value
+    table: str
+    #: Column of ``table`` which refers to the primary key of the owning object
+    parent_column: str
+    #: Column of ``table`` which holds the value, or ``None`` if each row is an inlined object
+    value_column: Optional[str] = None
+    #: If set, the values are objects of this class whose primary keys are in ``value_column``
+    value_class: Optional[str] = None
+    #: If set, objects are collected into a dictionary keyed by this slot instead of a list
+    dict_key: Optional[str] = None
+    is_boolean: bool = False
+
+
+@dataclass
+class _TablePlan:
+    """How an object of a class is reassembled from the rows of the tables of the relational model"""
+
+    table: str
+    #: Primary key column, which dependent rows refer to
+    primary_key: Optional[str]
+    #: Columns which hold the value of a slot of the same name
+    columns: List[str] = field(default_factory=list)
+    boolean_columns: Set[str] = field(default_factory=set)
+    #: Columns which hold the primary key of a single inlined object, with the key of the slot and
+    #: the class of the object
+    nested: List[Tuple[str, str, str]] = field(default_factory=list)
+    collections: List[_Collection] = field(default_factory=list)
+
+
+class SqliteLoader(Loader):
+    """A loader for instances stored in a SQLite database created by ``linkml-sqldb``
+
+    The database must have the layout which :class:`linkml.utils.sqlutils.SQLStore` creates from
+    the schema. Each row of the table of the target class is reassembled into one instance, as
+    a plain dictionary: inlined objects and multivalued slots are read back from the tables which
+    hold them, and surrogate primary keys and foreign keys are left out.
+
+    Rows of the target class are read ``batch_size`` at a time. For each batch, the rows of each
+    dependent table are read with one query per table, rather than one per instance, so the
+    number of queries does not grow with the number of instances.
+
+    :param source: Path to SQLite database
+    :param schema: Schema which the database was created from, as a path, ``SchemaDefinition``
+        or ``SchemaView``
+    :param target_class: Name of the class whose rows are loaded. If ``None``, the class will be
+        inferred from the schema by looking for a class with ``tree_root: true``. Defaults to
+        ``None``.
+    :param batch_size: Number of rows of the target class read at a time. Defaults to ``1000``.
+    """
+
+    def __init__(
+        self,
+        source,
+        schema: Union[str, Path, SchemaDefinition, SchemaView],
+        target_class: Optional[str] = None,
+        *,
+        batch_size: int = 1000,
+    ) -> None:
+        super().__init__(source)
+        self.schema_view = schema if isinstance(schema, SchemaView) else SchemaView(schema)
+        self.target_class = target_class
+        self.batch_size = batch_size
+        self._plans: Optional[Dict[str, _TablePlan]] = None
+
+    def iter_instances(self) -> Iterator[Dict[str, Any]]:
+        """Lazily yield instances from the table of the target class
+
+        :return: Iterator over data instances
+        :rtype: Iterator[Dict[str, Any]]
+        """
+        class_name = self.target_class or infer_root_class(self.schema_view)
+        plans = self._table_plans()
+        if class_name not in plans:
+            raise ValueError(f"No table for class {class_name} in {self.source}")
+        uri = Path(self.source).resolve().as_uri() + "?mode=ro"
+        # Instances may be consumed from different threads, but never concurrently
+        connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        try:
+            cursor = connection.execute(f"SELECT * FROM {_quote(plans[class_name].table)} ORDER BY rowid")
+            while True:
+                rows = cursor.fetchmany(self.batch_size)
+                if not rows:
+                    break
+                yield from self._assemble(connection, class_name, rows)
+        finally:
+            connection.close()
+
+    def _table_plans(self) -> Dict[str, _TablePlan]:
+        """Work out the relational model of the schema, like ``SQLStore`` does when creating the database"""
+        if self._plans is not None:
+            return self._plans
+        source_view = self.schema_view
+        # The transformer merges imports into the schema it is given
+        result = RelationalModelTransformer(SchemaView(deepcopy(source_view.schema))).transform()
+        relational_view = SchemaView(result.schema)
+        plans = {}
+        for class_name, cls in result.schema.classes.items():
+            if not cls.attributes:
+                continue
+            primary_key = RelationalModelTransformer.get_direct_identifier_attribute(relational_view, class_name)
+            plan = _TablePlan(class_name, primary_key.name if primary_key is not None else None)
+            for attribute in cls.attributes.values():
+                if "backref" in attribute.annotations or "autoincrement" in attribute.annotations:
+                    continue
+                if "original_slot" in attribute.annotations:
+                    original_slot = attribute.annotations["original_slot"].value
+                    plan.nested.append((attribute.name, original_slot, attribute.range))
+                    continue
+                plan.columns.append(attribute.name)
+                if self._is_boolean(attribute.range):
+                    plan.boolean_columns.add(attribute.name)
+            plans[class_name] = plan
+
+        for mapping in result.mappings:
+            plan = plans.get(mapping.source_class)
+            if plan is None:
+                continue
+            slot = self._source_slot(mapping.source_class, mapping.source_slot)
+            range_identifier = None
+            if slot is not None and slot.range in source_view.all_classes():
+                range_identifier = source_view.get_identifier_slot(slot.range)
+            if isinstance(mapping, OneToAnyMapping):
+                dict_key = None
+                if range_identifier is not None and not slot.inlined_as_list:
+                    dict_key = range_identifier.alias or range_identifier.name
+                collection = _Collection(
+                    mapping.source_slot, mapping.target_class, mapping.target_slot, dict_key=dict_key
+                )
+            else:
+                join_class = result.schema.classes[mapping.join_class]
+                parent_column = next(a.name for a in join_class.attributes.values() if "backref" in a.annotations)
+                if isinstance(mapping, MultivaluedScalar):
+                    value_column = mapping.target_slot
+                else:
+                    value_column = next(
+                        a.name for a in join_class.attributes.values() if "backref" not in a.annotations
+                    )
+                collection = _Collection(mapping.source_slot, mapping.join_class, parent_column, value_column)
+                if isinstance(mapping, ManyToManyMapping) and (range_identifier is None or slot.inlined):
+                    # The join table refers to objects which are inlined into the owning object
+                    collection.value_class = mapping.target_class
+                if isinstance(mapping, MultivaluedScalar) and slot is not None:
+                    collection.is_boolean = self._is_boolean(slot.range)
+            plan.collections.append(collection)
+        self._plans = plans
+        return plans
+
+    def _source_slot(self, class_name: str, slot_name: str):
+        for slot in self.schema_view.class_induced_slots(class_name):
+            if (slot.alias or slot.name) == slot_name:
+                return slot
+        return None
+
+    def _is_boolean(self, range_name: Optional[str]) -> bool:
+        # SQLite stores booleans as integers
+        types = self.schema_view.all_types()
+        while range_name in types:
+            type_definition = types[range_name]
+            if type_definition.base == "Bool":
+                return True
+            range_name = type_definition.typeof
+        return False
+
+    @staticmethod
+    def _select_in(connection: sqlite3.Connection, table: str, column: str, values: Sequence) -> Iterator[sqlite3.Row]:
+        """Yield the rows of a table whose value of a column is one of the given values"""
+        values = list(dict.fromkeys(v for v in values if v is not None))
+        for start in range(0, len(values), _IN_CLAUSE_SIZE):
+            chunk = values[start : start + _IN_CLAUSE_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            yield from connection.execute(
+                f"SELECT * FROM {_quote(table)} WHERE {_quote(column)} IN ({placeholders}) ORDER BY rowid", chunk
+            )
+
+    def _fetch_by_key(self, connection: sqlite3.Connection, class_name: str, keys: Sequence) -> Dict[Any, dict]:
+        """Reassemble the objects of a class with the given primary keys"""
+        plan = self._plans[class_name]
+        rows = list(self._select_in(connection, plan.table, plan.primary_key, keys))
+        return dict(zip((row[plan.primary_key] for row in rows), self._assemble(connection, class_name, rows)))
+
+    def _assemble(self, connection: sqlite3.Connection, class_name: str, rows: List[sqlite3.Row]) -> List[dict]:
+        """Reassemble objects of a class from rows of its table"""
+        plan = self._plans[class_name]
+        objects = []
+        for row in rows:
+            obj = {}
+            for column in plan.columns:
+                value = row[column]
+                if value is not None:
+                    obj[column] = bool(value) if column in plan.boolean_columns else value
+            objects.append(obj)
+
+        for column, key, range_class in plan.nested:
+            nested = self._fetch_by_key(connection, range_class, [row[column] for row in rows])
+            for row, obj in zip(rows, objects):
+                if row[column] in nested:
+                    obj[key] = nested[row[column]]
+
+        if not plan.collections:
+            return objects
+        parent_keys = [row[plan.primary_key] for row in rows]
+        for collection in plan.collections:
+            values_by_parent = defaultdict(list)
+            child_rows = list(self._select_in(connection, collection.table, collection.parent_column, parent_keys))
+            if collection.value_column is None:
+                values = self._assemble(connection, collection.table, child_rows)
+            else:
+                values = [row[collection.value_column] for row in child_rows]
+                if collection.value_class is not None:
+                    children = self._fetch_by_key(connection, collection.value_class, values)
+                    values = [children.get(value) for value in values]
+                elif collection.is_boolean:
+                    values = [bool(value) if value is not None else value for value in values]
+            for row, value in zip(child_rows, values):
+                if value is not None:
+                    values_by_parent[row[collection.parent_column]].append(value)
+            for parent_key, obj in zip(parent_keys, objects):
+                values = values_by_parent.get(parent_key)
+                if not values:
+                    continue
+                if collection.dict_key is not None and all(collection.dict_key in value for value in values):
+                    obj[collection.key] = {value[collection.dict_key]: value for value in values}
+                else:
+                    obj[collection.key] = values
+        return objects
@@ -1,18 +1,26 @@
 from typing import Any, Iterator
 
-import yaml
-
+from linkml.utils.yaml_utils import iter_safe_load_items, safe_load_all
+from linkml.validator.loaders.compression import open_source
 from linkml.validator.loaders.loader import Loader
 
 
 class YamlLoader(Loader):
     """A loader for instances serialized as YAML
 
+    Sources compressed with gzip, bzip2 or xz are decompressed on the fly. The libyaml parser
+    is used if PyYAML was built with it.
+
     :param source: Path to YAML source
+    :param streaming: If ``True``, the elements of an array at the root of a document are
+        yielded as soon as each of them has been parsed, so that only one element at a time is
+        held in memory. If ``False``, each document is loaded completely first. Defaults to
+        ``True``.
     """
 
-    def __init__(self, source) -> None:
+    def __init__(self, source, *, streaming: bool = True) -> None:
         super().__init__(source)
+        self.streaming = streaming
 
     def iter_instances(self) -> Iterator[Any]:
         """Lazily yield instances from YAML source.
@@ -23,8 +31,11 @@ class YamlLoader(Loader):
         :return: Iterator over data instances
         :rtype: Iterator[Any]
         """
-        with open(self.source) as source_file:
-            for document in yaml.safe_load_all(source_file):
+        with open_source(self.source) as source_file:
+            if self.streaming:
+                yield from iter_safe_load_items(source_file)
+                return
+            for document in safe_load_all(source_file):
                 if isinstance(document, list):
                     yield from document
                 else:
@@ -4,9 +4,20 @@ on data instances. Instances of these classes should be provided when constructi
 :class:`linkml.validator.Validator` instance.
 """
 
+from linkml.validator.plugins.compiled_validation_plugin import CompiledValidationPlugin
 from linkml.validator.plugins.jsonschema_validation_plugin import JsonschemaValidationPlugin
 from linkml.validator.plugins.pydantic_validation_plugin import PydanticValidationPlugin
 from linkml.validator.plugins.recommended_slots_plugin import RecommendedSlotsPlugin
+from linkml.validator.plugins.referential_integrity_plugin import ReferentialIntegrityPlugin
+from linkml.validator.plugins.uniqueness_plugin import UniquenessPlugin
 from linkml.validator.plugins.validation_plugin import ValidationPlugin
 
-__all__ = ["JsonschemaValidationPlugin", "PydanticValidationPlugin", "RecommendedSlotsPlugin", "ValidationPlugin"]
+__all__ = [
+    "CompiledValidationPlugin",
+    "JsonschemaValidationPlugin",
+    "PydanticValidationPlugin",
+    "RecommendedSlotsPlugin",
+    "ReferentialIntegrityPlugin",
+    "UniquenessPlugin",
+    "ValidationPlugin",
+]
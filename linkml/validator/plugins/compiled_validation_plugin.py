@@ -0,0 +1,79 @@
+from typing import Any, Iterator, List, Optional, Tuple
+
+from linkml.validator.plugins.validation_plugin import ValidationPlugin
+from linkml.validator.report import Severity, ValidationResult
+from linkml.validator.validation_context import ValidationContext
+
+
+class CompiledValidationPlugin(ValidationPlugin):
+    """A validation plugin which validates instances using checks compiled from the schema.
+
+    Instead of generating JSON Schema and interpreting it with a generic JSON Schema validator,
+    this plugin walks the schema once and builds a Python function per class which checks
+    required slots, ranges (types, enums, inlined and referenced classes), patterns, minimum and
+    maximum values, cardinality, ``equals_*`` constraints, boolean slot expressions and type
+    designators directly against the instance.
+
+    Rules, ``unique_keys`` and array slots are not checked. For these, use
+    :class:`JsonschemaValidationPlugin`.
+
+    :param closed: If ``True``, additional properties are not allowed on instances.
+        Defaults to ``False``.
+    :param batch_size: If set, instances are validated in batches of this many, column by column:
+        the values of each slot are collected from all instances in a batch and each distinct
+        value is checked once (see
+        :meth:`linkml.validator.compiler.SchemaCompiler.compile_columns`). This is much faster
+        for tabular data such as CSV and TSV files. Defaults to ``None`` (validate instances one
+        at a time).
+    """
+
+    def __init__(self, closed: bool = False, batch_size: Optional[int] = None) -> None:
+        self.closed = closed
+        self.batch_size = batch_size
+
+    def warm_up(self, context: ValidationContext) -> None:
+        if self.batch_size is None:
+            context.compiled_validator(closed=self.closed)
+        else:
+            context.compiled_column_validator(closed=self.closed)
+
+    def process(self, instance: Any, context: ValidationContext) -> Iterator[ValidationResult]:
+        """Perform compiled validation on the provided instance
+
+        :param instance: The instance to validate
+        :param context: The validation context which provides the compiled checks
+        :return: Iterator over validation results
+        :rtype: Iterator[ValidationResult]
+        """
+        validate = context.compiled_validator(closed=self.closed)
+        for location, message in validate(instance):
+            yield ValidationResult(
+                type="compiled validation",
+                severity=Severity.ERROR,
+                instance=instance,
+                instantiates=context.target_class,
+                message=f"{message} in {location or '/'}",
+            )
+
+    def process_batch(self, batch: List[Tuple[int, Any]], context: ValidationContext) -> Iterator[ValidationResult]:
+        """Perform compiled validation on a batch of instances, column by column
+
+        :param batch: List of tuples of instance index and instance to validate
+        :param context: The validation context which provides the compiled checks
+        :return: Iterator over validation results
+        :rtype: Iterator[ValidationResult]
+        """
+        if self.batch_size is None:
+            yield from super().process_batch(batch, context)
+            return
+        validate = context.compiled_column_validator(closed=self.closed)
+        for position, location, message in validate([instance for _, instance in batch]):
+            index, instance = batch[position]
+            yield ValidationResult(
+                type="compiled validation",
+                severity=Severity.ERROR,
+                instance=instance,
+                instance_index=index,
+                instantiates=context.target_class,
+                message=f"{message} in {location or '/'}",
+            )
@@ -2,6 +2,7 @@ import os
 from typing import Any, Iterator, Optional
 
 from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
 
 from linkml.validator.plugins.validation_plugin import ValidationPlugin
 from linkml.validator.report import Severity, ValidationResult
@@ -32,6 +33,9 @@ class JsonschemaValidationPlugin(ValidationPlugin):
         self.include_range_class_descendants = include_range_class_descendants
         self.json_schema_path = json_schema_path
 
+    def warm_up(self, context: ValidationContext) -> None:
+        self._json_schema_validator(context)
+
     def process(self, instance: Any, context: ValidationContext) -> Iterator[ValidationResult]:
         """Perform JSON Schema validation on the provided instance
 
@@ -40,11 +44,7 @@ class JsonschemaValidationPlugin(ValidationPlugin):
         :return: Iterator over validation results
         :rtype: Iterator[ValidationResult]
         """
-        validator = context.json_schema_validator(
-            closed=self.closed,
-            include_range_class_descendants=self.include_range_class_descendants,
-            path_override=self.json_schema_path,
-        )
+        validator = self._json_schema_validator(context)
         for error in validator.iter_errors(instance):
             error_context = [ctx.message for ctx in error.context]
             best_error = best_match([error])
@@ -57,3 +57,10 @@ class JsonschemaValidationPlugin(ValidationPlugin):
                 context=error_context,
                 source=best_error,
             )
+
+    def _json_schema_validator(self, context: ValidationContext) -> Validator:
+        return context.json_schema_validator(
+            closed=self.closed,
+            include_range_class_descendants=self.include_range_class_descendants,
+            path_override=self.json_schema_path,
+        )
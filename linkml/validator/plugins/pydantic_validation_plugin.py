@@ -1,4 +1,7 @@
-from typing import Any, Iterator
+import json
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
 
 from linkml.validator.plugins.validation_plugin import ValidationPlugin
 from linkml.validator.report import Severity, ValidationResult
@@ -10,22 +13,43 @@ class PydanticValidationPlugin(ValidationPlugin):
 
     Note that this plugin provides less complete validation than
     :class:`JsonschemaValidationPlugin`.
-    Also, due to the nature of Pydantic, it will fail fast on errors and only report the first
-    error found.
+    Also, due to the nature of Pydantic, when instances are validated one at a time all errors
+    found in an instance are reported together as a single result.
+
+    If ``batch_size`` is set, instances are instead validated in batches through a single
+    ``TypeAdapter`` for a list of the target class, and one result is reported for each error
+    with its location in the instance as a JSON Pointer. Batches of raw JSON with errors are
+    validated again one instance at a time, so that each error is attributed to the right
+    instance. With Pydantic 1, which cannot validate a batch at once, instances are validated one
+    at a time.
 
     For general use cases, JsonschemaValidationPlugin is recommended. However, this plugin
     may be useful in some scenarios:
 
     - You are using in a pipeline to ensure objects will be valid for loading into Pydantic.
     - You are exploring relative capabilities of Pydantic and JSON Schema validation.
-    - Pydantic is faster for your use case (to be tested).
+    - Pydantic is faster for your use case. Batched validation of raw JSON (see ``from_json``)
+      avoids building Python dictionaries for instances entirely.
 
     :param closed: If ``True``, additional properties are not allowed on instances.
         Defaults to ``False``.
+    :param batch_size: If set, the number of instances validated together. Defaults to ``None``.
+    :param from_json: If ``True``, instances are expected to be raw JSON documents (``bytes`` or
+        ``str``), such as those yielded by a :class:`linkml.validator.loaders.JsonLinesLoader`
+        with ``raw=True``, and are validated without decoding them into Python objects first.
+        Only instances with errors are decoded to be included in results. Defaults to ``False``.
     """
 
-    def __init__(self, closed: bool = False) -> None:
+    def __init__(self, closed: bool = False, *, batch_size: Optional[int] = None, from_json: bool = False) -> None:
         self.closed = closed
+        self.batch_size = batch_size
+        self.from_json = from_json
+
+    def warm_up(self, context: ValidationContext) -> None:
+        if self.batch_size is None:
+            context.pydantic_model(closed=self.closed)
+        else:
+            context.pydantic_list_adapter(closed=self.closed)
 
     def process(self, instance: Any, context: ValidationContext) -> Iterator[ValidationResult]:
         """Perform Pydantic validation on the provided instance
@@ -37,12 +61,84 @@ class PydanticValidationPlugin(ValidationPlugin):
         """
         pydantic_model = context.pydantic_model(closed=self.closed)
         try:
-            instance = pydantic_model.model_validate(instance)
+            if self.from_json:
+                pydantic_model.model_validate_json(instance)
+            else:
+                pydantic_model.model_validate(instance)
         except Exception as e:
             yield ValidationResult(
                 type="Pydantic validation",
                 severity=Severity.ERROR,
-                instance=instance,
+                instance=_decode(instance) if self.from_json else instance,
                 instantiates=context.target_class,
                 message=f"{e}",
             )
+
+    def process_batch(self, batch: List[Tuple[int, Any]], context: ValidationContext) -> Iterator[ValidationResult]:
+        """Perform Pydantic validation on a batch of instances
+
+        :param batch: List of tuples of instance index and instance to validate
+        :param context: The validation context which provides a Pydantic artifact
+        :return: Iterator over validation results, one per error
+        :rtype: Iterator[ValidationResult]
+        """
+        adapter = context.pydantic_list_adapter(closed=self.closed)
+        if adapter is None:
+            # Pydantic 1 cannot validate a list of instances at once
+            yield from super().process_batch(batch, context)
+            return
+        try:
+            if self.from_json:
+                validated = adapter.validate_json(b"[" + b",".join(_as_bytes(instance) for _, instance in batch) + b"]")
+            else:
+                validated = adapter.validate_python([instance for _, instance in batch])
+        except ValidationError as e:
+            if self.from_json:
+                # Errors cannot be attributed by position if a raw instance holds more than one JSON
+                # document, such as ``{}, {}``, or is malformed, so find the offending instances
+                yield from self._process_items(batch, context)
+                return
+            for error in e.errors(include_url=False):
+                yield self._result(error, batch[error["loc"][0]], error["loc"][1:], context)
+            return
+        if len(validated) != len(batch):
+            # A raw instance held more than one JSON document
+            yield from self._process_items(batch, context)
+
+    def _process_items(self, batch: List[Tuple[int, Any]], context: ValidationContext) -> Iterator[ValidationResult]:
+        """Validate the instances of a batch one at a time, with one result per error"""
+        pydantic_model = context.pydantic_model(closed=self.closed)
+        for item in batch:
+            try:
+                if self.from_json:
+                    pydantic_model.model_validate_json(item[1])
+                else:
+                    pydantic_model.model_validate(item[1])
+            except ValidationError as e:
+                for error in e.errors(include_url=False):
+                    yield self._result(error, item, error["loc"], context)
+
+    def _result(
+        self, error: dict, item: Tuple[int, Any], location: Tuple[Union[int, str], ...], context: ValidationContext
+    ) -> ValidationResult:
+        index, instance = item
+        pointer = "/".join(str(part).replace("~", "~0").replace("/", "~1") for part in location)
+        return ValidationResult(
+            type="Pydantic validation",
+            severity=Severity.ERROR,
+            instance=_decode(instance) if self.from_json else instance,
+            instance_index=index,
+            instantiates=context.target_class,
+            message=f"{error['msg']} in /{pointer}",
+        )
+
+
+def _as_bytes(instance: Union[bytes, str]) -> bytes:
+    return instance.encode() if isinstance(instance, str) else bytes(instance)
+
+
+def _decode(instance: Union[bytes, str]) -> Any:
+    try:
+        return json.loads(instance)
+    except ValueError:
+        return instance
@@ -1,4 +1,4 @@
-from typing import Iterator, List, Optional
+from typing import Iterator
 
 from linkml.validator.plugins.validation_plugin import ValidationPlugin
 from linkml.validator.report import Severity, ValidationResult
@@ -6,38 +6,42 @@ from linkml.validator.validation_context import ValidationContext
 
 
 class RecommendedSlotsPlugin(ValidationPlugin):
-    """A validation plugin which validates that recommended slots are populated"""
+    """A validation plugin which validates that recommended slots are populated
+
+    Results for an object are reported before results for the objects nested within it.
+    """
+
+    def warm_up(self, context: ValidationContext) -> None:
+        context.class_slot_plan(context.target_class)
 
     def process(self, instance: dict, context: ValidationContext) -> Iterator[ValidationResult]:
-        def _do_process(
-            instance: dict, class_name: str, location: Optional[List[str]] = None
-        ) -> Iterator[ValidationResult]:
+        # Traverse iteratively so that deeply nested instances do not exceed the recursion limit
+        stack = [(instance, context.target_class, ())]
+        while stack:
+            instance, class_name, location = stack.pop()
             if not isinstance(instance, dict):
-                return
-            if location is None:
-                location = []
-            for slot_def in context.schema_view.class_induced_slots(class_name):
-                slot_value = instance.get(slot_def.name, None)
-                if slot_def.recommended and slot_value is None:
+                continue
+            plan = context.class_slot_plan(class_name)
+            for slot_name in plan.recommended:
+                if instance.get(slot_name, None) is None:
                     loc = "/".join(location)
                     yield ValidationResult(
                         type="recommended slots",
                         severity=Severity.WARN,
                         instance=instance,
                         instantiates=class_name,
-                        message=f"Slot '{slot_def.name}' is recommended on class '{class_name}' in /{loc}",
+                        message=f"Slot '{slot_name}' is recommended on class '{class_name}' in /{loc}",
                     )
-                slot_range_class = context.schema_view.get_class(slot_def.range)
-                if slot_range_class is not None and slot_value is not None:
-                    location += [slot_def.name]
-                    if slot_def.multivalued:
-                        if slot_def.inlined and isinstance(slot_value, dict):
-                            for k, v in slot_value.items():
-                                yield from _do_process(v, slot_range_class.name, location + [k])
-                        elif slot_def.inlined_as_list and isinstance(slot_value, list):
-                            for i, v in enumerate(slot_value):
-                                yield from _do_process(v, slot_range_class.name, location + [str(i)])
-                    else:
-                        yield from _do_process(instance[slot_def.name], slot_range_class.name, location)
-
-        yield from _do_process(instance, context.target_class)
+            children = []
+            for slot in plan.nested:
+                slot_value = instance.get(slot.name, None)
+                if slot_value is None:
+                    continue
+                slot_location = location + (slot.name,)
+                if not slot.multivalued:
+                    children.append((slot_value, slot.range, slot_location))
+                elif slot.inlined and isinstance(slot_value, dict):
+                    children.extend((v, slot.range, slot_location + (k,)) for k, v in slot_value.items())
+                elif slot.inlined_as_list and isinstance(slot_value, list):
+                    children.extend((v, slot.range, slot_location + (str(i),)) for i, v in enumerate(slot_value))
+            stack.extend(reversed(children))
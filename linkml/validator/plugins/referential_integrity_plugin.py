@@ -0,0 +1,251 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import uuid
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from linkml.validator.cache import remove_sqlite_database
+from linkml.validator.plugins.validation_plugin import ValidationPlugin
+from linkml.validator.report import Severity, ValidationResult
+from linkml.validator.validation_context import ValidationContext
+
+
+class ReferentialIntegrityPlugin(ValidationPlugin):
+    """A validation plugin which checks that references to objects resolve
+
+    A slot whose range is a class with an identifier, and which is not inlined, holds references
+    to objects of that class by their identifier. This plugin reports references which do not
+    resolve to an object of the range class, or of one of its descendants, among all the objects
+    seen during a validation run, including objects nested within instances.
+
+    Identifiers and references are kept in an on-disk SQLite index rather than in memory, so the
+    size of the data is not limited by the available memory. The index can also be shared by
+    parallel workers. Dangling references are reported after all instances have been processed,
+    so forward references within the data are resolved.
+
+    :param index_path: Path of the SQLite database to keep the index in. Identifiers stored in a
+        persistent index remain available to later validation runs, which allows references
+        between data which is validated in several runs, for example from several files. If
+        ``None``, a temporary database is used and emptied after each run. Defaults to ``None``.
+    :param sources: Dictionary of paths of additional data files and the class of the instances
+        in each file (``None`` for the target class of the validation run). The identifiers of
+        the objects in these files are added to the index, without validating them, before the
+        first instance of a run is processed. Defaults to ``None``.
+    :param batch_size: Number of instances whose identifiers and references are written to the
+        index in one transaction. Defaults to ``1000``.
+    """
+
+    cacheable = False
+
+    def __init__(
+        self,
+        index_path: Optional[Union[str, os.PathLike]] = None,
+        *,
+        sources: Optional[Dict[str, Optional[str]]] = None,
+        batch_size: int = 1000,
+    ) -> None:
+        if index_path is None:
+            fd, index_path = tempfile.mkstemp(prefix="linkml-references-", suffix=".sqlite")
+            os.close(fd)
+            weakref.finalize(self, remove_sqlite_database, index_path)
+            self.temporary = True
+        else:
+            self.temporary = False
+        self.index_path = Path(index_path)
+        self.sources = sources or {}
+        self.batch_size = batch_size
+        self._run = uuid.uuid4().hex
+        self._sources_indexed = False
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        # Serializes the use of the connection, which is shared between threads, e.g. those of the
+        # executor of the asynchronous methods of the validator
+        self._lock = threading.RLock()
+
+    def __getstate__(self) -> dict:
+        # Each process opens its own connection
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        # A connection must not be used in a forked worker process, so open a new one there
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.index_path, timeout=60, isolation_level=None, check_same_thread=False
+            )
+            self._pid = os.getpid()
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS identifiers ("class" TEXT NOT NULL, id TEXT NOT NULL, '
+                'PRIMARY KEY ("class", id)) WITHOUT ROWID'
+            )
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS refs (run TEXT NOT NULL, "class" TEXT NOT NULL, id TEXT NOT NULL, '
+                "instance_index INTEGER, location TEXT NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS refs_run ON refs (run, instance_index)")
+        return self._connection
+
+    def pre_process(self, context: ValidationContext) -> None:
+        if self._sources_indexed:
+            return
+        # Imported here because the loaders are not needed unless there are sources
+        from linkml.validator.loaders import default_loader_for_file
+
+        for path, target_class in self.sources.items():
+            class_name = target_class or context.target_class
+            batch = []
+            for instance in default_loader_for_file(path).iter_instances():
+                batch.append((None, instance))
+                if len(batch) >= self.batch_size:
+                    self._index(batch, context, class_name, with_references=False)
+                    batch = []
+            self._index(batch, context, class_name, with_references=False)
+        self._sources_indexed = True
+
+    def warm_up(self, context: ValidationContext) -> None:
+        context.class_reference_plan(context.target_class)
+
+    def process(self, instance: Any, context: ValidationContext) -> Iterator[ValidationResult]:
+        return self.process_batch([(None, instance)], context)
+
+    def process_batch(
+        self, instances: List[Tuple[Optional[int], Any]], context: ValidationContext
+    ) -> Iterator[ValidationResult]:
+        self._index(instances, context, context.target_class)
+        # Dangling references are only known once all instances have been seen, see post_process
+        return iter(())
+
+    def post_process(self, context: ValidationContext) -> Iterable[ValidationResult]:
+        run = self._run
+        # A new run gets its own references, and indexes the sources again
+        self._run = uuid.uuid4().hex
+        self._sources_indexed = False
+        results = self._dangling_references(run, context)
+        # Start the generator, so that closing it cleans up the index even if no results are read
+        next(results)
+        return results
+
+    def clear(self) -> None:
+        """Remove all identifiers and references from the index"""
+        with self._lock, self._db:
+            self._db.execute("BEGIN")
+            self._db.execute("DELETE FROM identifiers")
+            self._db.execute("DELETE FROM refs")
+
+    def close(self) -> None:
+        """Close the connection to the index"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _index(
+        self,
+        instances: List[Tuple[Optional[int], Any]],
+        context: ValidationContext,
+        root_class: str,
+        with_references: bool = True,
+    ) -> None:
+        identifiers = []
+        references = []
+        for index, instance in instances:
+            for value, class_name, location, key in context.iter_objects(instance, root_class):
+                if not isinstance(value, dict):
+                    # An object inlined as a dictionary entry with only its identifier
+                    identifiers.append((class_name, key))
+                    continue
+                plan = context.class_reference_plan(class_name)
+                if plan.identifier is not None:
+                    identifier = value.get(plan.identifier, key)
+                    if identifier is not None:
+                        identifiers.append((class_name, str(identifier)))
+                if not with_references:
+                    continue
+                for slot in plan.references:
+                    slot_value = value.get(slot.name)
+                    if slot_value is None:
+                        continue
+                    slot_location = f"{location}/{slot.name}"
+                    if slot.multivalued and isinstance(slot_value, list):
+                        references.extend(
+                            (self._run, slot.range, str(v), index, f"{slot_location}/{i}")
+                            for i, v in enumerate(slot_value)
+                            if v is not None
+                        )
+                    elif not isinstance(slot_value, (dict, list)):
+                        references.append((self._run, slot.range, str(slot_value), index, slot_location))
+        if not identifiers and not references:
+            return
+        with self._lock, self._db as db:
+            db.execute("BEGIN")
+            db.executemany('INSERT OR IGNORE INTO identifiers ("class", id) VALUES (?, ?)', identifiers)
+            db.executemany(
+                'INSERT INTO refs (run, "class", id, instance_index, location) VALUES (?, ?, ?, ?, ?)', references
+            )
+
+    def _dangling_references(self, run: str, context: ValidationContext) -> Iterator[Optional[ValidationResult]]:
+        """Yield ``None`` once the generator is started, followed by the results for dangling references
+
+        The references and, for a temporary index, the identifiers of the run are removed from the
+        index when the generator is exhausted or closed.
+        """
+        sv = context.schema_view
+        cursor = None
+        try:
+            yield None
+            with self._lock:
+                db = self._db
+                db.execute(
+                    'CREATE TEMP TABLE IF NOT EXISTS descendants (ancestor TEXT NOT NULL, "class" TEXT NOT NULL)'
+                )
+                ranges = [row[0] for row in db.execute('SELECT DISTINCT "class" FROM refs WHERE run = ?', (run,))]
+                with db:
+                    db.execute("BEGIN")
+                    db.execute("DELETE FROM descendants")
+                    db.executemany(
+                        'INSERT INTO descendants (ancestor, "class") VALUES (?, ?)',
+                        [(range_, descendant) for range_ in ranges for descendant in sv.class_descendants(range_)],
+                    )
+                cursor = db.execute(
+                    'SELECT r."class", r.id, r.instance_index, r.location FROM refs r WHERE r.run = ? AND NOT EXISTS ('
+                    'SELECT 1 FROM descendants d JOIN identifiers i ON i."class" = d."class" '
+                    'WHERE d.ancestor = r."class" AND i.id = r.id) ORDER BY r.instance_index, r.rowid',
+                    (run,),
+                )
+            while True:
+                # The connection is not held while results are consumed, possibly in another thread
+                with self._lock:
+                    rows = cursor.fetchmany(self.batch_size)
+                if not rows:
+                    break
+                for range_, identifier, index, location in rows:
+                    yield ValidationResult(
+                        type="referential integrity",
+                        severity=Severity.ERROR,
+                        instance=None,
+                        instance_index=index,
+                        instantiates=context.target_class,
+                        message=(
+                            f"Reference '{identifier}' in {location} does not resolve to an object of class '{range_}'"
+                        ),
+                    )
+        finally:
+            with self._lock:
+                if cursor is not None:
+                    cursor.close()
+                with self._db as db:
+                    db.execute("BEGIN")
+                    db.execute("DELETE FROM refs WHERE run = ?", (run,))
+                    if self.temporary:
+                        db.execute("DELETE FROM identifiers")
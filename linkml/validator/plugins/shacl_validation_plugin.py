@@ -1,10 +1,10 @@
 import os
-from typing import Any, Iterator, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import rdflib
 from linkml_runtime.dumpers import rdflib_dumper
 
-from linkml.generators import PythonGenerator, ShaclGenerator
+from linkml.generators import ShaclGenerator
 from linkml.validator.plugins.validation_plugin import ValidationPlugin
 from linkml.validator.report import Severity, ValidationResult
 from linkml.validator.validation_context import ValidationContext
@@ -22,6 +22,10 @@ class ShaclValidationPlugin(ValidationPlugin):
     :param raise_on_conversion_error: If ``True``, raise an exception if the instance
         cannot be converted to a Python class. Otherwise, treat as a ValidationError.
         Defaults to ``False``.
+    :param batch_size: If provided, this many instances are converted into a single RDF data
+        graph which is validated with one SHACL validation run. Each result is attributed to
+        the instance whose graph contains the result's focus node. Defaults to ``None``
+        (validate each instance with its own SHACL validation run).
     """
 
     def __init__(
@@ -30,10 +34,12 @@ class ShaclValidationPlugin(ValidationPlugin):
         closed: bool = False,
         shacl_path: Optional[os.PathLike] = None,
         raise_on_conversion_error: bool = False,
+        batch_size: Optional[int] = None,
     ) -> None:
         self.closed = closed
         self.shacl_path = shacl_path
         self.raise_on_conversion_error = raise_on_conversion_error
+        self.batch_size = batch_size
         self._loaded_graphs = {}
 
     def _shacl_graph(self, context: ValidationContext) -> Optional[rdflib.Graph]:
@@ -50,6 +56,10 @@ class ShaclValidationPlugin(ValidationPlugin):
                 self._loaded_graphs[schema_hash] = g
         return g
 
+    def warm_up(self, context: ValidationContext) -> None:
+        self._shacl_graph(context)
+        context.python_class()
+
     def process(self, instance: Any, context: ValidationContext) -> Iterator[ValidationResult]:
         """Perform SHACL Schema validation on the provided instance
 
@@ -58,42 +68,97 @@ class ShaclValidationPlugin(ValidationPlugin):
         :return: Iterator over validation results
         :rtype: Iterator[ValidationResult]
         """
+        for result in self.process_batch([(None, instance)], context):
+            result.instance_index = None
+            yield result
+
+    def process_batch(self, batch: List[Tuple[int, Any]], context: ValidationContext) -> Iterator[ValidationResult]:
+        """Perform SHACL Schema validation on a batch of instances with a single validation run
+
+        :param batch: List of tuples of instance index and instance to validate
+        :param context: The validation context which provides a SHACL artifact
+        :return: Iterator over validation results
+        :rtype: Iterator[ValidationResult]
+        """
         import pyshacl
 
-        shacl_graph = self._shacl_graph(context)
-        if isinstance(instance, dict):
-            pygen = PythonGenerator(context._schema)
-            mod = pygen.compile_module()
-            py_cls = getattr(mod, context._target_class)
-            if self.raise_on_conversion_error:
-                instance = py_cls(**instance)
-            else:
-                try:
+        data_graph = _empty_data_graph(context)
+        converted = []
+        for index, instance in batch:
+            if isinstance(instance, dict):
+                py_cls = context.python_class()
+                if self.raise_on_conversion_error:
                     instance = py_cls(**instance)
-                except (ValueError, TypeError):
-                    yield ValidationResult(
-                        type="shacl validation",
-                        severity=Severity.ERROR,
-                        instance=instance,
-                        instantiates=context.target_class,
-                        message="failed at class instantiation stage",
-                    )
-                    return
-        data_graph = rdflib_dumper.as_rdf_graph(instance, schemaview=context.schema_view)
+                else:
+                    try:
+                        instance = py_cls(**instance)
+                    except (ValueError, TypeError):
+                        yield ValidationResult(
+                            type="shacl validation",
+                            severity=Severity.ERROR,
+                            instance=instance,
+                            instance_index=index,
+                            instantiates=context.target_class,
+                            message="failed at class instantiation stage",
+                        )
+                        continue
+            root = rdflib_dumper.inject_triples(instance, context.schema_view, data_graph)
+            converted.append((index, instance, root))
+        if not converted:
+            return
+
         validator = pyshacl.Validator(
-            shacl_graph=shacl_graph,
+            shacl_graph=self._shacl_graph(context),
             data_graph=data_graph,
             inference="rdfs",
         )
         conforms, report_graph, report_text = validator.run()
+        owners = _node_owners(data_graph, [root for _, _, root in converted])
         for s, _, o in report_graph.triples((None, SH.result, None)):
             msg = ""
             for p, o2 in report_graph.predicate_objects(o):
                 msg += f"{p} {o2}\n"
+            owner = owners.get(report_graph.value(o, SH.focusNode))
+            index, instance, _ = converted[owner] if owner is not None else (None, None, None)
             yield ValidationResult(
                 type="shacl validation",
                 severity=Severity.ERROR,
                 instance=instance,
+                instance_index=index,
                 instantiates=context.target_class,
                 message=f"{msg}",
             )
+
+
+def _empty_data_graph(context: ValidationContext) -> rdflib.Graph:
+    # Mirrors the namespace setup done by rdflib_dumper.as_rdf_graph
+    graph = rdflib.Graph()
+    namespaces = context.schema_view.namespaces()
+    for prefix in namespaces:
+        graph.bind(prefix, rdflib.URIRef(namespaces[prefix]))
+    if namespaces._base:
+        graph.base = namespaces._base
+    return graph
+
+
+def _node_owners(data_graph: rdflib.Graph, roots: List[rdflib.term.Node]) -> Dict[rdflib.term.Node, int]:
+    """Map each node reachable from a root node to the position of the first root it is reachable from
+
+    Every root is owned by its own position, even if it is reachable from an earlier root, and
+    traversal does not continue past other roots.
+    """
+    owners = {}
+    for position, root in enumerate(roots):
+        owners.setdefault(root, position)
+    for position, root in enumerate(roots):
+        if owners[root] != position:
+            # The same node is the root of an earlier instance
+            continue
+        stack = [o for o in data_graph.objects(root, None) if not isinstance(o, rdflib.Literal)]
+        while stack:
+            node = stack.pop()
+            if node in owners:
+                continue
+            owners[node] = position
+            stack.extend(o for o in data_graph.objects(node, None) if not isinstance(o, rdflib.Literal))
+    return owners
@@ -0,0 +1,289 @@
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import tempfile
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from linkml.validator.cache import remove_sqlite_database
+from linkml.validator.plugins.validation_plugin import ValidationPlugin
+from linkml.validator.report import Severity, ValidationResult
+from linkml.validator.validation_context import ValidationContext
+
+# Marks a value which was not seen before
+_NEW = object()
+
+
+class _BloomFilter:
+    """A Bloom filter over 16 byte digests with a false positive rate of about 1% at capacity"""
+
+    def __init__(self, capacity: int) -> None:
+        self.size = max(8, math.ceil(-capacity * math.log(0.01) / math.log(2) ** 2))
+        self.hash_count = 7
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, digest: bytes) -> Iterator[int]:
+        # Double hashing derives all positions from the two halves of the digest
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, digest: bytes) -> None:
+        for position in self._positions(digest):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, digest: bytes) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
+
+
+class UniquenessPlugin(ValidationPlugin):
+    """A validation plugin which checks that identifiers and unique keys are unique across instances
+
+    The identifier of each object, including objects nested within instances, must be different
+    from the identifiers of all other objects. The values of the slots of each ``unique_keys``
+    entry of a class must be different, as a combination, for all objects of that class and its
+    descendants. Missing values are equal to each other, unless the unique key sets
+    ``consider_nulls_inequal``, in which case objects with a missing value are not checked. A
+    duplicate is reported for the instance in which it is found, with the index of the instance
+    in which the value was first seen in the message.
+
+    Values are tracked as 16 byte hashes. Up to ``max_in_memory`` hashes are kept in memory;
+    beyond that they are spilled to a temporary SQLite database, so the check stays exact while
+    memory use is bounded. A Bloom filter over the spilled hashes avoids looking up most new
+    values on disk. When instances are validated by parallel workers, every value is recorded in
+    the database instead, and duplicates are reported once all instances have been processed,
+    in the order of the instances and without the instance itself. As without workers, a value
+    is first seen in the instance with the smallest index, so the results do not depend on
+    which worker gets to a value first.
+
+    :param max_in_memory: Maximum number of hashes kept in memory before they are spilled to
+        disk. Defaults to ``1000000``.
+    :param bloom_filter_capacity: If set, the number of spilled hashes the Bloom filter is sized
+        for. It uses about 1.2 bytes per hash. Defaults to ``None`` (no Bloom filter).
+    :param spill_directory: Directory to create the temporary database in. If ``None``, the
+        default temporary directory is used. Defaults to ``None``.
+    :param batch_size: Number of instances whose hashes are looked up and stored together.
+        Defaults to ``1000``.
+    """
+
+    cacheable = False
+
+    def __init__(
+        self,
+        max_in_memory: int = 1_000_000,
+        *,
+        bloom_filter_capacity: Optional[int] = None,
+        spill_directory: Optional[Union[str, os.PathLike]] = None,
+        batch_size: int = 1000,
+    ) -> None:
+        self.max_in_memory = max_in_memory
+        self.bloom_filter_capacity = bloom_filter_capacity
+        self.batch_size = batch_size
+        fd, path = tempfile.mkstemp(prefix="linkml-unique-", suffix=".sqlite", dir=spill_directory)
+        os.close(fd)
+        weakref.finalize(self, remove_sqlite_database, path)
+        self.spill_path = Path(path)
+        self._seen: Dict[bytes, int] = {}
+        self._spilled = False
+        self._bloom_filter: Optional[_BloomFilter] = None
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid = os.getpid()
+        self._connection_pid: Optional[int] = None
+        # Serializes the use of the seen values and the connection, which are shared between
+        # threads, e.g. those of the executor of the asynchronous methods of the validator
+        self._lock = threading.RLock()
+
+    def __getstate__(self) -> dict:
+        # Each process opens its own connection
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        # A connection must not be used in a forked worker process, so open a new one there
+        if self._connection is None or self._connection_pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.spill_path, timeout=60, isolation_level=None, check_same_thread=False
+            )
+            self._connection_pid = os.getpid()
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS seen (digest BLOB PRIMARY KEY, instance_index INTEGER) WITHOUT ROWID"
+            )
+            # Values recorded by parallel workers
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS occurrences "
+                "(digest BLOB NOT NULL, instance_index INTEGER, instantiates TEXT, description TEXT)"
+            )
+        return self._connection
+
+    def warm_up(self, context: ValidationContext) -> None:
+        context.class_reference_plan(context.target_class)
+        context.class_unique_keys(context.target_class)
+
+    def process(self, instance: Any, context: ValidationContext) -> Iterator[ValidationResult]:
+        return self.process_batch([(None, instance)], context)
+
+    def process_batch(
+        self, instances: List[Tuple[Optional[int], Any]], context: ValidationContext
+    ) -> Iterator[ValidationResult]:
+        found = []
+        for index, instance in instances:
+            for value, class_name, location, key in context.iter_objects(instance):
+                for unique_key in context.class_unique_keys(class_name):
+                    is_identifier = unique_key.scope == "identifier"
+                    if isinstance(value, dict):
+                        values = tuple(value.get(slot) for slot in unique_key.slots)
+                        if is_identifier and values[0] is None:
+                            # An object inlined as a dictionary entry is identified by its key
+                            values = (key,)
+                    elif is_identifier:
+                        values = (key,)
+                    else:
+                        continue
+                    if not unique_key.nulls_equal and any(v is None for v in values):
+                        continue
+                    if is_identifier:
+                        description = f"identifier {values[0]!r}"
+                    else:
+                        shown = repr(values[0]) if len(values) == 1 else repr(values)
+                        description = f"value {shown} of unique key '{unique_key.name}'"
+                    digest = self._digest(unique_key.scope, values)
+                    found.append((digest, index, instance, class_name, f"{description} in {location or '/'}"))
+
+        if os.getpid() != self._pid:
+            # Duplicates are reported by post_process in the main process
+            self._record_shared(found)
+            return iter(())
+        digests = [(digest, index) for digest, index, *_ in found]
+        with self._lock:
+            first_seen = self._check_local(digests)
+        results = []
+        for (_, index, instance, class_name, description), first in zip(found, first_seen):
+            if first is not _NEW:
+                results.append(
+                    ValidationResult(
+                        type="uniqueness",
+                        severity=Severity.ERROR,
+                        instance=instance,
+                        instance_index=index,
+                        instantiates=class_name,
+                        message=f"Duplicate {description}, first seen in instance {first}",
+                    )
+                )
+        return iter(results)
+
+    def post_process(self, context: ValidationContext) -> Optional[Iterable[ValidationResult]]:
+        # Every run starts from an empty set of values
+        with self._lock:
+            if self._spilled:
+                self._db.execute("DELETE FROM seen")
+            self._seen.clear()
+            self._bloom_filter = None
+            self._spilled = False
+            if not self._db.execute("SELECT EXISTS (SELECT 1 FROM occurrences)").fetchone()[0]:
+                return None
+        results = self._shared_duplicates()
+        # Start the generator, so that closing it removes the values even if no results are read
+        next(results)
+        return results
+
+    def close(self) -> None:
+        """Close the connection to the spill database"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    @staticmethod
+    def _digest(scope: str, values: Tuple[Any, ...]) -> bytes:
+        encoded = json.dumps([scope, values], sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.blake2b(encoded.encode(), digest_size=16).digest()
+
+    def _check_local(self, digests: List[Tuple[bytes, Optional[int]]]) -> List[Any]:
+        """Look up and record digests in memory, spilling to disk when there are too many"""
+        first_seen = []
+        for digest, index in digests:
+            first = self._seen.get(digest, _NEW)
+            if first is _NEW and self._spilled and (self._bloom_filter is None or digest in self._bloom_filter):
+                row = self._db.execute("SELECT instance_index FROM seen WHERE digest = ?", (digest,)).fetchone()
+                if row is not None:
+                    first = row[0]
+            if first is _NEW:
+                self._seen[digest] = index
+            first_seen.append(first)
+        if len(self._seen) >= self.max_in_memory:
+            self._spill()
+        return first_seen
+
+    def _spill(self) -> None:
+        db = self._db
+        with db:
+            db.execute("BEGIN")
+            db.executemany("INSERT OR IGNORE INTO seen (digest, instance_index) VALUES (?, ?)", self._seen.items())
+        if self.bloom_filter_capacity is not None:
+            if self._bloom_filter is None:
+                self._bloom_filter = _BloomFilter(self.bloom_filter_capacity)
+            for digest in self._seen:
+                self._bloom_filter.add(digest)
+        self._seen.clear()
+        self._spilled = True
+
+    def _record_shared(self, found: List[Tuple[bytes, Optional[int], Any, str, str]]) -> None:
+        """Record values in the database shared by all worker processes"""
+        rows = [(digest, index, class_name, description) for digest, index, _, class_name, description in found]
+        if not rows:
+            return
+        with self._lock, self._db as db:
+            db.execute("BEGIN")
+            db.executemany(
+                "INSERT INTO occurrences (digest, instance_index, instantiates, description) VALUES (?, ?, ?, ?)", rows
+            )
+
+    def _shared_duplicates(self) -> Iterator[Optional[ValidationResult]]:
+        """Yield ``None`` once the generator is started, followed by the duplicates recorded by workers
+
+        The recorded values are removed when the generator is exhausted or closed.
+        """
+        cursor = None
+        try:
+            yield None
+            with self._lock:
+                # Occurrences in the same instance are ordered as they were found
+                cursor = self._db.execute(
+                    "SELECT instance_index, instantiates, description, first FROM ("
+                    "SELECT rowid AS row, instance_index, instantiates, description, "
+                    "FIRST_VALUE(instance_index) OVER same AS first, ROW_NUMBER() OVER same AS position "
+                    "FROM occurrences WINDOW same AS (PARTITION BY digest ORDER BY instance_index, rowid)) "
+                    "WHERE position > 1 ORDER BY instance_index, row"
+                )
+            while True:
+                # The connection is not held while results are consumed, possibly in another thread
+                with self._lock:
+                    rows = cursor.fetchmany(self.batch_size)
+                if not rows:
+                    break
+                for index, class_name, description, first in rows:
+                    yield ValidationResult(
+                        type="uniqueness",
+                        severity=Severity.ERROR,
+                        instance=None,
+                        instance_index=index,
+                        instantiates=class_name,
+                        message=f"Duplicate {description}, first seen in instance {first}",
+                    )
+        finally:
+            with self._lock:
+                if cursor is not None:
+                    cursor.close()
+                self._db.execute("DELETE FROM occurrences")
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Iterator
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
 
 from linkml.validator.report import ValidationResult
 from linkml.validator.validation_context import ValidationContext
@@ -9,8 +9,20 @@ class ValidationPlugin(ABC):
     """Abstract base class for validation plugins.
 
     Subclasses must implement a ``process`` method.
+
+    Plugins which can validate many instances more efficiently at once than one at a time
+    should set ``batch_size`` to the number of instances they would like to receive together
+    and override ``process_batch``.
+
+    When a :class:`linkml.validator.Validator` is given a result cache, the results of each
+    plugin for a record are cached and replayed when the same record is seen again. Plugins
+    whose results for one record depend on other records must set ``cacheable`` to ``False``;
+    they are then run on every record.
     """
 
+    batch_size: Optional[int] = None
+    cacheable: bool = True
+
     def pre_process(self, context: ValidationContext) -> None:
         """A hook that will be called before instances are processed.
 
@@ -20,12 +32,33 @@ class ValidationPlugin(ABC):
         """
         pass
 
-    def post_process(self, context: ValidationContext) -> None:
+    def warm_up(self, context: ValidationContext) -> None:
+        """A hook that may be called ahead of validation to generate the
+        artifacts the plugin needs from the validation context, such as
+        JSON Schema or Pydantic models, so that they are not generated when
+        the first instance is processed.
+
+        :param context: A `ValidationContext` instance which provides
+            access to the schema, target class, and artifacts generated
+            from the schema
+        """
+        pass
+
+    def post_process(self, context: ValidationContext) -> Optional[Iterable[ValidationResult]]:
         """A hook that will be called after instances are processed.
 
+        Plugins which find problems that can only be detected once all
+        instances have been processed, such as problems involving several
+        instances, may return an iterable of validation results. These are
+        reported after the results of ``process``. Unlike ``process``,
+        implementations are responsible for setting ``instance_index`` on
+        each result.
+
         :param context: A `ValidationContext` instance which provides
             access to the schema, target class, and artifacts generated
             from the schema
+        :return: ``None`` or an iterable of validation results
+        :rtype: Optional[Iterable[ValidationResult]]
         """
         pass
 
@@ -42,3 +75,24 @@ class ValidationPlugin(ABC):
         :rtype: Iterator[ValidationResult]
         """
         pass
+
+    def process_batch(self, batch: List[Tuple[int, Any]], context: ValidationContext) -> Iterator[ValidationResult]:
+        """Lazily yield validation results for a batch of instances according to
+        the validation context.
+
+        This is only called if ``batch_size`` is set on at least one of the plugins used by a
+        :class:`linkml.validator.Validator`. Unlike ``process``, implementations are responsible
+        for setting ``instance_index`` on each result. The default implementation calls
+        ``process`` for each instance.
+
+        :param batch: List of tuples of instance index and instance to validate
+        :param context: A `ValidationContext` instance which provides
+            access to the schema, target class, and artifacts generated
+            from the schema
+        :return: Iterator over validation results
+        :rtype: Iterator[ValidationResult]
+        """
+        for index, instance in batch:
+            for result in self.process(instance, context):
+                result.instance_index = index
+                yield result
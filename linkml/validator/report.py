@@ -1,7 +1,37 @@
+import json
+from copy import deepcopy
 from enum import Enum
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
+from pydantic.version import VERSION as PYDANTIC_VERSION
+
+if int(PYDANTIC_VERSION[0]) >= 2:
+    from pydantic import computed_field
+
+    def json_dict(model: BaseModel, **kwargs) -> Dict[str, Any]:
+        """Convert a model to a dictionary of JSON-compatible values
+
+        :param model: The model
+        :param kwargs: Options such as ``exclude`` and ``exclude_none``
+        :return: The dictionary
+        """
+        return model.model_dump(mode="json", **kwargs)
+
+else:
+
+    def computed_field(f):
+        """With Pydantic 1, derived values are plain properties which are not serialized"""
+        return f
+
+    def json_dict(model: BaseModel, **kwargs) -> Dict[str, Any]:
+        """Convert a model to a dictionary of JSON-compatible values
+
+        :param model: The model
+        :param kwargs: Options such as ``exclude`` and ``exclude_none``
+        :return: The dictionary
+        """
+        return json.loads(model.json(**kwargs))
 
 
 class Severity(str, Enum):
@@ -34,6 +64,149 @@ class ValidationResult(BaseModel):
     source: Any = Field(None, description="The source of this validation result", exclude=True)
 
 
+def _per_second(count: int, seconds: float) -> Optional[float]:
+    return count / seconds if seconds > 0 else None
+
+
+class TimingStats(BaseModel):
+    """
+    TimingStats records how often an operation was performed and the total
+    wall time spent on it.
+    """
+
+    calls: int = 0
+    seconds: float = 0.0
+
+    def add(self, other: "TimingStats") -> None:
+        self.calls += other.calls
+        self.seconds += other.seconds
+
+
+class PluginStats(BaseModel):
+    """
+    PluginStats records the work done by one validation plugin.
+    """
+
+    plugin: str
+    pre_process: TimingStats = Field(default_factory=TimingStats)
+    process: TimingStats = Field(default_factory=TimingStats)
+    post_process: TimingStats = Field(default_factory=TimingStats)
+    instances: int = 0
+    results: int = 0
+
+    @computed_field
+    @property
+    def instances_per_second(self) -> Optional[float]:
+        return _per_second(self.instances, self.process.seconds)
+
+    def add(self, other: "PluginStats") -> None:
+        self.pre_process.add(other.pre_process)
+        self.process.add(other.process)
+        self.post_process.add(other.post_process)
+        self.instances += other.instances
+        self.results += other.results
+
+
+class LoaderStats(BaseModel):
+    """
+    LoaderStats records the work done by one loader. The time spent loading
+    does not include time spent validating the loaded instances.
+    """
+
+    loader: str
+    source: Optional[str] = None
+    load: TimingStats = Field(default_factory=TimingStats)
+    instances: int = 0
+
+    @computed_field
+    @property
+    def instances_per_second(self) -> Optional[float]:
+        return _per_second(self.instances, self.load.seconds)
+
+    def add(self, other: "LoaderStats") -> None:
+        self.load.add(other.load)
+        self.instances += other.instances
+
+
+class ValidationStats(BaseModel):
+    """
+    ValidationStats records where time was spent while validating, for
+    the validation run as a whole and per plugin, loader and schema
+    artifact generated by the validation context.
+    """
+
+    seconds: float = 0.0
+    instances: int = 0
+    results: int = 0
+    context: Dict[str, TimingStats] = {}
+    plugins: List[PluginStats] = []
+    loaders: List[LoaderStats] = []
+
+    @computed_field
+    @property
+    def instances_per_second(self) -> Optional[float]:
+        return _per_second(self.instances, self.seconds)
+
+    def add(self, other: "ValidationStats") -> None:
+        """Add the statistics of another validation run with the same plugins"""
+        self.seconds += other.seconds
+        self.instances += other.instances
+        self.results += other.results
+        for name, timing in other.context.items():
+            self.context.setdefault(name, TimingStats()).add(timing)
+        for i, other_plugin_stats in enumerate(other.plugins):
+            if i < len(self.plugins):
+                self.plugins[i].add(other_plugin_stats)
+            else:
+                self.plugins.append(deepcopy(other_plugin_stats))
+        self.loaders.extend(deepcopy(loader_stats) for loader_stats in other.loaders)
+
+
+class ValidationSummary(BaseModel):
+    """
+    ValidationSummary describes how much of a data source was examined when
+    only a sample of its instances was validated, or validation stopped
+    early, and extrapolates the rate of instances with errors to the
+    instances which were not examined.
+
+    Instances count as examined once their results are produced. If
+    validation stopped early, the summary is truncated: the instances seen
+    are only those loaded so far, so neither the fraction examined nor the
+    number of instances with errors is extrapolated.
+
+    To bound memory use, an instance with errors is recognized as already
+    counted only within a batch of instances. An error which a
+    ``post_process`` hook reports for an instance that also had errors
+    further back, such as a dangling reference, counts the instance again.
+    """
+
+    instances_seen: int = 0
+    instances_examined: int = 0
+    instances_with_errors: int = 0
+    stopped_early: bool = False
+    suppressed_results: Dict[str, int] = {}
+
+    @computed_field
+    @property
+    def fraction_examined(self) -> Optional[float]:
+        if self.stopped_early or not self.instances_seen:
+            return None
+        return self.instances_examined / self.instances_seen
+
+    @computed_field
+    @property
+    def error_rate(self) -> Optional[float]:
+        return self.instances_with_errors / self.instances_examined if self.instances_examined else None
+
+    @computed_field
+    @property
+    def estimated_instances_with_errors(self) -> Optional[float]:
+        error_rate = self.error_rate
+        if self.stopped_early or error_rate is None:
+            return None
+        return error_rate * self.instances_seen
+
+
 class ValidationReport(BaseModel):
     """
     ValidationReport represents the result of all types of
@@ -42,3 +215,5 @@ class ValidationReport(BaseModel):
     """
 
     results: List[ValidationResult]
+    stats: Optional[ValidationStats] = None
+    summary: Optional[ValidationSummary] = None
@@ -0,0 +1,184 @@
+"""
+The ``linkml.validator.server`` module contains a long-running validation server. It keeps
+validators, and with them the artifacts generated from each schema such as JSON Schema, warm
+between requests, so that repeated validation runs only pay for loading and validating data. It
+is started with ``linkml-validate --serve`` and used by ``linkml-validate --server``, through the
+client in :mod:`linkml.utils.validation_client`.
+
+Requests and responses are single lines of JSON sent over a TCP connection to a local port or
+over a Unix socket. A request is one of:
+
+- ``{"argv": [...], "cwd": "..."}``: run ``linkml-validate`` with the given arguments in the
+  given working directory. The response has the ``output``, ``error_output`` and ``exit_code``
+  of the run.
+- ``{"schema": ..., "target_class": ..., "instances": [...]}`` or
+  ``{"schema": ..., "target_class": ..., "file": "..."}``: validate the given instances, or the
+  instances loaded from the given file, with the same defaults as
+  :func:`linkml.validator.validate`. A relative file path is resolved against ``cwd`` if the
+  request has one. The response has the ``results`` as JSON objects and an
+  ``exit_code``.
+
+Requests are handled one at a time. There is no authentication, and clients are trusted as much
+as the user running the server: they can make it read any file that user can read, and, since a
+config file names the plugin and loader classes to instantiate, import and run any Python code
+that user can run. The server therefore refuses to listen on an address other than a loopback
+address unless this is explicitly allowed. A Unix socket should be created in a directory that
+only trusted users can access.
+"""
+
+import contextlib
+import io
+import ipaddress
+import json
+import os
+import socket
+import socketserver
+from typing import Any, Dict, List, Optional
+
+from linkml.utils.validation_client import (  # noqa: F401
+    DEFAULT_ADDRESS,
+    forward,
+    parse_address,
+    send_request,
+)
+from linkml.validator.loaders import default_loader_for_file
+from linkml.validator.loaders.passthrough_loader import PassthroughLoader
+from linkml.validator.report import Severity
+from linkml.validator.validation_context import ValidationContextRegistry
+from linkml.validator.validator_cache import ValidatorCache, create_default_validator, validator_cache_key
+
+
+def _is_loopback(host: str) -> bool:
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, None, socket.AF_INET)}
+    except socket.gaierror:
+        return False
+    return bool(addresses) and all(ipaddress.ip_address(address).is_loopback for address in addresses)
+
+
+class _TCPServer(socketserver.TCPServer):
+    allow_reuse_address = True
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+            response = self.server.validation_server.handle_request(request)
+        except Exception as e:
+            response = {"error": f"{type(e).__name__}: {e}", "exit_code": 2}
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class ValidationServer:
+    """A server which validates data with validators that are kept warm between requests
+
+    :param address: Address to listen on, see :func:`parse_address`. Use port ``0`` to listen on
+        any free port. Defaults to :data:`DEFAULT_ADDRESS`.
+    :param max_validators: Maximum number of validators kept warm. When more are needed, the
+        least recently used one is discarded. Defaults to ``32``.
+    :param max_contexts: Maximum number of validation contexts kept warm. Validators for the same
+        schema share contexts, and the artifacts generated for them, through ``contexts``, a
+        :class:`linkml.validator.validation_context.ValidationContextRegistry`. Defaults to
+        ``32``.
+    :param allow_remote: If ``True``, listening on a TCP address which is not a loopback address
+        is allowed. Any client which can connect can then run arbitrary code as the user running
+        the server. Defaults to ``False``.
+    :raises ValueError: If the address is not a loopback address and ``allow_remote`` is not set
+    """
+
+    def __init__(
+        self,
+        address: str = DEFAULT_ADDRESS,
+        *,
+        max_validators: int = 32,
+        max_contexts: int = 32,
+        allow_remote: bool = False,
+    ) -> None:
+        family, socket_address = parse_address(address)
+        if family != socket.AF_UNIX and not allow_remote and not _is_loopback(socket_address[0]):
+            raise ValueError(
+                f"Refusing to listen on {address}, which is not a loopback address. Clients of a validation "
+                "server can run arbitrary code; allow remote clients explicitly if this is intended."
+            )
+        if family == socket.AF_UNIX:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(socket_address)
+            self._server = socketserver.UnixStreamServer(socket_address, _RequestHandler)
+        else:
+            self._server = _TCPServer(socket_address, _RequestHandler)
+        self._server.validation_server = self
+        self.validators = ValidatorCache(max_validators)
+        self.contexts = ValidationContextRegistry(max_contexts)
+
+    @property
+    def address(self) -> str:
+        """The address the server listens on, with the actual port if port ``0`` was requested"""
+        if self._server.address_family == socket.AF_UNIX:
+            return f"unix:{self._server.server_address}"
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def serve_forever(self) -> None:
+        """Handle requests until :meth:`shutdown` is called"""
+        self._server.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stop handling requests"""
+        self._server.shutdown()
+
+    def close(self) -> None:
+        """Close the listening socket"""
+        self._server.server_close()
+        if self._server.address_family == socket.AF_UNIX:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self._server.server_address)
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle a single request
+
+        :param request: The decoded request
+        :return: The response to encode and send back
+        """
+        if "argv" in request:
+            return self._run_cli(request["argv"], request.get("cwd"))
+        if "schema" in request:
+            return self._validate(request)
+        raise ValueError("A request needs either 'argv' or 'schema'")
+
+    def _run_cli(self, argv: List[str], cwd: Optional[str]) -> Dict[str, Any]:
+        # Imported here because the CLI imports this module
+        from linkml.validator.cli import cli
+
+        output = io.StringIO()
+        error_output = io.StringIO()
+        previous_cwd = os.getcwd()
+        exit_code = 0
+        try:
+            if cwd is not None:
+                os.chdir(cwd)
+            with contextlib.redirect_stdout(output), contextlib.redirect_stderr(error_output):
+                # The server is passed as the context object, which tells the CLI to use its warm
+                # validators and contexts
+                cli.main(args=argv, prog_name="linkml-validate", obj=self)
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        finally:
+            os.chdir(previous_cwd)
+        return {"output": output.getvalue(), "error_output": error_output.getvalue(), "exit_code": exit_code}
+
+    def _validate(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        schema = request["schema"]
+        validator = self.validators.get(
+            validator_cache_key(schema, False),
+            lambda: create_default_validator(schema, context_registry=self.contexts),
+        )
+        if "file" in request:
+            loader = default_loader_for_file(os.path.join(request.get("cwd", ""), request["file"]))
+        else:
+            loader = PassthroughLoader(iter(request.get("instances", [])))
+        results = list(validator.iter_results_from_source(loader, request.get("target_class")))
+        return {
+            "results": [result.model_dump(mode="json", exclude={"source"}, exclude_none=True) for result in results],
+            "exit_code": 1 if any(result.severity == Severity.ERROR for result in results) else 0,
+        }
@@ -0,0 +1,159 @@
+"""
+The ``linkml.validator.sinks`` module contains classes which consume validation results one at a
+time as they are produced, instead of collecting them all into a
+:class:`linkml.validator.report.ValidationReport`. Memory use of each sink is bounded regardless of
+how many results it receives. Instances of these classes are passed to
+:meth:`linkml.validator.Validator.validate_source_into`.
+"""
+
+import os
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, TextIO, Tuple, Union
+
+from linkml.validator.report import Severity, ValidationResult
+
+
+class ResultSink(ABC):
+    """Abstract base class for validation result sinks.
+
+    Subclasses must implement the ``accept`` method. Sinks can be used as context managers, in
+    which case ``close`` is called on exit.
+    """
+
+    @abstractmethod
+    def accept(self, result: ValidationResult) -> None:
+        """Consume a single validation result
+
+        :param result: The validation result
+        """
+        pass
+
+    def close(self) -> None:
+        """Release any resources held by the sink"""
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class JsonLinesResultSink(ResultSink):
+    """A sink which writes each result as one line of JSON
+
+    :param destination: Path of the file to write to, or an open text stream. If a path is
+        given, the file is opened when the sink is created and closed by ``close``.
+    """
+
+    def __init__(self, destination: Union[str, os.PathLike, TextIO]) -> None:
+        if isinstance(destination, (str, os.PathLike)):
+            self._file = open(destination, "w")
+            self._owns_file = True
+        else:
+            self._file = destination
+            self._owns_file = False
+
+    def accept(self, result: ValidationResult) -> None:
+        self._file.write(result.model_dump_json(exclude_none=True))
+        self._file.write("\n")
+
+    def close(self) -> None:
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class CountingResultSink(ResultSink):
+    """A sink which only counts results by severity and type"""
+
+    def __init__(self) -> None:
+        self.counts: Counter = Counter()
+
+    def accept(self, result: ValidationResult) -> None:
+        self.counts[(result.severity, result.type)] += 1
+
+    @property
+    def total(self) -> int:
+        """Total number of results received"""
+        return sum(self.counts.values())
+
+    def by_severity(self) -> Dict[Severity, int]:
+        """Number of results received per severity"""
+        counts = Counter()
+        for (severity, _), count in self.counts.items():
+            counts[severity] += count
+        return dict(counts)
+
+    def by_type(self) -> Dict[str, int]:
+        """Number of results received per result type"""
+        counts = Counter()
+        for (_, result_type), count in self.counts.items():
+            counts[result_type] += count
+        return dict(counts)
+
+
+class DeduplicatingResultSink(ResultSink):
+    """A sink which keeps a few example results for each distinct message
+
+    Every result is counted, but only the first ``examples_per_message`` results with a given
+    message are retained. Once ``max_messages`` distinct messages have been seen, results with
+    new messages are counted as overflow only.
+
+    :param examples_per_message: Number of results retained per distinct message. Defaults to ``1``.
+    :param max_messages: Maximum number of distinct messages tracked. Defaults to ``1000``.
+    """
+
+    def __init__(self, examples_per_message: int = 1, max_messages: int = 1000) -> None:
+        self.examples_per_message = examples_per_message
+        self.max_messages = max_messages
+        self._examples: Dict[str, List[ValidationResult]] = OrderedDict()
+        self._counts: Counter = Counter()
+        self.overflow = 0
+
+    def accept(self, result: ValidationResult) -> None:
+        if result.message not in self._examples:
+            if len(self._examples) >= self.max_messages:
+                self.overflow += 1
+                return
+            self._examples[result.message] = []
+        self._counts[result.message] += 1
+        examples = self._examples[result.message]
+        if len(examples) < self.examples_per_message:
+            examples.append(result)
+
+    def top(self, n: Optional[int] = None) -> List[Tuple[str, int, List[ValidationResult]]]:
+        """The most frequent messages
+
+        :param n: Number of messages to return. If ``None``, return all tracked messages.
+        :return: List of tuples of message, number of results with that message, and
+            retained example results, ordered by decreasing number of results
+        """
+        return [(message, count, self._examples[message]) for message, count in self._counts.most_common(n)]
+
+
+class CappedResultSink(ResultSink):
+    """A sink which forwards a limited number of results of each type to another sink
+
+    :param sink: The sink that results are forwarded to
+    :param max_per_type: Maximum number of results of each result type that are forwarded.
+        Further results of that type are only counted in ``dropped``.
+    """
+
+    def __init__(self, sink: ResultSink, max_per_type: int) -> None:
+        self.sink = sink
+        self.max_per_type = max_per_type
+        self._forwarded: Counter = Counter()
+        self.dropped: Counter = Counter()
+
+    def accept(self, result: ValidationResult) -> None:
+        if self._forwarded[result.type] >= self.max_per_type:
+            self.dropped[result.type] += 1
+            return
+        self._forwarded[result.type] += 1
+        self.sink.accept(result)
+
+    def close(self) -> None:
+        self.sink.close()
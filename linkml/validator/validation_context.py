@@ -1,25 +1,152 @@
 import json
 import os
-from functools import lru_cache
-from typing import Optional
+import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import cached_property, wraps
+from types import FunctionType, ModuleType
+from typing import Any, Callable, Dict, Hashable, Iterator, List, NamedTuple, Optional, Tuple
 
 import jsonschema
 from jsonschema.protocols import Validator
 from linkml_runtime import SchemaView
 from linkml_runtime.linkml_model import SchemaDefinition
 
-from linkml.generators import JsonSchemaGenerator, PydanticGenerator
+from linkml.generators import JsonSchemaGenerator, PydanticGenerator, PythonGenerator
+from linkml.generators.common.type_designators import get_accepted_type_designator_values
 from linkml.utils.datautils import infer_root_class
+from linkml.validator.cache import JsonSchemaCache, cache_key, schema_content_hash
+from linkml.validator.compiler import BatchError, Error, SchemaCompiler
+from linkml.validator.report import TimingStats
+
+
+class NestedSlot(NamedTuple):
+    """A slot whose values may be objects of another class"""
+
+    name: str
+    range: str
+    multivalued: bool
+    inlined: bool
+    inlined_as_list: bool
+
+
+class ClassSlotPlan(NamedTuple):
+    """Precomputed information about the induced slots of a class"""
+
+    recommended: Tuple[str, ...]
+    nested: Tuple[NestedSlot, ...]
+
+
+class ReferenceSlot(NamedTuple):
+    """A slot whose values are objects of a class, or references to them"""
+
+    name: str
+    range: str
+    multivalued: bool
+
+
+class ClassReferencePlan(NamedTuple):
+    """Precomputed information about how objects of a class are identified and refer to others"""
+
+    identifier: Optional[str]
+    references: Tuple[ReferenceSlot, ...]
+    inlined: Tuple[ReferenceSlot, ...]
+    designator: Optional[str]
+    designated: Dict[str, str]
+
+
+class ObjectInContext(NamedTuple):
+    """An object within an instance, see :meth:`ValidationContext.iter_objects`"""
+
+    value: Any
+    class_name: str
+    location: str
+    key: Optional[str]
+
+
+class UniqueKey(NamedTuple):
+    """Slots whose values must be unique, as a combination, among all objects in scope"""
+
+    name: str
+    scope: str
+    slots: Tuple[str, ...]
+    #: Whether missing values are equal to each other, which they are unless the unique key sets
+    #: ``consider_nulls_inequal``
+    nulls_equal: bool
+
+
+def _artifact(name: str):
+    """Compute the result of a method once per context and arguments
+
+    Results are stored on the context itself, so they are released along with it. The time
+    spent computing them is recorded in the ``timings`` of the context under the given name.
+    """
+
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (name, args, tuple(sorted(kwargs.items())))
+            if key in self._artifacts:
+                return self._artifacts[key]
+            # Contexts may be shared between threads, so avoid generating an artifact twice
+            with self._lock:
+                if key in self._artifacts:
+                    return self._artifacts[key]
+                start = time.perf_counter()
+                try:
+                    self._artifacts[key] = method(self, *args, **kwargs)
+                finally:
+                    timing = self.timings.setdefault(name, TimingStats())
+                    timing.calls += 1
+                    timing.seconds += time.perf_counter() - start
+                return self._artifacts[key]
+
+        return wrapper
+
+    return decorator
 
 
 class ValidationContext:
-    """Provides state that may be shared between validation plugins"""
+    """Provides state that may be shared between validation plugins
+
+    :param schema: The schema to validate against
+    :param target_class: Name of the class within the schema to validate against. If ``None``,
+        the class will be inferred from the schema by looking for a class with
+        ``tree_root: true``. Defaults to ``None``.
+    :param json_schema_cache: If provided, generated JSON Schema is stored in and loaded from
+        this on-disk cache. Defaults to ``None``.
+    :param schema_hash: Hash of the schema as computed by
+        :func:`linkml.validator.cache.schema_content_hash`, if it is already known. Defaults to
+        ``None``.
+
+    Artifacts are generated once per context and stored on it. The time spent generating each
+    kind of artifact is recorded in ``timings``, a dictionary of
+    :class:`linkml.validator.report.TimingStats` keyed by artifact name.
+    """
 
-    def __init__(self, schema: SchemaDefinition, target_class: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        schema: SchemaDefinition,
+        target_class: Optional[str] = None,
+        *,
+        json_schema_cache: Optional[JsonSchemaCache] = None,
+        schema_hash: Optional[str] = None,
+    ) -> None:
         # Since SchemaDefinition is not hashable, to make caching simpler we store the schema
         # in a "private" property and assume it never changes.
         self._schema = schema
         self._schema_view = SchemaView(self._schema)
+        self._json_schema_cache = json_schema_cache
+        self.timings: Dict[str, TimingStats] = {}
+        self._artifacts: Dict[Hashable, Any] = {}
+        self._lock = threading.RLock()
+        if schema_hash is not None:
+            self.__dict__["schema_hash"] = schema_hash
+        elif json_schema_cache is not None:
+            # Generators and SchemaView annotate the schema in place (e.g. with from_schema), so
+            # hash it before anything else touches it.
+            self.schema_hash
         self._target_class = self._get_target_class(target_class)
 
     @property
@@ -30,7 +157,24 @@ class ValidationContext:
     def target_class(self):
         return self._target_class
 
-    @lru_cache
+    @cached_property
+    def schema_hash(self) -> str:
+        """Hash of the content of the schema and all of the schemas it imports"""
+        return schema_content_hash(self._schema_view)
+
+    @property
+    def artifact_count(self) -> int:
+        """Number of artifacts generated so far"""
+        return len(self._artifacts)
+
+    def approximate_size(self) -> int:
+        """Approximate number of bytes used by the schema and the artifacts generated from it
+
+        See :func:`approximate_size`.
+        """
+        return approximate_size([self._schema, self._schema_view, list(self._artifacts.values())])
+
+    @_artifact("json_schema")
     def json_schema_validator(
         self,
         *,
@@ -42,30 +186,220 @@ class ValidationContext:
             with open(path_override) as json_schema_file:
                 json_schema = json.load(json_schema_file)
         else:
-            not_closed = not closed
-            jsonschema_gen = JsonSchemaGenerator(
-                schema=self._schema,
-                mergeimports=True,
-                top_class=self._target_class,
-                not_closed=not_closed,
-                include_range_class_descendants=include_range_class_descendants,
-            )
-            json_schema = jsonschema_gen.generate()
+            json_schema = None
+            key = None
+            if self._json_schema_cache is not None:
+                key = cache_key(
+                    "jsonschema", self.schema_hash, self._target_class, closed, include_range_class_descendants
+                )
+                json_schema = self._json_schema_cache.get(key)
+            if json_schema is None:
+                not_closed = not closed
+                jsonschema_gen = JsonSchemaGenerator(
+                    schema=self._schema,
+                    mergeimports=True,
+                    top_class=self._target_class,
+                    not_closed=not_closed,
+                    include_range_class_descendants=include_range_class_descendants,
+                )
+                json_schema = jsonschema_gen.generate()
+                if key is not None:
+                    self._json_schema_cache.put(key, json_schema)
 
         validator_cls = jsonschema.validators.validator_for(json_schema, default=jsonschema.Draft7Validator)
         return validator_cls(json_schema, format_checker=validator_cls.FORMAT_CHECKER)
 
+    @_artifact("compiled_validator")
+    def compiled_validator(self, *, closed: bool) -> Callable[[Any], List[Error]]:
+        """A function which checks instances of the target class directly against the schema
+
+        The function is compiled once per context and setting of ``closed``. See
+        :class:`linkml.validator.compiler.SchemaCompiler`.
+        """
+        return SchemaCompiler(self._schema_view, closed=closed).compile(self._target_class)
+
+    @_artifact("compiled_column_validator")
+    def compiled_column_validator(self, *, closed: bool) -> Callable[[List[Any]], List[BatchError]]:
+        """A function which checks batches of instances of the target class column by column
+
+        The function is compiled once per context and setting of ``closed``. See
+        :meth:`linkml.validator.compiler.SchemaCompiler.compile_columns`.
+        """
+        return SchemaCompiler(self._schema_view, closed=closed).compile_columns(self._target_class)
+
     def pydantic_model(self, *, closed: bool):
         module = self._pydantic_module(closed=closed)
         return module.__dict__[self._target_class]
 
-    @lru_cache
+    @_artifact("pydantic_list_adapter")
+    def pydantic_list_adapter(self, *, closed: bool):
+        """A Pydantic ``TypeAdapter`` which validates a list of instances of the target class
+
+        The adapter is built once per context and setting of ``closed``. With Pydantic 1, which
+        has no ``TypeAdapter``, this is ``None``.
+        """
+        try:
+            from pydantic import TypeAdapter
+        except ImportError:
+            return None
+        return TypeAdapter(List[self.pydantic_model(closed=closed)])
+
+    @_artifact("pydantic_module")
     def _pydantic_module(self, *, closed: bool):
         return PydanticGenerator(
             self._schema,
             extra_fields="forbid" if closed else "ignore" if closed is None else "allow",
         ).compile_module()
 
+    def python_class(self):
+        """The Python dataclass generated for the target class
+
+        The module containing the class is compiled once per context.
+        """
+        return self._python_module().__dict__[self._target_class]
+
+    @_artifact("python_module")
+    def _python_module(self):
+        return PythonGenerator(self._schema).compile_module()
+
+    @_artifact("class_slot_plan")
+    def class_slot_plan(self, class_name: str) -> ClassSlotPlan:
+        """Information about the induced slots of a class needed to traverse its instances
+
+        The plan is computed once per context and class.
+
+        :param class_name: Name of the class
+        :return: The names of recommended slots and the slots whose range is a class
+        """
+        recommended = []
+        nested = []
+        for slot_def in self._schema_view.class_induced_slots(class_name):
+            if slot_def.recommended:
+                recommended.append(slot_def.name)
+            range_class = self._schema_view.get_class(slot_def.range)
+            if range_class is not None:
+                nested.append(
+                    NestedSlot(
+                        slot_def.name,
+                        range_class.name,
+                        bool(slot_def.multivalued),
+                        bool(slot_def.inlined),
+                        bool(slot_def.inlined_as_list),
+                    )
+                )
+        return ClassSlotPlan(tuple(recommended), tuple(nested))
+
+    @_artifact("class_reference_plan")
+    def class_reference_plan(self, class_name: str) -> ClassReferencePlan:
+        """Information about the identifier of a class and the slots which refer to other objects
+
+        The plan is computed once per context and class.
+
+        :param class_name: Name of the class
+        :return: The identifier slot, the slots whose values are references to objects by their
+            identifier, the slots whose values are inlined objects, and the type designator slot
+            with the class designated by each of its accepted values
+        """
+        sv = self._schema_view
+        id_slot = sv.get_identifier_slot(class_name, use_key=True)
+        references = []
+        inlined = []
+        designator = None
+        designated = {}
+        for slot_def in sv.class_induced_slots(class_name):
+            name = slot_def.alias or slot_def.name
+            if slot_def.designates_type:
+                designator = name
+                for descendant in sv.class_descendants(class_name):
+                    for value in get_accepted_type_designator_values(sv, slot_def, sv.get_class(descendant)):
+                        designated.setdefault(value, descendant)
+            if slot_def.range not in sv.all_classes():
+                continue
+            reference_slot = ReferenceSlot(name, slot_def.range, bool(slot_def.multivalued))
+            if sv.is_inlined(slot_def):
+                inlined.append(reference_slot)
+            else:
+                references.append(reference_slot)
+        return ClassReferencePlan(
+            id_slot.alias or id_slot.name if id_slot is not None else None,
+            tuple(references),
+            tuple(inlined),
+            designator,
+            designated,
+        )
+
+    def iter_objects(self, instance: Any, class_name: Optional[str] = None) -> Iterator[ObjectInContext]:
+        """Yield an instance and all the objects inlined within it
+
+        Objects are yielded before the objects nested within them, with the class designated by
+        their type designator slot, if any. An object inlined as an entry of a dictionary with only
+        a simple value is yielded with that value as ``value``.
+
+        :param instance: The instance
+        :param class_name: Name of the class of the instance. Defaults to the target class.
+        """
+        # Traverse iteratively so that deeply nested instances do not exceed the recursion limit
+        stack = [ObjectInContext(instance, class_name or self._target_class, "", None)]
+        while stack:
+            item = stack.pop()
+            value = item.value
+            if not isinstance(value, dict):
+                if item.key is not None:
+                    yield item
+                continue
+            plan = self.class_reference_plan(item.class_name)
+            if plan.designator is not None:
+                designated = value.get(plan.designator)
+                if isinstance(designated, str) and plan.designated.get(designated, item.class_name) != item.class_name:
+                    item = item._replace(class_name=plan.designated[designated])
+                    plan = self.class_reference_plan(item.class_name)
+            yield item
+            children = []
+            for slot in plan.inlined:
+                slot_value = value.get(slot.name)
+                if slot_value is None:
+                    continue
+                location = f"{item.location}/{slot.name}"
+                if slot.multivalued and isinstance(slot_value, dict):
+                    children.extend(
+                        ObjectInContext(v, slot.range, f"{location}/{k}", str(k)) for k, v in slot_value.items()
+                    )
+                elif slot.multivalued and isinstance(slot_value, list):
+                    children.extend(
+                        ObjectInContext(v, slot.range, f"{location}/{i}", None) for i, v in enumerate(slot_value)
+                    )
+                else:
+                    children.append(ObjectInContext(slot_value, slot.range, location, None))
+            stack.extend(reversed(children))
+
+    @_artifact("class_unique_keys")
+    def class_unique_keys(self, class_name: str) -> Tuple[UniqueKey, ...]:
+        """The identifier and unique keys of a class, including those inherited from its ancestors
+
+        Identifiers are unique among all objects. Unique keys are unique among the objects of the
+        class which declares them and its descendants. Keys (slots with ``key: true``) are only
+        unique within the object which contains them and are not included.
+
+        :param class_name: Name of the class
+        :return: The unique keys, starting with the identifier if the class has one
+        """
+        sv = self._schema_view
+        unique_keys = []
+        id_slot = sv.get_identifier_slot(class_name)
+        if id_slot is not None:
+            unique_keys.append(UniqueKey("identifier", "identifier", (id_slot.alias or id_slot.name,), False))
+        for ancestor in sv.class_ancestors(class_name):
+            for unique_key in (sv.get_class(ancestor).unique_keys or {}).values():
+                unique_keys.append(
+                    UniqueKey(
+                        unique_key.unique_key_name,
+                        f"{ancestor}.{unique_key.unique_key_name}",
+                        tuple(unique_key.unique_key_slots),
+                        not unique_key.consider_nulls_inequal,
+                    )
+                )
+        return tuple(unique_keys)
+
     def _get_target_class(self, target_class: Optional[str] = None) -> str:
         if target_class is None:
             return infer_root_class(self._schema_view)
@@ -73,3 +407,168 @@ class ValidationContext:
             # strict=True raises ValueError if class is not found in schema
             class_def = self._schema_view.get_class(target_class, strict=True)
             return class_def.name
+
+
+def approximate_size(value: Any) -> int:
+    """Approximate the number of bytes used by a value and the objects it refers to
+
+    References are followed through containers, instance attributes, the cells of closures and
+    the classes defined in modules compiled from a schema. Imported modules, and the classes and
+    functions defined in them, are shared with the rest of the program and are not counted.
+
+    :param value: The value
+    :return: Approximate size in bytes
+    """
+    seen = set()
+    modules = set()
+    stack = [value]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, ModuleType):
+            # Modules compiled from a schema were not imported, so they have no import spec
+            if obj.__spec__ is None:
+                modules.add(obj.__name__)
+                stack.extend(v for v in vars(obj).values() if getattr(v, "__module__", None) == obj.__name__)
+            continue
+        if isinstance(obj, type) and obj.__module__ not in modules:
+            continue
+        if isinstance(obj, FunctionType) and obj.__closure__ is None and obj.__module__ not in modules:
+            continue
+        total += sys.getsizeof(obj, 0)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif isinstance(obj, type):
+            stack.extend(vars(obj).values())
+        elif isinstance(obj, FunctionType):
+            stack.extend(cell.cell_contents for cell in obj.__closure__ or () if _has_contents(cell))
+        else:
+            stack.extend(getattr(obj, "__dict__", {}).values())
+            for slot in getattr(type(obj), "__slots__", ()):
+                if isinstance(slot, str) and hasattr(obj, slot):
+                    stack.append(getattr(obj, slot))
+    return total
+
+
+def _has_contents(cell) -> bool:
+    try:
+        cell.cell_contents
+    except ValueError:
+        return False
+    return True
+
+
+class ContextRegistryInfo(NamedTuple):
+    """Statistics about a :class:`ValidationContextRegistry`"""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    artifacts: int
+
+
+class ValidationContextRegistry:
+    """A bounded, thread-safe registry of validation contexts which validators can share
+
+    Contexts are keyed by the content hash of the schema (see
+    :func:`linkml.validator.cache.schema_content_hash`), the target class and the JSON Schema
+    cache directory, so validators created separately for the same schema share one context and
+    the artifacts generated for it. When more than ``maxsize`` contexts are registered, the least
+    recently used one is discarded.
+
+    A registry is not shared between processes: each worker process used by a
+    :class:`linkml.validator.Validator` starts with an empty copy.
+
+    :param maxsize: Maximum number of contexts to keep. Defaults to ``32``.
+    """
+
+    def __init__(self, maxsize: int = 32) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._contexts: "OrderedDict[Hashable, ValidationContext]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        return {"maxsize": self.maxsize}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["maxsize"])
+
+    def get(
+        self,
+        schema: SchemaDefinition,
+        target_class: Optional[str] = None,
+        *,
+        schema_hash: Optional[str] = None,
+        json_schema_cache: Optional[JsonSchemaCache] = None,
+    ) -> ValidationContext:
+        """Get the context for a schema and target class, creating it if necessary
+
+        :param schema: The schema to validate against
+        :param target_class: Name of the class within the schema to validate against. Defaults
+            to ``None``.
+        :param schema_hash: Hash of the schema as computed by
+            :func:`linkml.validator.cache.schema_content_hash`. If ``None``, it is computed.
+            Defaults to ``None``.
+        :param json_schema_cache: On-disk cache for generated JSON Schema used by a new
+            context. Defaults to ``None``.
+        :return: The validation context
+        """
+        if schema_hash is None:
+            schema_hash = schema_content_hash(SchemaView(schema))
+        cache_directory = str(json_schema_cache.directory) if json_schema_cache is not None else None
+        key = (schema_hash, target_class, cache_directory)
+        with self._lock:
+            context = self._contexts.get(key)
+            if context is not None:
+                self._contexts.move_to_end(key)
+                self.hits += 1
+                return context
+            self.misses += 1
+        context = ValidationContext(schema, target_class, json_schema_cache=json_schema_cache, schema_hash=schema_hash)
+        with self._lock:
+            # Another thread may have registered a context for the same key in the meantime
+            context = self._contexts.setdefault(key, context)
+            self._contexts.move_to_end(key)
+            while len(self._contexts) > self.maxsize:
+                self._contexts.popitem(last=False)
+        return context
+
+    def clear(self) -> None:
+        """Discard all contexts and reset the statistics"""
+        with self._lock:
+            self._contexts.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> ContextRegistryInfo:
+        """Statistics about the registry
+
+        :return: A named tuple of ``hits``, ``misses``, ``maxsize``, ``currsize`` and the total
+            number of ``artifacts`` generated by the registered contexts
+        """
+        with self._lock:
+            contexts = list(self._contexts.values())
+            hits, misses = self.hits, self.misses
+        return ContextRegistryInfo(
+            hits, misses, self.maxsize, len(contexts), sum(context.artifact_count for context in contexts)
+        )
+
+    def approximate_size(self) -> int:
+        """Approximate number of bytes used by the registered contexts
+
+        This walks all artifacts of all contexts, so it may take a while for large registries.
+
+        :return: Approximate size in bytes
+        """
+        with self._lock:
+            contexts = list(self._contexts.values())
+        return sum(context.approximate_size() for context in contexts)
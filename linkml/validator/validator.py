@@ -1,20 +1,43 @@
-from functools import lru_cache
+import asyncio
+import itertools
+import json
+import random
+import time
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Iterator, List, Optional, TextIO, Union
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
 
+from linkml_runtime import SchemaView
 from linkml_runtime.linkml_model import SchemaDefinition
 from linkml_runtime.loaders import yaml_loader
 
-from linkml.validator.loaders import Loader
+from linkml.validator.cache import JsonSchemaCache, ResultCache, cache_key, record_hash, schema_content_hash
+from linkml.validator.loaders import JsonLinesLoader, Loader
 from linkml.validator.loaders.passthrough_loader import PassthroughLoader
 from linkml.validator.plugins import ValidationPlugin
-from linkml.validator.report import Severity, ValidationReport, ValidationResult
-from linkml.validator.validation_context import ValidationContext
+from linkml.validator.report import (
+    LoaderStats,
+    PluginStats,
+    Severity,
+    TimingStats,
+    ValidationReport,
+    ValidationResult,
+    ValidationStats,
+    ValidationSummary,
+    json_dict,
+)
+from linkml.validator.sinks import ResultSink
+from linkml.validator.validation_context import ValidationContext, ValidationContextRegistry
 
 
 class Validator:
     """A class for coordinating instance validation using configurable plugins
 
+    If any of the plugins sets a ``batch_size``, instances are validated in batches of the
+    largest such size: each plugin in turn validates the whole batch before the next plugin
+    is called. Results are then grouped by batch and plugin rather than by instance.
+
     :param schema: The schema to validate against. If a string or Path, the schema
         will be loaded from that location. Otherwise, a ``SchemaDefinition`` is required.
     :param validation_plugins: A list of plugins that be used to validate instances
@@ -22,6 +45,81 @@ class Validator:
         :class:`linkml.validator.plugins.ValidationPlugin`. Defaults to ``None``.
     :param strict: If ``True``, stop validating after the first validation problem
         is found. Defaults to ``False``.
+    :param workers: If greater than ``1``, instances provided by a loader are validated
+        in chunks by a pool of this many worker processes. Each worker builds its own
+        :class:`ValidationContext` once and reuses it for every chunk it receives, and calls
+        ``pre_process`` on its own copy of the validation plugins. Plugins and the schema must
+        therefore be picklable. The ``source`` attribute of results is not transferred back
+        from worker processes. Defaults to ``None`` (validate in the current process).
+    :param chunk_size: Number of instances sent to a worker process at a time. Only used
+        when ``workers`` is greater than ``1``, and by the asynchronous methods, which validate
+        this many instances at a time in the ``executor``. Instances from a
+        :class:`linkml.validator.loaders.JsonLinesLoader` are not sent to workers at all;
+        instead each worker decodes a byte range of the file, sized according to the loader's
+        own ``chunk_size``. Defaults to ``1000``.
+    :param ordered: If ``True``, results from worker processes are yielded in the same order
+        as they would be when validating in a single process. If ``False``, results are
+        yielded chunk by chunk as soon as a worker finishes, which keeps all workers busy even
+        if some chunks are slow to validate. In both cases ``instance_index`` refers to the
+        position of the instance in the loader. Note that with ``ordered=False`` and ``strict``,
+        validation stops at the first failure of whichever chunk finishes first, so results of
+        earlier chunks which are still pending are not reported, and the failure reported may
+        not be the first one in the loader. Only used when ``workers`` is greater than ``1``.
+        Defaults to ``True``.
+    :param include_instances: If ``False``, the ``instance`` attribute of results is cleared
+        so that results do not keep the offending instances alive. Results can still be
+        related to instances through ``instance_index``. Defaults to ``True``.
+    :param json_schema_cache: If provided, JSON Schema generated from the schema is stored in
+        and loaded from this on-disk cache, so that it only needs to be generated once per
+        schema across processes and invocations. Defaults to ``None``.
+    :param result_cache: If provided, the results of validating each record provided by a
+        loader are stored in this on-disk cache, and are replayed instead of validating the
+        record again when an identical record is validated with the same schema and plugin
+        configuration. Plugins which are not ``cacheable`` are still run on every record.
+        Defaults to ``None``.
+    :param collect_stats: If ``True``, record the time spent in the loader, in generating
+        artifacts from the schema and in each plugin, along with instance and result counts.
+        After each validation run the statistics are available as ``last_stats`` and on the
+        returned :class:`linkml.validator.report.ValidationReport`. Defaults to ``False``.
+    :param sample_rate: If set, each instance provided by a loader is validated with this
+        probability and skipped otherwise. Defaults to ``None`` (validate every instance).
+    :param sample_size: If set, validate a uniformly random sample of at most this many
+        instances provided by a loader, chosen by reservoir sampling. All instances are read
+        before the sample is validated, and the sample is kept in memory. Cannot be combined
+        with ``sample_rate``. Defaults to ``None``.
+    :param sample_seed: Seed for the random choices made when sampling. Defaults to ``None``.
+    :param max_errors: If set, stop validating after this many results with ``ERROR`` or
+        ``FATAL`` severity. Defaults to ``None``.
+    :param max_errors_per_type: If set, only this many results of each result ``type`` are
+        reported. Further results of that type are counted but not reported. Defaults to
+        ``None``.
+    :param executor: The executor used by the asynchronous methods to load instances, to
+        generate artifacts from the schema and to run the validation plugins, so that they do
+        not block the event loop. If ``None``, the default executor of the event loop is used.
+        Defaults to ``None``.
+    :param prefetch_chunks: Number of chunks of instances the asynchronous methods load ahead
+        while the current chunk is validated. Defaults to ``2``.
+    :param context_registry: If provided, validation contexts, and the artifacts generated for
+        them, are taken from this registry, so that they are shared with other validators using
+        the same registry and schema. Otherwise each validator keeps its own contexts. Defaults
+        to ``None``.
+
+    If any of the sampling or limiting options is used, a
+    :class:`linkml.validator.report.ValidationSummary` of each validation run is available
+    as ``last_summary`` and on the returned report. It states the fraction of instances that
+    were examined and the error rate extrapolated from them. Instances count as examined once
+    their results are produced, so if validation stops early (see ``max_errors``) instances which
+    were loaded ahead but not reported on are not included, and nothing is extrapolated. When sampling, the instances
+    from a :class:`linkml.validator.loaders.JsonLinesLoader` are sampled in the current
+    process even if ``workers`` is greater than ``1``.
+
+    The asynchronous methods (:meth:`avalidate`, :meth:`avalidate_source`, :meth:`aiter_results`
+    and :meth:`aiter_results_from_source`) validate one chunk at a time in the ``executor``
+    while the next chunks are loaded through the loader's
+    :meth:`linkml.validator.loaders.Loader.aiter_indexed_instances`. They do not use worker
+    processes, and statistics, sampling and result limits are only applied by the synchronous
+    methods. Use :meth:`awarm` to generate artifacts from the schema in the background, e.g. when
+    a service starts.
     """
 
     def __init__(
@@ -30,7 +128,24 @@ class Validator:
         validation_plugins: Optional[List[ValidationPlugin]] = None,
         *,
         strict: bool = False,
+        workers: Optional[int] = None,
+        chunk_size: int = 1000,
+        ordered: bool = True,
+        include_instances: bool = True,
+        json_schema_cache: Optional[JsonSchemaCache] = None,
+        result_cache: Optional[ResultCache] = None,
+        collect_stats: bool = False,
+        sample_rate: Optional[float] = None,
+        sample_size: Optional[int] = None,
+        sample_seed: Optional[int] = None,
+        max_errors: Optional[int] = None,
+        max_errors_per_type: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        prefetch_chunks: int = 2,
+        context_registry: Optional[ValidationContextRegistry] = None,
     ) -> None:
+        if sample_rate is not None and sample_size is not None:
+            raise ValueError("sample_rate and sample_size cannot be combined")
         if isinstance(schema, Path):
             schema = str(schema)
         if isinstance(schema, SchemaDefinition):
@@ -41,6 +156,30 @@ class Validator:
             self._schema.source_file = schema
         self._validation_plugins = validation_plugins
         self.strict = strict
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.ordered = ordered
+        self.include_instances = include_instances
+        self.json_schema_cache = json_schema_cache
+        self.result_cache = result_cache
+        self.collect_stats = collect_stats
+        self.last_stats: Optional[ValidationStats] = None
+        self.sample_rate = sample_rate
+        self.sample_size = sample_size
+        self.sample_seed = sample_seed
+        self.max_errors = max_errors
+        self.max_errors_per_type = max_errors_per_type
+        self.last_summary: Optional[ValidationSummary] = None
+        self.executor = executor
+        self.prefetch_chunks = prefetch_chunks
+        self.context_registry = context_registry
+        self._contexts: Dict[Optional[str], ValidationContext] = {}
+        self._result_cache_keys: Dict[str, str] = {}
+        self._schema_hash = None
+        if json_schema_cache is not None or result_cache is not None or context_registry is not None:
+            # Hash the schema before anything annotates it in place, so that the hash is the same
+            # in every process and invocation
+            self._schema_hash = schema_content_hash(SchemaView(self._schema))
 
     def validate(self, instance: Any, target_class: Optional[str] = None) -> ValidationReport:
         """Validate the given instance
@@ -52,7 +191,8 @@ class Validator:
         :return: A validation report
         :rtype: ValidationReport
         """
-        return ValidationReport(results=list(self.iter_results(instance, target_class)))
+        results = list(self.iter_results(instance, target_class))
+        return self._report(results)
 
     def validate_source(self, loader: Loader, target_class: Optional[str] = None) -> ValidationReport:
         """Validate instances from a data source
@@ -65,7 +205,30 @@ class Validator:
         :return: A validation report
         :rtype: ValidationReport
         """
-        return ValidationReport(results=list(self.iter_results_from_source(loader, target_class)))
+        results = list(self.iter_results_from_source(loader, target_class))
+        return self._report(results)
+
+    def validate_source_into(
+        self, loader: Loader, sinks: Iterable[ResultSink], target_class: Optional[str] = None
+    ) -> None:
+        """Validate instances from a data source, passing results to sinks as they are produced
+
+        Unlike :meth:`validate_source`, results are not collected, so memory use does not grow
+        with the number of results. The sinks are not closed by this method, which allows the
+        same sinks to be used for several data sources.
+
+        :param loader: An instance of a subclass of :class:`linkml.validator.loaders.Loader`
+            which provides the instances to validate
+        :param sinks: Instances of subclasses of :class:`linkml.validator.sinks.ResultSink`
+            which each receive every validation result
+        :param target_class: Name of the class within the schema to validate
+            against. If ``None``, the class will be inferred from the schema by
+            looking for a class with ``tree_root: true``. Defaults to ``None``.
+        """
+        sinks = list(sinks)
+        for result in self.iter_results_from_source(loader, target_class):
+            for sink in sinks:
+                sink.accept(result)
 
     def iter_results(self, instance: Any, target_class: Optional[str] = None) -> Iterator[ValidationResult]:
         """Lazily yield validation results for the given instance
@@ -96,29 +259,712 @@ class Validator:
         if not self._validation_plugins:
             return []
 
+        start = time.perf_counter()
+        recorder = _StatsRecorder(self._validation_plugins, loader) if self.collect_stats else None
+        self.last_stats = recorder.stats if recorder is not None else None
+        summary = ValidationSummary() if self._summarize else None
+        self.last_summary = summary
         context = self._context(target_class)
+        timings = _snapshot_timings(context)
+
+        try:
+            for plugin in self._validation_plugins:
+                _call(recorder, "pre_process", plugin, context)
+
+            if self.workers is not None and self.workers > 1:
+                results = self._iter_results_parallel(loader, context, recorder, summary)
+            else:
+                results = self._iter_instance_results(
+                    self._iter_loaded(loader, recorder, summary), context, recorder, _examined_counter(summary)
+                )
+            results = self._iter_post_processed(results, context, recorder)
+            if summary is not None:
+                results = self._limit_results(results, summary)
+            for result in results:
+                if recorder is not None:
+                    recorder.stats.results += 1
+                yield result
+        finally:
+            if recorder is not None:
+                recorder.add_context_timings(context, timings)
+                recorder.stats.instances = sum(loader_stats.instances for loader_stats in recorder.stats.loaders)
+                recorder.stats.seconds = time.perf_counter() - start
+
+    async def awarm(self, target_class: Optional[str] = None) -> None:
+        """Generate the artifacts the validation plugins need from the schema in the executor
+
+        :param target_class: Name of the class within the schema to validate
+            against. If ``None``, the class will be inferred from the schema by
+            looking for a class with ``tree_root: true``. Defaults to ``None``.
+        """
+        loop = asyncio.get_running_loop()
+        context = await loop.run_in_executor(self.executor, self._context, target_class)
+        for plugin in self._validation_plugins or []:
+            await loop.run_in_executor(self.executor, plugin.warm_up, context)
 
+    async def avalidate(self, instance: Any, target_class: Optional[str] = None) -> ValidationReport:
+        """Asynchronously validate the given instance
+
+        :param instance: The instance to validate
+        :param target_class: Name of the class within the schema to validate
+            against. If ``None``, the class will be inferred from the schema by
+            looking for a class with ``tree_root: true``. Defaults to ``None``.
+        :return: A validation report
+        :rtype: ValidationReport
+        """
+        return ValidationReport(results=[result async for result in self.aiter_results(instance, target_class)])
+
+    async def avalidate_source(self, loader: Loader, target_class: Optional[str] = None) -> ValidationReport:
+        """Asynchronously validate instances from a data source
+
+        :param loader: An instance of a subclass of :class:`linkml.validator.loaders.Loader`
+            which provides the instances to validate
+        :param target_class: Name of the class within the schema to validate
+            against. If ``None``, the class will be inferred from the schema by
+            looking for a class with ``tree_root: true``. Defaults to ``None``.
+        :return: A validation report
+        :rtype: ValidationReport
+        """
+        results = [result async for result in self.aiter_results_from_source(loader, target_class)]
+        return ValidationReport(results=results)
+
+    async def aiter_results(self, instance: Any, target_class: Optional[str] = None) -> AsyncIterator[ValidationResult]:
+        """Asynchronously yield validation results for the given instance
+
+        :param instance: The instance to validate
+        :param target_class: Name of the class within the schema to validate
+            against. If ``None``, the class will be inferred from the schema by
+            looking for a class with ``tree_root: true``. Defaults to ``None``.
+        :return: Asynchronous iterator over validation results
+        :rtype: AsyncIterator[ValidationResult]
+        """
+        loader = PassthroughLoader(iter([instance]))
+        async for result in self.aiter_results_from_source(loader, target_class):
+            yield result
+
+    async def aiter_results_from_source(
+        self, loader: Loader, target_class: Optional[str] = None
+    ) -> AsyncIterator[ValidationResult]:
+        """Asynchronously yield validation results for the instances provided by a loader
+
+        Up to ``prefetch_chunks`` chunks of instances are loaded while the current chunk is
+        validated in the executor. Chunks are validated one after the other, so plugins see
+        instances in the same order as with :meth:`iter_results_from_source`.
+
+        :param loader: An instance of a subclass of :class:`linkml.validator.loaders.Loader`
+            which provides the instances to validate
+        :param target_class: Name of the class within the schema to validate
+            against. If ``None``, the class will be inferred from the schema by
+            looking for a class with ``tree_root: true``. Defaults to ``None``.
+        :return: Asynchronous iterator over validation results
+        :rtype: AsyncIterator[ValidationResult]
+        """
+        if not self._validation_plugins:
+            return
+
+        loop = asyncio.get_running_loop()
+        context = await loop.run_in_executor(self.executor, self._context, target_class)
         for plugin in self._validation_plugins:
-            plugin.pre_process(context)
+            await loop.run_in_executor(self.executor, plugin.pre_process, context)
+
+        chunks: asyncio.Queue = asyncio.Queue(maxsize=self.prefetch_chunks)
+
+        async def load() -> None:
+            try:
+                async for chunk in _achunked(loader.aiter_indexed_instances(self.executor), self.chunk_size):
+                    await chunks.put(chunk)
+                await chunks.put(None)
+            except Exception as e:
+                await chunks.put(e)
+
+        loading = asyncio.ensure_future(load())
+        failed = False
+        # Number of plugins whose post_process hook has been called
+        post_processed = 0
+        try:
+            try:
+                while (chunk := await chunks.get()) is not None:
+                    if isinstance(chunk, Exception):
+                        raise chunk
+                    results = await loop.run_in_executor(
+                        self.executor, list, self._iter_instance_results(chunk, context)
+                    )
+                    for result in results:
+                        yield result
+                    if results and _is_failure(results[-1], self.strict):
+                        failed = True
+                        break
+            finally:
+                loading.cancel()
 
-        has_failure = False
-        for index, instance in enumerate(loader.iter_instances()):
             for plugin in self._validation_plugins:
-                for result in plugin.process(instance, context):
-                    if result.severity == Severity.FATAL or (self.strict and result.severity == Severity.ERROR):
-                        has_failure = True
+                post_processed += 1
+                returned = await loop.run_in_executor(self.executor, plugin.post_process, context)
+                if returned is None:
+                    continue
+                returned = iter(returned)
+                try:
+                    while not failed and (
+                        results := await loop.run_in_executor(
+                            self.executor, list, itertools.islice(returned, self.chunk_size)
+                        )
+                    ):
+                        for result in results:
+                            if not self.include_instances:
+                                result.instance = None
+                            yield result
+                            if _is_failure(result, self.strict):
+                                failed = True
+                                break
+                finally:
+                    await loop.run_in_executor(self.executor, _close, returned)
+        finally:
+            # As in _iter_post_processed, the hooks are called even if the consumer stops early or
+            # loading fails, and what they return is closed without being consumed
+            for plugin in self._validation_plugins[post_processed:]:
+                returned = await loop.run_in_executor(self.executor, plugin.post_process, context)
+                if returned is not None:
+                    await loop.run_in_executor(self.executor, _close, iter(returned))
+
+    def _iter_results_parallel(
+        self,
+        loader: Loader,
+        context: ValidationContext,
+        recorder: Optional["_StatsRecorder"] = None,
+        summary: Optional[ValidationSummary] = None,
+    ) -> Iterator[ValidationResult]:
+        if isinstance(loader, JsonLinesLoader) and loader.splittable and summary is None:
+            # Workers decode whole byte ranges of the file themselves instead of receiving instances
+            chunks = ((loader, byte_range) for byte_range in loader.iter_byte_ranges())
+        else:
+            chunks = _chunked(self._iter_loaded(loader, recorder, summary), self.chunk_size)
+        max_pending = self.workers * 2
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self, context.target_class),
+        ) as executor:
+            pending: deque = deque()
+            for chunk in itertools.islice(chunks, max_pending):
+                pending.append(executor.submit(_validate_chunk, chunk))
+
+            try:
+                while pending:
+                    if self.ordered:
+                        done = [pending.popleft()]
+                    else:
+                        done_set, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        done = [future for future in pending if future in done_set]
+                        for future in done:
+                            pending.remove(future)
+
+                    for future in done:
+                        results, has_failure, worker_stats, examined = future.result()
+                        if recorder is not None and worker_stats is not None:
+                            recorder.add_worker_stats(worker_stats)
+                        if summary is not None:
+                            summary.instances_examined += examined
+                        yield from results
+                        if has_failure:
+                            return
+
+                    for chunk in itertools.islice(chunks, len(done)):
+                        pending.append(executor.submit(_validate_chunk, chunk))
+            finally:
+                # Also reached when the consumer stops early, e.g. after a failure
+                for future in pending:
+                    future.cancel()
+
+    def _iter_post_processed(
+        self,
+        results: Iterable[ValidationResult],
+        context: ValidationContext,
+        recorder: Optional["_StatsRecorder"] = None,
+    ) -> Iterator[ValidationResult]:
+        """Yield results followed by those returned by the ``post_process`` hooks of the plugins"""
+        failed = False
+        # Number of plugins whose post_process hook has been called
+        post_processed = 0
+        try:
+            for result in results:
+                failed = _is_failure(result, self.strict)
+                yield result
+
+            for plugin in self._validation_plugins:
+                post_processed += 1
+                returned = _call(recorder, "post_process", plugin, context)
+                if returned is None:
+                    continue
+                returned = iter(returned)
+                try:
+                    if failed:
+                        continue
+                    returned_results = returned
+                    if recorder is not None:
+                        plugin_stats = recorder.plugin_stats(plugin)
+                        returned_results = _counted(_timed_iter(returned, plugin_stats.post_process), plugin_stats)
+                    for result in returned_results:
+                        if not self.include_instances:
+                            result.instance = None
+                        yield result
+                        if _is_failure(result, self.strict):
+                            failed = True
+                            break
+                finally:
+                    # Closing a generator which is not fully consumed lets it clean up after itself
+                    _close(returned)
+        finally:
+            # The hooks are called even if the consumer stops early, e.g. after reaching max_errors,
+            # and what they return is closed without being consumed
+            for plugin in self._validation_plugins[post_processed:]:
+                returned = _call(recorder, "post_process", plugin, context)
+                if returned is not None:
+                    _close(iter(returned))
+
+    @property
+    def _summarize(self) -> bool:
+        return any(
+            option is not None
+            for option in (self.sample_rate, self.sample_size, self.max_errors, self.max_errors_per_type)
+        )
+
+    def _report(self, results: List[ValidationResult]) -> ValidationReport:
+        return ValidationReport(
+            results=results,
+            stats=self.last_stats if self.collect_stats else None,
+            summary=self.last_summary if self._summarize else None,
+        )
+
+    def _iter_loaded(
+        self, loader: Loader, recorder: Optional["_StatsRecorder"], summary: Optional[ValidationSummary]
+    ) -> Iterator[Tuple[int, Any]]:
+        indexed_instances = loader.iter_indexed_instances()
+        if recorder is not None:
+            indexed_instances = recorder.iter_loaded(indexed_instances)
+        if summary is None:
+            return indexed_instances
+        indexed_instances = _counted_instances(indexed_instances, summary, "instances_seen")
+        rng = random.Random(self.sample_seed)
+        if self.sample_rate is not None:
+            indexed_instances = (item for item in indexed_instances if rng.random() < self.sample_rate)
+        elif self.sample_size is not None:
+            indexed_instances = _reservoir_sample(indexed_instances, self.sample_size, rng)
+        # Instances are counted as examined when their results are produced, as instances may be
+        # loaded ahead of validation
+        return indexed_instances
+
+    def _limit_results(
+        self, results: Iterable[ValidationResult], summary: ValidationSummary
+    ) -> Iterator[ValidationResult]:
+        errors = 0
+        per_type = Counter()
+        # Results for one instance are at most a batch or chunk of instances apart, so only the
+        # indexes of that many recent instances with errors are kept, instead of all of them
+        window = max([self.chunk_size] + [plugin.batch_size or 1 for plugin in self._validation_plugins])
+        recent_errors: "OrderedDict[Optional[int], None]" = OrderedDict()
+        results = iter(results)
+        try:
+            for result in results:
+                if result.severity in (Severity.ERROR, Severity.FATAL):
+                    errors += 1
+                    if result.instance_index in recent_errors:
+                        recent_errors.move_to_end(result.instance_index)
+                    else:
+                        summary.instances_with_errors += 1
+                        recent_errors[result.instance_index] = None
+                        if len(recent_errors) > window:
+                            recent_errors.popitem(last=False)
+                    if _is_failure(result, self.strict):
+                        summary.stopped_early = True
+                if self.max_errors_per_type is not None:
+                    per_type[result.type] += 1
+                    if per_type[result.type] > self.max_errors_per_type:
+                        summary.suppressed_results[result.type] = summary.suppressed_results.get(result.type, 0) + 1
+                        continue
+                yield result
+                if self.max_errors is not None and errors >= self.max_errors:
+                    summary.stopped_early = True
+                    return
+        finally:
+            # Stop loading and validating (e.g. in worker processes) as soon as possible
+            if hasattr(results, "close"):
+                results.close()
+
+    def _iter_instance_results(
+        self,
+        indexed_instances: Iterable[Tuple[int, Any]],
+        context: ValidationContext,
+        recorder: Optional["_StatsRecorder"] = None,
+        examined: Optional[Callable[[int], None]] = None,
+    ) -> Iterator[ValidationResult]:
+        if self.result_cache is None:
+            return _iter_results(
+                self._validation_plugins,
+                indexed_instances,
+                context,
+                self.strict,
+                self.include_instances,
+                recorder,
+                examined,
+            )
+        return _iter_cached_results(
+            self._validation_plugins,
+            indexed_instances,
+            context,
+            self.strict,
+            self.include_instances,
+            self.result_cache,
+            self._result_cache_key(context.target_class),
+            recorder,
+            examined,
+        )
+
+    def __getstate__(self) -> dict:
+        # Contexts are not sent to worker processes, which create their own
+        state = self.__dict__.copy()
+        state["_contexts"] = {}
+        return state
+
+    def _context(self, target_class: Optional[str] = None) -> ValidationContext:
+        if self.context_registry is not None:
+            return self.context_registry.get(
+                self._schema, target_class, schema_hash=self._schema_hash, json_schema_cache=self.json_schema_cache
+            )
+        if target_class not in self._contexts:
+            self._contexts[target_class] = ValidationContext(
+                self._schema, target_class, json_schema_cache=self.json_schema_cache, schema_hash=self._schema_hash
+            )
+        return self._contexts[target_class]
+
+    def _result_cache_key(self, target_class: str) -> str:
+        if target_class not in self._result_cache_keys:
+            plugin_configs = [_plugin_config(plugin) for plugin in self._validation_plugins if plugin.cacheable]
+            self._result_cache_keys[target_class] = cache_key(
+                "results by plugin", self._schema_hash, target_class, plugin_configs
+            )
+        return self._result_cache_keys[target_class]
+
+
+class _StatsRecorder:
+    """Collects :class:`ValidationStats` while instances are loaded and validated"""
+
+    def __init__(self, plugins: List[ValidationPlugin], loader: Optional[Loader]) -> None:
+        self.stats = ValidationStats(plugins=[PluginStats(plugin=type(plugin).__name__) for plugin in plugins])
+        self._plugin_stats = {id(plugin): stats for plugin, stats in zip(plugins, self.stats.plugins)}
+        self.loader_stats = LoaderStats(
+            loader=type(loader).__name__ if loader is not None else "",
+            source=str(loader.source) if loader is not None and loader.source is not None else None,
+        )
+        self.stats.loaders.append(self.loader_stats)
+
+    def plugin_stats(self, plugin: ValidationPlugin) -> PluginStats:
+        return self._plugin_stats[id(plugin)]
+
+    def iter_loaded(self, indexed_instances: Iterable[Tuple[int, Any]]) -> Iterator[Tuple[int, Any]]:
+        for item in _timed_iter(indexed_instances, self.loader_stats.load):
+            self.loader_stats.load.calls += 1
+            self.loader_stats.instances += 1
+            yield item
+
+    def add_context_timings(self, context: ValidationContext, snapshot: Dict[str, Tuple[int, float]]) -> None:
+        for name, timing in context.timings.items():
+            calls, seconds = snapshot.get(name, (0, 0.0))
+            if timing.calls > calls:
+                delta = TimingStats(calls=timing.calls - calls, seconds=timing.seconds - seconds)
+                self.stats.context.setdefault(name, TimingStats()).add(delta)
+
+    def add_worker_stats(self, worker_stats: ValidationStats) -> None:
+        for plugin_stats, worker_plugin_stats in zip(self.stats.plugins, worker_stats.plugins):
+            plugin_stats.add(worker_plugin_stats)
+        for name, timing in worker_stats.context.items():
+            self.stats.context.setdefault(name, TimingStats()).add(timing)
+        for loader_stats in worker_stats.loaders:
+            self.loader_stats.add(loader_stats)
+
+
+def _snapshot_timings(context: ValidationContext) -> Dict[str, Tuple[int, float]]:
+    return {name: (timing.calls, timing.seconds) for name, timing in context.timings.items()}
+
+
+def _timed_iter(iterable: Iterable, timing: TimingStats) -> Iterator:
+    """Yield from an iterable, adding the time spent producing each item to ``timing``"""
+    iterator = iter(iterable)
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            timing.seconds += time.perf_counter() - start
+        yield item
+
+
+def _call(recorder: Optional[_StatsRecorder], hook: str, plugin: ValidationPlugin, context: ValidationContext) -> Any:
+    if recorder is None:
+        return getattr(plugin, hook)(context)
+    start = time.perf_counter()
+    returned = getattr(plugin, hook)(context)
+    timing = getattr(recorder.plugin_stats(plugin), hook)
+    timing.calls += 1
+    timing.seconds += time.perf_counter() - start
+    return returned
+
+
+def _process(
+    recorder: Optional[_StatsRecorder],
+    plugin: ValidationPlugin,
+    method: str,
+    items: Any,
+    size: int,
+    context: ValidationContext,
+) -> Iterator[ValidationResult]:
+    if recorder is None:
+        return getattr(plugin, method)(items, context)
+    plugin_stats = recorder.plugin_stats(plugin)
+    start = time.perf_counter()
+    results = getattr(plugin, method)(items, context)
+    plugin_stats.process.calls += 1
+    plugin_stats.process.seconds += time.perf_counter() - start
+    plugin_stats.instances += size
+    return _counted(_timed_iter(results, plugin_stats.process), plugin_stats)
+
+
+def _close(iterator: Iterator) -> None:
+    close = getattr(iterator, "close", None)
+    if close is not None:
+        close()
+
+
+def _counted(results: Iterator[ValidationResult], plugin_stats: PluginStats) -> Iterator[ValidationResult]:
+    for result in results:
+        plugin_stats.results += 1
+        yield result
+
+
+def _examined_counter(summary: Optional[ValidationSummary]) -> Optional[Callable[[int], None]]:
+    """A callback which adds to the number of instances examined in a summary"""
+    if summary is None:
+        return None
+
+    def examined(count: int) -> None:
+        summary.instances_examined += count
+
+    return examined
+
+
+def _counted_instances(
+    indexed_instances: Iterable[Tuple[int, Any]], summary: ValidationSummary, counter: str
+) -> Iterator[Tuple[int, Any]]:
+    for item in indexed_instances:
+        setattr(summary, counter, getattr(summary, counter) + 1)
+        yield item
+
+
+def _reservoir_sample(
+    indexed_instances: Iterable[Tuple[int, Any]], size: int, rng: random.Random
+) -> Iterator[Tuple[int, Any]]:
+    reservoir = []
+    for seen, item in enumerate(indexed_instances):
+        if seen < size:
+            reservoir.append(item)
+        else:
+            slot = rng.randrange(seen + 1)
+            if slot < size:
+                reservoir[slot] = item
+    # Validate the sample in the order of the source
+    yield from sorted(reservoir, key=lambda item: item[0])
+
+
+async def _achunked(aiterable: AsyncIterator, size: int) -> AsyncIterator[list]:
+    chunk = []
+    async for item in aiterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _is_failure(result: ValidationResult, strict: bool) -> bool:
+    return result.severity == Severity.FATAL or (strict and result.severity == Severity.ERROR)
+
+
+def _iter_results(
+    plugins: List[ValidationPlugin],
+    indexed_instances: Iterable[Tuple[int, Any]],
+    context: ValidationContext,
+    strict: bool,
+    include_instances: bool = True,
+    recorder: Optional[_StatsRecorder] = None,
+    examined: Optional[Callable[[int], None]] = None,
+) -> Iterator[ValidationResult]:
+    """Yield the results of validating instances with each plugin in turn
+
+    If given, ``examined`` is called with the number of instances about to be reported on, before
+    their results are yielded.
+    """
+    batch_size = max((plugin.batch_size or 1 for plugin in plugins), default=1)
+    if batch_size == 1:
+        for index, instance in indexed_instances:
+            if examined is not None:
+                examined(1)
+            for plugin in plugins:
+                for result in _process(recorder, plugin, "process", instance, 1, context):
                     result.instance_index = index
+                    if not include_instances:
+                        result.instance = None
                     yield result
-                    if has_failure:
-                        break
-                if has_failure:
-                    break
-            if has_failure:
-                break
+                    if _is_failure(result, strict):
+                        return
+        return
 
-        for plugin in self._validation_plugins:
-            plugin.post_process(context)
+    for batch in _chunked(indexed_instances, batch_size):
+        if examined is not None:
+            examined(len(batch))
+        for plugin in plugins:
+            for result in _process(recorder, plugin, "process_batch", batch, len(batch), context):
+                if not include_instances:
+                    result.instance = None
+                yield result
+                if _is_failure(result, strict):
+                    return
 
-    @lru_cache
-    def _context(self, target_class: Optional[str] = None) -> ValidationContext:
-        return ValidationContext(self._schema, target_class)
+
+# Number of records looked up in a result cache at a time
+_RESULT_CACHE_CHUNK_SIZE = 256
+
+
+def _iter_cached_results(
+    plugins: List[ValidationPlugin],
+    indexed_instances: Iterable[Tuple[int, Any]],
+    context: ValidationContext,
+    strict: bool,
+    include_instances: bool,
+    result_cache: ResultCache,
+    key_prefix: str,
+    recorder: Optional[_StatsRecorder] = None,
+    examined: Optional[Callable[[int], None]] = None,
+) -> Iterator[ValidationResult]:
+    """Yield the results of validating instances, replaying the results of cacheable plugins from a cache
+
+    The results of each instance are yielded in the order of the plugins, whether they were
+    cached or not. A cache entry holds a list of results for each cacheable plugin.
+    """
+    cacheable = [position for position, plugin in enumerate(plugins) if plugin.cacheable]
+    chunk_size = max([_RESULT_CACHE_CHUNK_SIZE] + [plugin.batch_size or 1 for plugin in plugins])
+    for chunk in _chunked(indexed_instances, chunk_size):
+        keys = {}
+        for index, instance in chunk:
+            instance_hash = record_hash(instance)
+            if instance_hash is not None:
+                keys[index] = cache_key(key_prefix, instance_hash)
+        cached = result_cache.get_many(set(keys.values()))
+
+        misses = [(index, instance) for index, instance in chunk if keys.get(index) not in cached]
+        # The results of each instance, by the position of the plugin which reported them
+        computed = {index: [[] for _ in plugins] for index, _ in chunk}
+        complete = True
+        for position, plugin in enumerate(plugins):
+            for result in _iter_results(
+                [plugin], misses if plugin.cacheable else chunk, context, strict, recorder=recorder
+            ):
+                computed[result.instance_index][position].append(result)
+                if plugin.cacheable and _is_failure(result, strict):
+                    # Validation stops here, so results of the remaining records are incomplete
+                    complete = False
+        if complete and misses:
+            result_cache.put_many(
+                {
+                    keys[index]: [
+                        [_cacheable_result(result, instance) for result in computed[index][position]]
+                        for position in cacheable
+                    ]
+                    for index, instance in misses
+                    if index in keys
+                }
+            )
+
+        for index, instance in chunk:
+            if examined is not None:
+                examined(1)
+            results = computed[index]
+            if keys.get(index) in cached:
+                for position, entries in zip(cacheable, cached[keys[index]]):
+                    results[position] = [
+                        ValidationResult(**{"instance": instance, **entry}, instance_index=index) for entry in entries
+                    ]
+            for result in itertools.chain.from_iterable(results):
+                if not include_instances:
+                    result.instance = None
+                yield result
+                if _is_failure(result, strict):
+                    return
+
+
+def _cacheable_result(result: ValidationResult, instance: Any) -> dict:
+    entry = json_dict(result, exclude={"instance_index", "source"})
+    # Most results refer to the record itself, which is known when they are replayed
+    if result.instance is instance:
+        del entry["instance"]
+    return entry
+
+
+def _plugin_config(plugin: ValidationPlugin) -> List[str]:
+    config = {key: value for key, value in vars(plugin).items() if not key.startswith("_")}
+    return [f"{type(plugin).__module__}.{type(plugin).__qualname__}", json.dumps(config, sort_keys=True, default=repr)]
+
+
+def _chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+# State of a worker process used by Validator._iter_results_parallel. It is populated once per
+# process by _init_worker so that the ValidationContext and its artifacts are reused across chunks.
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(validator: Validator, target_class: str) -> None:
+    context = validator._context(target_class)
+    recorder = _StatsRecorder(validator._validation_plugins, None) if validator.collect_stats else None
+    for plugin in validator._validation_plugins:
+        _call(recorder, "pre_process", plugin, context)
+    _worker_state.update(validator=validator, context=context, recorder=recorder, timings={})
+
+
+def _validate_chunk(
+    chunk: Union[List[Tuple[int, Any]], Tuple[JsonLinesLoader, Tuple[int, int, int]]],
+) -> Tuple[List[ValidationResult], bool, Optional[ValidationStats], int]:
+    validator: Validator = _worker_state["validator"]
+    context: ValidationContext = _worker_state["context"]
+    recorder: Optional[_StatsRecorder] = _worker_state["recorder"]
+    if isinstance(chunk, tuple):
+        loader, byte_range = chunk
+        chunk = loader.iter_indexed_instances(byte_range)
+        if recorder is not None:
+            chunk = recorder.iter_loaded(chunk)
+    results = []
+    examined = 0
+
+    def count_examined(count: int) -> None:
+        nonlocal examined
+        examined += count
+
+    for result in validator._iter_instance_results(chunk, context, recorder, count_examined):
+        # The source object (e.g. a jsonschema error) is not guaranteed to be picklable
+        result.source = None
+        results.append(result)
+    has_failure = bool(results) and _is_failure(results[-1], validator.strict)
+
+    stats = None
+    if recorder is not None:
+        # Report what happened in this worker since the previous chunk
+        recorder.add_context_timings(context, _worker_state["timings"])
+        stats = recorder.stats
+        _worker_state.update(
+            recorder=_StatsRecorder(validator._validation_plugins, None), timings=_snapshot_timings(context)
+        )
+    return results, has_failure, stats, examined
@@ -0,0 +1,156 @@
+"""
+The ``linkml.validator.validator_cache`` module provides a bounded cache of ready-to-use
+validators, so that the JSON Schema and other artifacts generated from a schema are reused by
+repeated validations against the same schema. It is used by :func:`linkml.validator.validate`,
+:func:`linkml.validator.validate_file` and the validation server.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict, namedtuple
+from copy import deepcopy
+from pathlib import Path
+from typing import Callable, Hashable, Optional, Union
+
+from linkml_runtime.dumpers import json_dumper
+from linkml_runtime.linkml_model import SchemaDefinition
+from linkml_runtime.loaders import yaml_loader
+
+from linkml.validator.plugins import JsonschemaValidationPlugin
+from linkml.validator.validation_context import ValidationContextRegistry
+from linkml.validator.validator import Validator
+
+ValidatorCacheInfo = namedtuple("ValidatorCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class ValidatorCache:
+    """A bounded, thread-safe LRU mapping of cache keys to ready-to-use validators
+
+    :param maxsize: Maximum number of validators to keep. When more are added, the least
+        recently used validator is discarded.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._validators: "OrderedDict[Hashable, Validator]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, create: Callable[[], Validator]) -> Validator:
+        """Get the validator for a key, creating it if it is not in the cache
+
+        :param key: Cache key, e.g. as returned by :func:`validator_cache_key`
+        :param create: Function which creates the validator on a cache miss
+        :return: The cached or newly created validator
+        """
+        with self._lock:
+            validator = self._validators.get(key)
+            if validator is not None:
+                self._validators.move_to_end(key)
+                self.hits += 1
+                return validator
+            self.misses += 1
+        validator = create()
+        with self._lock:
+            self._validators[key] = validator
+            self._evict()
+        return validator
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximum number of validators, discarding validators if necessary
+
+        :param maxsize: Maximum number of validators to keep
+        """
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """Discard all validators and reset the statistics"""
+        with self._lock:
+            self._validators.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> ValidatorCacheInfo:
+        """Statistics about the cache
+
+        :return: A named tuple of ``hits``, ``misses``, ``maxsize`` and ``currsize``
+        """
+        with self._lock:
+            return ValidatorCacheInfo(self.hits, self.misses, self.maxsize, len(self._validators))
+
+    def _evict(self) -> None:
+        while len(self._validators) > self.maxsize:
+            self._validators.popitem(last=False)
+
+
+def validator_cache_key(schema: Union[str, dict, Path, SchemaDefinition], strict: bool) -> Hashable:
+    """Compute the key of the validator for a schema in a :class:`ValidatorCache`
+
+    Local schema files are identified by their path, modification time and size, so that a
+    changed file gets a new key. Changes to schemas imported by a schema file are not detected.
+    Other schemas are identified by a hash of their content.
+
+    :param schema: The schema, as a path, URL, YAML string, dict or ``SchemaDefinition``
+    :param strict: Whether the validator stops at the first error
+    :return: Hashable cache key
+    """
+    if isinstance(schema, Path):
+        schema = str(schema)
+    if isinstance(schema, str) and "\n" not in schema:
+        try:
+            stat = os.stat(schema)
+        except OSError:
+            # Not a local file (e.g. a URL), so there is no modification time to check
+            return ("location", schema, strict)
+        return ("file", os.path.abspath(schema), stat.st_mtime_ns, stat.st_size, strict)
+    if isinstance(schema, SchemaDefinition):
+        content = json_dumper.dumps(schema)
+    elif isinstance(schema, dict):
+        content = json.dumps(schema, sort_keys=True, default=str)
+    else:
+        content = str(schema)
+    return ("content", hashlib.sha256(content.encode()).hexdigest(), strict)
+
+
+def create_default_validator(
+    schema: Union[str, dict, Path, SchemaDefinition],
+    *,
+    strict: bool = False,
+    context_registry: Optional[ValidationContextRegistry] = None,
+) -> Validator:
+    """Create a validator which performs closed JSON Schema validation
+
+    :param schema: The schema, as a path, URL, YAML string, dict or ``SchemaDefinition``. A dict
+        or ``SchemaDefinition`` is copied, as the validator modifies the schema it is given.
+    :param strict: If ``True``, validation stops after the first validation error. Defaults to
+        ``False``.
+    :param context_registry: If provided, validation contexts are taken from this registry.
+        Defaults to ``None``.
+    :return: A validator
+    :raises ValueError: If the schema cannot be loaded
+    """
+    try:
+        if isinstance(schema, Path):
+            schema = str(schema)
+        if isinstance(schema, dict):
+            schema = SchemaDefinition(**deepcopy(schema))
+        elif isinstance(schema, SchemaDefinition):
+            # The validator modifies the schema it is given, which would change the cache key of
+            # the caller's schema
+            schema = deepcopy(schema)
+        elif isinstance(schema, str):
+            schema = yaml_loader.load(schema, target_class=SchemaDefinition)
+
+        if not isinstance(schema, SchemaDefinition):
+            raise ValueError(f"Schema could not be loaded from {schema}")
+    except ValueError as e:
+        raise ValueError(f"Invalid schema: {schema}") from e
+
+    validation_plugins = [JsonschemaValidationPlugin(closed=True)]
+
+    return Validator(schema, validation_plugins=validation_plugins, strict=strict, context_registry=context_registry)
@@ -22,6 +22,7 @@ from linkml_runtime.utils.formatutils import camelcase
 
 from linkml._version import __version__
 from linkml.generators.pythongen import PythonGenerator
+from linkml.utils import yaml_utils
 from linkml.utils.helpers import get_range_associated_slots
 from linkml.validator import Validator, _get_default_validator
 
@@ -175,7 +176,7 @@ class ExampleRunner:
             tc = parts[0]
             with open(input_example) as file:
                 if input_format == "yaml":
-                    input_dict = yaml.safe_load(file)
+                    input_dict = yaml_utils.safe_load(file)
                 elif input_format == "json":
                     input_dict = json.load(file)
                 else:
@@ -329,7 +330,7 @@ def cli(schema, prefixes, output: TextIO, **kwargs):
     For context, see: https://github.com/linkml/linkml/issues/501
     """
     schemaview = SchemaView(schema)
-    prefix_map = yaml.safe_load(open(prefixes)) if prefixes else None
+    prefix_map = yaml_utils.safe_load(open(prefixes)) if prefixes else None
     runner = ExampleRunner(schemaview=schemaview, prefix_map=prefix_map, **kwargs)
     runner.process_examples()
     output.write(str(runner.summary))
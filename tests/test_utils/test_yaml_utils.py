@@ -1,9 +1,12 @@
+from datetime import date
+
 import pytest
 import yaml
 from jsonasobj2 import as_json
 from linkml_runtime.utils.yamlutils import DupCheckYamlLoader, as_yaml
 
 from linkml.utils.rawloader import load_raw_schema
+from linkml.utils.yaml_utils import iter_safe_load_items, safe_load, safe_load_all
 
 
 def test_dupcheck_loader(input_path):
@@ -32,3 +35,16 @@ def test_as_yaml(input_path, snapshot):
     """Test the YAML output representation"""
     schema = load_raw_schema(input_path("schema4.yaml"), emit_metadata=False)
     assert as_yaml(schema) == snapshot("schema4.yaml")
+
+
+def test_iter_safe_load_items():
+    stream = """
+- a: &x 1
+  b: [1, 2]
+- c: *x
+--- {d: 2020-01-01}
+---
+"""
+    assert list(iter_safe_load_items(stream)) == [{"a": 1, "b": [1, 2]}, {"c": 1}, {"d": date(2020, 1, 1)}, None]
+    assert safe_load("a: 1") == {"a": 1}
+    assert list(safe_load_all(stream)) == list(yaml.safe_load_all(stream))
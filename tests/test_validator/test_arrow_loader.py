@@ -0,0 +1,159 @@
+import datetime
+
+import pytest
+from linkml_runtime import SchemaView
+from linkml_runtime.linkml_model import SchemaDefinition
+from linkml_runtime.loaders import yaml_loader
+
+from linkml.validator import Validator
+from linkml.validator.loaders import ArrowIpcLoader, ParquetLoader, default_loader_for_file
+from linkml.validator.plugins import CompiledValidationPlugin
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+SCHEMA = """id: https://w3id.org/test/arrow
+name: arrow
+prefixes:
+  linkml: https://w3id.org/linkml/
+imports:
+  - linkml:types
+default_range: string
+classes:
+  Person:
+    attributes:
+      id:
+        identifier: true
+      age:
+        range: integer
+      birth_date:
+        range: date
+      aliases:
+        multivalued: true
+      address:
+        range: Address
+        inlined: true
+  Address:
+    attributes:
+      street:
+        required: true
+      city:
+"""
+
+TABLE = {
+    "id": ["p:1", "p:2", "p:3"],
+    "age": [42, None, 7],
+    "birth_date": [datetime.date(1980, 1, 1), None, datetime.date(2017, 5, 6)],
+    "aliases": [["Al"], [], None],
+    "address": [{"street": "Main", "city": None}, None, {"street": None, "city": "Springfield"}],
+    "comment": ["a", "b", "c"],
+}
+
+EXPECTED = [
+    {
+        "id": "p:1",
+        "age": 42,
+        "birth_date": "1980-01-01",
+        "aliases": ["Al"],
+        "address": {"street": "Main"},
+        "comment": "a",
+    },
+    {"id": "p:2", "aliases": [], "comment": "b"},
+    {"id": "p:3", "age": 7, "birth_date": "2017-05-06", "address": {"city": "Springfield"}, "comment": "c"},
+]
+
+
+@pytest.fixture(scope="module")
+def schema():
+    return yaml_loader.load(SCHEMA, SchemaDefinition)
+
+
+@pytest.fixture
+def parquet_file(tmp_path):
+    path = tmp_path / "people.parquet"
+    pq.write_table(pa.table(TABLE), path, row_group_size=2)
+    return path
+
+
+@pytest.fixture(params=["file", "stream"])
+def arrow_file(tmp_path, request):
+    path = tmp_path / "people.arrow"
+    table = pa.table(TABLE)
+    open_writer = pa.ipc.new_file if request.param == "file" else pa.ipc.new_stream
+    with pa.OSFile(str(path), "wb") as sink, open_writer(sink, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=2):
+            writer.write_batch(batch)
+    return path
+
+
+def test_load_parquet(parquet_file):
+    loader = ParquetLoader(parquet_file, batch_size=2)
+    assert list(loader.iter_instances()) == EXPECTED
+
+
+def test_load_arrow(arrow_file):
+    assert list(ArrowIpcLoader(arrow_file).iter_instances()) == EXPECTED
+
+
+@pytest.mark.parametrize("loader_class", [ParquetLoader, ArrowIpcLoader])
+def test_projection(loader_class, schema, parquet_file, arrow_file):
+    path = parquet_file if loader_class is ParquetLoader else arrow_file
+    loader = loader_class(path, columns=["comment", "id"])
+    assert loader.projected_columns() == ["id", "comment"]
+    assert [sorted(instance) for instance in loader.iter_instances()] == [["comment", "id"]] * 3
+
+    loader = loader_class(path, schema_view=SchemaView(schema), target_class="Person")
+    assert [instance.get("comment") for instance in loader.iter_instances()] == [None, None, None]
+
+
+@pytest.mark.parametrize("loader_class", [ParquetLoader, ArrowIpcLoader])
+def test_no_projected_columns(loader_class, schema, parquet_file, arrow_file):
+    path = parquet_file if loader_class is ParquetLoader else arrow_file
+    assert list(loader_class(path, columns=[]).iter_instances()) == [{}, {}, {}]
+
+    # Every row is still validated if no column corresponds to a slot of the target class
+    loader = loader_class(path, schema_view=SchemaView(schema), target_class="Address")
+    report = Validator(schema, [CompiledValidationPlugin()]).validate_source(loader, "Address")
+    assert [result.instance_index for result in report.results] == [0, 1, 2]
+
+
+def test_validate(schema, parquet_file):
+    loader = ParquetLoader(parquet_file, schema_view=SchemaView(schema), target_class="Person")
+    for plugin in (CompiledValidationPlugin(), CompiledValidationPlugin(batch_size=100)):
+        report = Validator(schema, [plugin]).validate_source(loader, "Person")
+        assert [(result.instance_index, result.message) for result in report.results] == [
+            (2, "'street' is a required property in /address")
+        ]
+
+
+def test_default_loader(parquet_file, arrow_file):
+    assert isinstance(default_loader_for_file(parquet_file), ParquetLoader)
+    assert isinstance(default_loader_for_file(arrow_file), ArrowIpcLoader)
+
+
+def test_load_nanoseconds_durations_and_binary(tmp_path):
+    seen = pa.array([1_500_000_000_123_456_789], pa.timestamp("ns", tz="UTC"))
+    table = pa.table(
+        {
+            "seen": seen,
+            "history": pa.array(
+                [[{"at": 1_500_000_000_000_000_001}]], pa.list_(pa.struct([("at", pa.timestamp("ns"))]))
+            ),
+            "elapsed": pa.array([-1_500_000_000], pa.duration("ns")),
+            "wait": pa.array([3_000_000], pa.duration("us")),
+            "label": pa.array([b"caf\xc3\xa9"], pa.binary()),
+            "digest": pa.array([b"\xff\x00"], pa.binary(2)),
+        }
+    )
+    path = tmp_path / "events.parquet"
+    pq.write_table(table, path)
+    assert list(ParquetLoader(path).iter_instances()) == [
+        {
+            "seen": "2017-07-14T02:40:00.123456+00:00",
+            "history": [{"at": "2017-07-14T02:40:00"}],
+            "elapsed": "-PT1.5S",
+            "wait": "PT3S",
+            "label": "café",
+            "digest": "/wA=",
+        }
+    ]
@@ -0,0 +1,205 @@
+import asyncio
+
+import pytest
+from linkml_runtime.linkml_model import SchemaDefinition
+from linkml_runtime.loaders import yaml_loader
+
+from linkml.generators import JsonSchemaGenerator
+from linkml.validator import Validator
+from linkml.validator.cache import JsonSchemaCache, ResultCache, cache_key, default_cache_directory, record_hash
+from linkml.validator.loaders.passthrough_loader import PassthroughLoader
+from linkml.validator.plugins import JsonschemaValidationPlugin, ValidationPlugin
+from linkml.validator.report import Severity, ValidationResult
+from linkml.validator.validation_context import ValidationContext
+
+
+@pytest.fixture
+def load_personinfo_schema(input_path):
+    # Each call simulates loading the schema in a new process
+    def load() -> SchemaDefinition:
+        return yaml_loader.load(input_path("personinfo.yaml"), SchemaDefinition)
+
+    return load
+
+
+def test_default_cache_directory(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert default_cache_directory() == tmp_path / "linkml"
+
+
+def test_get_and_put(tmp_path):
+    cache = JsonSchemaCache(tmp_path)
+    key = cache_key("jsonschema", "abc", True)
+    assert cache.get(key) is None
+    cache.put(key, {"type": "object"})
+    assert cache.get(key) == {"type": "object"}
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache_key("jsonschema", "abc", False) != key
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = JsonSchemaCache(tmp_path)
+    key = cache_key("corrupt")
+    cache.put(key, {})
+    (tmp_path / "jsonschema" / f"{key}.json").write_text("{")
+    assert cache.get(key) is None
+    assert cache.misses == 1
+
+
+def test_context_uses_cache(load_personinfo_schema, tmp_path, monkeypatch):
+    cache = JsonSchemaCache(tmp_path)
+    context = ValidationContext(load_personinfo_schema(), "Person", json_schema_cache=cache)
+    generated = context.json_schema_validator(closed=True, include_range_class_descendants=False)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("JSON Schema should not be generated")
+
+    monkeypatch.setattr(JsonSchemaGenerator, "generate", fail)
+    warm_context = ValidationContext(load_personinfo_schema(), "Person", json_schema_cache=cache)
+    cached = warm_context.json_schema_validator(closed=True, include_range_class_descendants=False)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cached.schema == generated.schema
+
+    # Different options or target class must not reuse the entry
+    other_context = ValidationContext(load_personinfo_schema(), "Container", json_schema_cache=cache)
+    with pytest.raises(AssertionError):
+        other_context.json_schema_validator(closed=True, include_range_class_descendants=False)
+
+
+def test_schema_change_invalidates_cache(load_personinfo_schema, tmp_path):
+    cache = JsonSchemaCache(tmp_path)
+    context = ValidationContext(load_personinfo_schema(), "Person", json_schema_cache=cache)
+    assert context.schema_hash == ValidationContext(load_personinfo_schema(), json_schema_cache=cache).schema_hash
+    changed_schema = load_personinfo_schema()
+    changed_schema.description = "changed"
+    changed_context = ValidationContext(changed_schema, "Person", json_schema_cache=cache)
+    assert context.schema_hash != changed_context.schema_hash
+
+
+def test_validator_with_cache(load_personinfo_schema, tmp_path):
+    cache = JsonSchemaCache(tmp_path)
+    plugins = [JsonschemaValidationPlugin(closed=True)]
+    for _ in range(2):
+        validator = Validator(load_personinfo_schema(), plugins, json_schema_cache=cache)
+        report = validator.validate({"id": "1", "full_name": "Name", "age": "old"}, "Person")
+        assert len(report.results) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_record_hash():
+    assert record_hash({"a": 1, "b": [1, 2]}) == record_hash({"b": [1, 2], "a": 1})
+    assert record_hash({"a": 1}) != record_hash({"a": "1"})
+    assert record_hash(b'{"a": 1}') != record_hash(b'{"a":1}')
+    assert record_hash({"a": object()}) is None
+
+
+def test_result_cache_get_and_put(tmp_path):
+    cache = ResultCache(tmp_path / "results.sqlite")
+    assert cache.get_many(["a", "b"]) == {}
+    cache.put_many({"a": [{"message": "problem"}], "b": []})
+    assert cache.get_many(["a", "b", "c"]) == {"a": [{"message": "problem"}], "b": []}
+    assert (cache.hits, cache.misses) == (2, 3)
+    cache.close()
+    # Entries persist across connections
+    assert ResultCache(tmp_path / "results.sqlite").get_many(["a"]) == {"a": [{"message": "problem"}]}
+
+
+def test_result_cache_eviction(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("linkml.validator.cache.time.time", lambda: now[0])
+    cache = ResultCache(tmp_path / "results.sqlite")
+    for key in "abcd":
+        cache.put_many({key: []})
+        now[0] += 10
+    cache.get_many(["a"])
+    cache.close()
+
+    cache = ResultCache(tmp_path / "results.sqlite", max_entries=2)
+    # "a" was used most recently
+    assert set(cache.get_many("abcd")) == {"a", "d"}
+    cache.close()
+
+    now[0] += 100
+    cache = ResultCache(tmp_path / "results.sqlite", max_age=50)
+    assert cache.get_many("abcd") == {}
+
+
+class CountingValidationPlugin(ValidationPlugin):
+    def __init__(self, cacheable=True):
+        self.cacheable = cacheable
+        self.processed = []
+
+    def process(self, instance, context):
+        self.processed.append(instance["id"])
+        if instance.get("age", 0) > 100:
+            yield ValidationResult(
+                type=getattr(self, "name", "counting"),
+                severity=Severity.ERROR,
+                instance=instance,
+                instantiates=context.target_class,
+                message=f"{instance['id']} is too old",
+            )
+
+
+def test_validator_with_result_cache(load_personinfo_schema, tmp_path):
+    cache = ResultCache(tmp_path / "results.sqlite")
+    instances = [{"id": "1", "age": 10}, {"id": "2", "age": 200}, {"id": "3", "age": 300}]
+    plugin = CountingValidationPlugin()
+    uncacheable_plugin = CountingValidationPlugin(cacheable=False)
+    runs = []
+    for changed_instances in (instances, instances, instances[:2] + [{"id": "3", "age": 30}]):
+        plugin.processed = []
+        uncacheable_plugin.processed = []
+        validator = Validator(load_personinfo_schema(), [plugin, uncacheable_plugin], result_cache=cache)
+        report = validator.validate_source(PassthroughLoader(changed_instances), "Person")
+        runs.append(([(r.instance_index, r.message) for r in report.results], plugin.processed))
+        assert uncacheable_plugin.processed == ["1", "2", "3"]
+        assert all(r.instance is changed_instances[r.instance_index] for r in report.results)
+    expected = [(1, "2 is too old"), (1, "2 is too old"), (2, "3 is too old"), (2, "3 is too old")]
+    assert runs[0] == (expected, ["1", "2", "3"])
+    assert runs[1] == (expected, [])
+    assert runs[2] == (expected[:2], ["3"])
+
+    # A different plugin configuration must not reuse the cached results
+    plugin.processed = []
+    plugin.threshold = 50
+    Validator(load_personinfo_schema(), [plugin], result_cache=cache).validate_source(
+        PassthroughLoader(instances), "Person"
+    )
+    assert plugin.processed == ["1", "2", "3"]
+
+
+@pytest.mark.parametrize("batch_size", [None, 2])
+def test_result_cache_keeps_plugin_order(load_personinfo_schema, tmp_path, batch_size):
+    cache = ResultCache(tmp_path / "results.sqlite")
+    instances = [{"id": str(i), "age": i * 100} for i in range(4)]
+    plugins = [CountingValidationPlugin(cacheable=False), CountingValidationPlugin(), CountingValidationPlugin(False)]
+    plugins[1].batch_size = batch_size
+    for plugin, name in zip(plugins, ["first", "second", "third"]):
+        plugin.name = name
+    runs = []
+    for _ in range(2):
+        for plugin in plugins:
+            plugin.processed = []
+        validator = Validator(load_personinfo_schema(), plugins, result_cache=cache)
+        report = validator.validate_source(PassthroughLoader(instances), "Person")
+        runs.append([(result.instance_index, result.type) for result in report.results])
+    assert runs[0] == runs[1] == [(i, name) for i in (2, 3) for name in ("first", "second", "third")]
+    assert cache.hits == 4
+
+
+def test_async_validator_with_result_cache(load_personinfo_schema, tmp_path):
+    cache = ResultCache(tmp_path / "results.sqlite")
+    instances = [{"id": str(i), "age": i * 50} for i in range(10)]
+    plugin = CountingValidationPlugin()
+    validator = Validator(load_personinfo_schema(), [plugin], result_cache=cache, chunk_size=3)
+    # The connection to the database is opened in this thread, and then used by the executor's threads
+    expected = validator.validate_source(PassthroughLoader(instances), "Person")
+    plugin.processed = []
+    report = asyncio.run(validator.avalidate_source(PassthroughLoader(instances), "Person"))
+    assert [(r.instance_index, r.message) for r in report.results] == [
+        (r.instance_index, r.message) for r in expected.results
+    ]
+    assert plugin.processed == []
+    assert cache.hits == len(instances)
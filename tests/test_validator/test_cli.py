@@ -52,6 +52,17 @@ def test_valid_csv_file(cli_runner, csv_data_file):
     assert result.exit_code == 0
 
 
+def test_csv_columns_decoded_by_schema(cli_runner, csv_data_file):
+    """Verify that CSV values are decoded according to the ranges of the target class' slots"""
+
+    # Without the schema, the phone number would be decoded as an integer
+    data_path = csv_data_file([{"id": "id:1", "full_name": "John Doe", "age": "35", "phone": "5555550"}])
+    result = cli_runner.invoke(cli, ["-s", PERSONINFO_SCHEMA, "-C", "Person", data_path])
+    assert result.exception is None
+    assert result.output == "No issues found\n"
+    assert result.exit_code == 0
+
+
 def test_valid_json_file_object(tmp_path, cli_runner, json_data_file):
     """Verify that a root-level object successfully validates against the tree_root class of the schema"""
 
@@ -94,6 +105,19 @@ def test_invalid_json(cli_runner, json_data_file):
     assert result.exit_code == 1
 
 
+def test_parallel_jobs(cli_runner, csv_data_file):
+    """Verify that instances can be validated by multiple worker processes"""
+
+    invalid_person = {**VALID_PERSON_1, "age": "asdf"}
+    data_path = csv_data_file([VALID_PERSON_1, invalid_person, VALID_PERSON_2, invalid_person])
+    result = cli_runner.invoke(cli, ["-s", PERSONINFO_SCHEMA, "-C", "Person", "--jobs", "2", data_path])
+    lines = result.output.splitlines()
+    assert len(lines) == 2
+    assert lines[0].startswith(f"[ERROR] [{data_path}/1]")
+    assert lines[1].startswith(f"[ERROR] [{data_path}/3]")
+    assert result.exit_code == 1
+
+
 def test_custom_plugin_config(tmp_path, cli_runner, csv_data_file):
     """Verify that a custom plugin set can be specified via a config file"""
 
@@ -185,3 +209,74 @@ def test_deprecated_arguments(csv_data_file, cli_runner):
     assert result.exception is None
     assert "Warning" in result.output
     assert "--include-range-class-descendants" in result.output
+
+
+def test_cache_dir(tmp_path, cli_runner, csv_data_file):
+    """Verify that generated JSON Schema is cached in the given directory"""
+
+    data_path = csv_data_file([VALID_PERSON_1])
+    cache_dir = tmp_path / "cache"
+    for _ in range(2):
+        result = cli_runner.invoke(
+            cli, ["-s", PERSONINFO_SCHEMA, "-C", "Person", "--cache-dir", str(cache_dir), data_path]
+        )
+        assert result.output == "No issues found\n"
+    assert len(list((cache_dir / "jsonschema").glob("*.json"))) == 1
+
+
+def test_result_cache(tmp_path, cli_runner, csv_data_file):
+    """Verify that validation results are cached and replayed, unless caching is disabled"""
+
+    invalid_person = {"id": "id:3", "full_name": "Jim Doe", "age": "old"}
+    data_path = csv_data_file([VALID_PERSON_1, invalid_person])
+    cache_dir = tmp_path / "cache"
+    args = ["-s", PERSONINFO_SCHEMA, "-C", "Person", "--cache-dir", str(cache_dir), "--result-cache", data_path]
+    outputs = [cli_runner.invoke(cli, args).output for _ in range(2)]
+    assert outputs[0] == outputs[1]
+    assert "'old' is not of type 'integer'" in outputs[0]
+    assert (cache_dir / "results.sqlite").exists()
+
+    no_cache_dir = tmp_path / "no_cache"
+    args = ["-s", PERSONINFO_SCHEMA, "-C", "Person", "--cache-dir", str(no_cache_dir), "--result-cache", "--no-cache"]
+    result = cli_runner.invoke(cli, args + [data_path])
+    assert result.output == outputs[0]
+    assert not no_cache_dir.exists()
+
+
+def test_stats(tmp_path, cli_runner, csv_data_file):
+    """Verify that timing statistics are written as JSON"""
+
+    data_path = csv_data_file([VALID_PERSON_1, VALID_PERSON_2])
+    profile_path = tmp_path / "profile.json"
+    result = cli_runner.invoke(
+        cli, ["-s", PERSONINFO_SCHEMA, "-C", "Person", "--profile-output", str(profile_path), data_path, data_path]
+    )
+    assert result.output == "No issues found\n"
+    profile = json.loads(profile_path.read_text())
+    assert profile["instances"] == 4
+    assert [loader["instances"] for loader in profile["loaders"]] == [2, 2]
+    assert profile["plugins"][0]["plugin"] == "JsonschemaValidationPlugin"
+    assert profile["plugins"][0]["instances"] == 4
+    assert profile["context"]["json_schema"]["calls"] == 1
+
+
+def test_max_errors(cli_runner, csv_data_file):
+    """Verify that validation stops after the maximum number of errors and a summary is shown"""
+
+    invalid_person = {**VALID_PERSON_1, "age": "asdf"}
+    data_path = csv_data_file([invalid_person, VALID_PERSON_2, invalid_person, invalid_person])
+    result = cli_runner.invoke(cli, ["-s", PERSONINFO_SCHEMA, "-C", "Person", "--max-errors", "2", data_path])
+    assert result.output.count("[ERROR]") == 2
+    # Instances after the last error are not examined, and nothing is extrapolated from the rest
+    assert f"[SUMMARY] [{data_path}] Examined 3 instances, 2 with errors (66.7%), stopped early" in result.output
+
+
+def test_sample_options_cannot_be_combined(cli_runner, csv_data_file):
+    """Verify that only one way of sampling can be chosen"""
+
+    data_path = csv_data_file([VALID_PERSON_1])
+    result = cli_runner.invoke(
+        cli, ["-s", PERSONINFO_SCHEMA, "-C", "Person", "--sample-rate", "0.5", "--sample-size", "1", data_path]
+    )
+    assert result.exit_code != 0
+    assert "cannot be combined" in result.output
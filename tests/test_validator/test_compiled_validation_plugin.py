@@ -0,0 +1,259 @@
+import time
+
+import pytest
+from linkml_runtime.linkml_model import SchemaDefinition
+from linkml_runtime.loaders import yaml_loader
+
+from linkml.validator.plugins import CompiledValidationPlugin, JsonschemaValidationPlugin
+from linkml.validator.validation_context import ValidationContext
+
+SCHEMA = """
+id: https://w3id.org/test/compiled
+name: compiled
+prefixes:
+  linkml: https://w3id.org/linkml/
+  ex: https://w3id.org/test/compiled/
+default_prefix: ex
+imports:
+  - linkml:types
+default_range: string
+enums:
+  Status:
+    permissible_values:
+      ACTIVE:
+      RETIRED:
+classes:
+  Registry:
+    tree_root: true
+    attributes:
+      people:
+        range: Person
+        multivalued: true
+        inlined: true
+      things:
+        range: Thing
+        multivalued: true
+        inlined_as_list: true
+  Person:
+    attributes:
+      id:
+        identifier: true
+      name:
+        required: true
+      age:
+        range: integer
+        minimum_value: 0
+        maximum_value: 150
+      email:
+        pattern: "^\\\\S+@\\\\S+$"
+      status:
+        range: Status
+      birth_date:
+        range: date
+      last_seen:
+        range: datetime
+      nicknames:
+        multivalued: true
+        maximum_cardinality: 2
+      friends:
+        range: Person
+        multivalued: true
+      best_friend:
+        range: Person
+      address:
+        range: Address
+        inlined: true
+      title:
+        equals_string_in:
+          - Dr
+          - Prof
+      score:
+        any_of:
+          - range: integer
+          - range: Status
+  Address:
+    attributes:
+      street:
+        required: true
+      city:
+  Thing:
+    attributes:
+      id:
+        identifier: true
+      type:
+        designates_type: true
+        range: string
+  Vehicle:
+    is_a: Thing
+    attributes:
+      wheels:
+        range: integer
+        required: true
+"""
+
+PERSON = {"name": "Alice"}
+
+
+@pytest.fixture(scope="module")
+def validation_context():
+    schema = yaml_loader.load(SCHEMA, SchemaDefinition)
+    return ValidationContext(schema, "Registry")
+
+
+def person(**kwargs):
+    return {"people": {"P:1": {**PERSON, **kwargs}}}
+
+
+@pytest.mark.parametrize(
+    "instance,valid",
+    [
+        ({}, True),
+        (person(), True),
+        ({"people": {"P:1": {}}}, False),
+        ({"people": [PERSON]}, False),
+        (person(age=42), True),
+        (person(age=-1), False),
+        (person(age=151), False),
+        (person(age="42"), False),
+        (person(age=True), False),
+        (person(age=42.0), True),
+        (person(age=42.5), False),
+        (person(email="alice@example.org"), True),
+        (person(email="alice"), False),
+        (person(status="ACTIVE"), True),
+        (person(status="active"), False),
+        (person(birth_date="2000-01-31"), True),
+        (person(birth_date="2000-01-32"), False),
+        (person(birth_date="20000131"), False),
+        (person(birth_date="2000-01-31T12:00:00Z"), False),
+        (person(last_seen="2000-01-31T12:00:00Z"), True),
+        (person(last_seen="2000-01-31t12:00:00.5+01:00"), True),
+        (person(last_seen="2000-01-31"), False),
+        (person(last_seen="2000-01-31T12:00:00"), False),
+        (person(last_seen="2000-01-31T24:00:00Z"), False),
+        (person(last_seen="2000-02-30T12:00:00Z"), False),
+        (person(nicknames=["Al"]), True),
+        (person(nicknames="Al"), False),
+        (person(nicknames=["A", "B", "C"]), False),
+        (person(friends=["P:2", "P:3"]), True),
+        (person(friends=[{"id": "P:2", "name": "Bob"}]), False),
+        (person(best_friend="P:2"), True),
+        (person(best_friend=1), False),
+        (person(address={"street": "Main Street"}), True),
+        (person(address={"city": "Springfield"}), False),
+        (person(address="Main Street"), False),
+        (person(title="Dr"), True),
+        (person(title="Mx"), False),
+        (person(title=["Dr"]), False),
+        (person(title={"Dr": 1}), False),
+        (person(score=1), True),
+        (person(score="RETIRED"), True),
+        (person(score="many"), False),
+        ({"things": [{"id": "T:1"}]}, True),
+        ({"things": [{"id": "T:1", "type": "Thing"}]}, True),
+        ({"things": [{"id": "T:1", "type": "Vehicle", "wheels": 4}]}, True),
+        ({"things": [{"id": "T:1", "type": "Vehicle"}]}, False),
+        ({"things": [{"id": "T:1", "type": "Spaceship"}]}, False),
+        ({"things": [{"type": "Thing"}]}, False),
+    ],
+)
+def test_instance(validation_context, instance, valid):
+    compiled_results = list(CompiledValidationPlugin().process(instance, validation_context))
+    jsonschema_results = list(JsonschemaValidationPlugin().process(instance, validation_context))
+    assert not compiled_results == valid
+    # Both plugins should agree on whether the instance is valid
+    assert not jsonschema_results == valid
+
+
+def test_locations(validation_context):
+    instance = {
+        "people": {"P:1": {"age": 200}},
+        "things": [{"id": "T:1"}, {"id": "T:2", "type": "Vehicle", "wheels": "four"}],
+    }
+    results = CompiledValidationPlugin().process(instance, validation_context)
+    assert [result.message for result in results] == [
+        "'name' is a required property in /people/P:1",
+        "200 is greater than the maximum of 150 in /people/P:1/age",
+        "'four' is not of type 'integer' in /things/1/wheels",
+    ]
+
+
+@pytest.mark.parametrize(
+    "instance,closed,valid",
+    [
+        ({"people": {"P:1": {**PERSON, "not_a_slot": 1}}}, False, True),
+        ({"people": {"P:1": {**PERSON, "not_a_slot": 1}}}, True, False),
+    ],
+)
+def test_instance_closed(validation_context, instance, closed, valid):
+    results = list(CompiledValidationPlugin(closed=closed).process(instance, validation_context))
+    assert not results == valid
+
+
+def _batch_messages(plugin, batch, context):
+    return [(result.instance_index, result.message) for result in plugin.process_batch(batch, context)]
+
+
+@pytest.mark.parametrize("closed", [False, True])
+def test_columns(closed):
+    """Validating a batch column by column should give the same results as instance by instance"""
+    schema = yaml_loader.load(SCHEMA, SchemaDefinition)
+    context = ValidationContext(schema, "Person")
+    instances = [
+        {"id": "P:1", "name": "Alice", "age": 42, "status": "ACTIVE"},
+        {"id": "P:2", "age": "42", "status": "active", "extra": 1},
+        {"id": "P:3", "name": "Carol", "age": True, "email": "carol", "nicknames": ["A", "B", "C"]},
+        "not an object",
+        {"id": "P:4", "name": "Dave", "age": 42, "status": "active", "email": "carol", "birth_date": "2000-01-32"},
+        {"id": "P:5", "name": "Eve", "age": 1, "address": {"city": "Springfield"}, "score": "many"},
+        {"id": "P:6", "name": "Frank", "age": 1.0, "title": ["Dr"]},
+        # Problems are reported in the order of the keys of each instance
+        {"status": "active", "extra": 2, "name": "Grace", "age": "42", "id": "P:7"},
+    ]
+    batch = list(enumerate(instances, start=10))
+    expected = _batch_messages(CompiledValidationPlugin(closed=closed), batch, context)
+    assert len(expected) > len(instances)
+    assert _batch_messages(CompiledValidationPlugin(closed=closed, batch_size=100), batch, context) == expected
+
+
+def test_columns_type_designator():
+    schema = yaml_loader.load(SCHEMA, SchemaDefinition)
+    context = ValidationContext(schema, "Thing")
+    batch = list(enumerate([{"id": "T:1", "type": "Vehicle"}, {"id": "T:2", "type": "Thing"}, {"type": "Spaceship"}]))
+    expected = _batch_messages(CompiledValidationPlugin(), batch, context)
+    assert [index for index, _ in expected] == [0, 2]
+    assert _batch_messages(CompiledValidationPlugin(batch_size=100), batch, context) == expected
+
+
+@pytest.mark.slow
+def test_benchmark(validation_context):
+    """Compare the time taken by the compiled and JSON Schema plugins on the same instances"""
+    instances = [
+        {
+            "people": {
+                f"P:{i}": {
+                    "name": f"Person {i}",
+                    "age": i * 10,
+                    "email": f"person{i}@example.org" if i % 7 else "invalid",
+                    "status": "ACTIVE",
+                    "nicknames": [f"P{i}"],
+                    "friends": [f"P:{i + 1}"],
+                    "address": {"street": f"{i} Main Street"},
+                }
+                for i in range(20)
+            },
+            "things": [{"id": f"T:{i}", "type": "Vehicle", "wheels": i % 5} for i in range(20)],
+        }
+        for _ in range(200)
+    ]
+    timings = {}
+    results = {}
+    for plugin in (CompiledValidationPlugin(), JsonschemaValidationPlugin()):
+        # Warm up artifacts cached on the context so only validation itself is timed
+        list(plugin.process(instances[0], validation_context))
+        start = time.perf_counter()
+        results[type(plugin)] = sum(len(list(plugin.process(instance, validation_context))) for instance in instances)
+        timings[type(plugin)] = time.perf_counter() - start
+    print(f"compiled: {timings[CompiledValidationPlugin]:.3f}s, jsonschema: {timings[JsonschemaValidationPlugin]:.3f}s")
+    # Timings depend on the machine, so only the results are compared
+    assert results[CompiledValidationPlugin] == results[JsonschemaValidationPlugin] > 0
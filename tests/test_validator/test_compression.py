@@ -0,0 +1,83 @@
+import bz2
+import gzip
+import json
+import lzma
+
+import pytest
+
+from linkml.validator.loaders import (
+    CsvLoader,
+    JsonLinesLoader,
+    JsonLoader,
+    TsvLoader,
+    YamlLoader,
+    default_loader_for_file,
+)
+from linkml.validator.loaders.compression import detect_compression, open_source, split_compression_extension
+
+COMPRESSORS = {
+    "gz": gzip.compress,
+    "bz2": bz2.compress,
+    "xz": lzma.compress,
+}
+
+DATA = [{"id": "a", "value": 1}, {"id": "b", "value": 2}]
+
+
+@pytest.fixture
+def compressed_file_factory(tmp_path):
+    def factory(filename, contents, compression):
+        file_path = tmp_path / filename
+        file_path.write_bytes(COMPRESSORS[compression](contents.encode()))
+        return str(file_path)
+
+    return factory
+
+
+@pytest.mark.parametrize("compression", COMPRESSORS.keys())
+@pytest.mark.parametrize(
+    "filename,contents,loader_cls",
+    [
+        ("data.csv", "id,value\na,1\nb,2\n", CsvLoader),
+        ("data.tsv", "id\tvalue\na\t1\nb\t2\n", TsvLoader),
+        ("data.json", json.dumps(DATA), JsonLoader),
+        ("data.jsonl", "\n".join(json.dumps(d) for d in DATA), JsonLinesLoader),
+        ("data.yaml", "- id: a\n  value: 1\n- id: b\n  value: 2\n", YamlLoader),
+    ],
+)
+def test_default_loader_for_compressed_file(filename, contents, loader_cls, compression, compressed_file_factory):
+    path = compressed_file_factory(f"{filename}.{compression}", contents, compression)
+    loader = default_loader_for_file(path)
+    assert isinstance(loader, loader_cls)
+    assert list(loader.iter_instances()) == DATA
+
+
+@pytest.mark.parametrize("compression", COMPRESSORS.keys())
+def test_detect_compression_from_magic_bytes(compression, compressed_file_factory):
+    path = compressed_file_factory("data.json", json.dumps(DATA), compression)
+    assert detect_compression(path) == {"gz": "gzip"}.get(compression, compression)
+    assert list(JsonLoader(path).iter_instances()) == DATA
+    assert list(JsonLoader(path, streaming=True).iter_instances()) == DATA
+
+
+def test_uncompressed_file(tmp_file_factory):
+    path = tmp_file_factory("data.json", json.dumps(DATA))
+    assert detect_compression(path) is None
+    with open_source(path) as file:
+        assert json.load(file) == DATA
+
+
+def test_split_compression_extension():
+    assert split_compression_extension("data.tsv.gz") == ("data.tsv", "gzip")
+    assert split_compression_extension("data.yaml.bz2") == ("data.yaml", "bz2")
+    assert split_compression_extension("data.jsonl.xz") == ("data.jsonl", "xz")
+    assert split_compression_extension("data.tsv") == ("data.tsv", None)
+
+
+def test_compressed_json_lines_line_numbers(compressed_file_factory):
+    path = compressed_file_factory("data.jsonl.gz", '{"id": "a"}\n\n{"id": "b"}\n', "gz")
+    loader = JsonLinesLoader(path)
+    assert not loader.splittable
+    assert list(loader.iter_indexed_instances()) == [(0, {"id": "a"}), (2, {"id": "b"})]
+    with pytest.raises(ValueError):
+        list(loader.iter_byte_ranges())
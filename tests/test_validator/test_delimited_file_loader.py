@@ -1,4 +1,5 @@
 import pytest
+from linkml_runtime import SchemaView
 
 from linkml.validator.loaders import CsvLoader, TsvLoader
 
@@ -72,3 +73,111 @@ d, e, f
     assert next(instances) == {"one": "d", "two": "e", "three": "f"}
     with pytest.raises(StopIteration):
         next(instances)
+
+
+SCHEMA_AWARE_SCHEMA = """
+id: http://example.org/schema_aware_loading
+name: schema_aware_loading
+prefixes:
+  linkml: https://w3id.org/linkml/
+imports:
+  - linkml:types
+default_range: string
+types:
+  Count:
+    typeof: integer
+enums:
+  Status:
+    permissible_values:
+      "1":
+      active:
+classes:
+  Thing:
+    attributes:
+      zip_code:
+      count:
+        range: Count
+      score:
+        range: float
+      flag:
+        range: boolean
+      born:
+        range: date
+      status:
+        range: Status
+      tags:
+        multivalued: true
+      numbers:
+        range: integer
+        multivalued: true
+  Container:
+    tree_root: true
+    attributes:
+      things:
+        range: Thing
+        multivalued: true
+        inlined_as_list: true
+"""
+
+
+@pytest.fixture
+def schema_aware_view(tmp_file_factory):
+    return SchemaView(tmp_file_factory("schema.yaml", SCHEMA_AWARE_SCHEMA))
+
+
+@pytest.mark.parametrize("delimiter,loader_cls", [(",", CsvLoader), ("\t", TsvLoader)])
+def test_load_with_schema(delimiter, loader_cls, schema_aware_view, tmp_file_factory):
+    columns = ("zip_code", "count", "score", "flag", "born", "status", "tags", "numbers", "extra")
+    values = ("02134", "7", "1.5", "yes", "2000-01-01", "1", "[a|b]", "1|2|x", "42")
+    data = "\n".join((delimiter.join(columns), delimiter.join(values)))
+    f = tmp_file_factory("data", data)
+    loader = loader_cls(f, schema_view=schema_aware_view, target_class="Thing")
+    instances = loader.iter_instances()
+    assert next(instances) == {
+        "zip_code": "02134",
+        "count": 7,
+        "score": 1.5,
+        "flag": True,
+        "born": "2000-01-01",
+        "status": "1",
+        "tags": ["a", "b"],
+        "numbers": [1, 2, "x"],
+        "extra": "42",
+    }
+    with pytest.raises(StopIteration):
+        next(instances)
+
+
+def test_load_with_schema_unparseable_values(schema_aware_view, tmp_file_factory):
+    data = """count,score,flag
+many,lots,maybe
+"""
+    csv_file = tmp_file_factory("data", data)
+    loader = CsvLoader(csv_file, schema_view=schema_aware_view, target_class="Thing")
+    assert list(loader.iter_instances()) == [{"count": "many", "score": "lots", "flag": "maybe"}]
+
+
+@pytest.mark.parametrize(
+    "count,score,expected",
+    [
+        ("-3", "+2.5e3", {"count": -3, "score": 2500.0}),
+        ("1_000", "1_000.5", {"count": "1_000", "score": "1_000.5"}),
+        (" 7", "nan", {"count": " 7", "score": "nan"}),
+        ("0x10", "inf", {"count": "0x10", "score": "inf"}),
+        ("٣", "1e400", {"count": "٣", "score": "1e400"}),
+        ("7.0", ".5", {"count": "7.0", "score": 0.5}),
+    ],
+)
+def test_load_with_schema_strict_numbers(schema_aware_view, tmp_file_factory, count, score, expected):
+    csv_file = tmp_file_factory("data", f'count,score\n"{count}",{score}\n')
+    loader = CsvLoader(csv_file, schema_view=schema_aware_view, target_class="Thing")
+    assert list(loader.iter_instances()) == [expected]
+
+
+def test_load_with_schema_index_slot(schema_aware_view, tmp_file_factory):
+    data = """zip_code,count
+01234,1
+"""
+    csv_file = tmp_file_factory("data", data)
+    loader = CsvLoader(csv_file, index_slot_name="things", schema_view=schema_aware_view)
+    assert list(loader.iter_instances()) == [{"things": [{"zip_code": "01234", "count": 1}]}]
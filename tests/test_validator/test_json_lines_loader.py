@@ -0,0 +1,68 @@
+import asyncio
+import json
+
+import pytest
+
+from linkml.validator.loaders import JsonLinesLoader, default_loader_for_file
+
+
+def _jsonl(*objects) -> str:
+    return "".join(json.dumps(obj) + "\n" if obj is not None else "\n" for obj in objects)
+
+
+def test_load(tmp_file_factory):
+    test_data = [{"id": 1}, {"id": 2, "list": [1, 2]}, {"id": 3, "nested": {"a": "b"}}]
+    jsonl_file = tmp_file_factory("data.jsonl", _jsonl(*test_data))
+
+    loader = JsonLinesLoader(jsonl_file)
+    assert list(loader.iter_instances()) == test_data
+
+
+def test_line_numbers_as_index(tmp_file_factory):
+    jsonl_file = tmp_file_factory("data.jsonl", _jsonl({"id": 1}, None, {"id": 2}, None) + '{"id": 3}')
+
+    loader = JsonLinesLoader(jsonl_file)
+    assert list(loader.iter_indexed_instances()) == [(0, {"id": 1}), (2, {"id": 2}), (4, {"id": 3})]
+
+
+def test_async_iteration(tmp_file_factory):
+    jsonl_file = tmp_file_factory("data.jsonl", _jsonl(*({"id": i} for i in range(10)), None, {"id": 10}))
+
+    async def load():
+        return [item async for item in JsonLinesLoader(jsonl_file).aiter_indexed_instances(chunk_size=3)]
+
+    assert asyncio.run(load()) == list(JsonLinesLoader(jsonl_file).iter_indexed_instances())
+
+
+def test_empty_file(tmp_file_factory):
+    jsonl_file = tmp_file_factory("data.jsonl", "")
+
+    loader = JsonLinesLoader(jsonl_file)
+    assert list(loader.iter_instances()) == []
+    assert list(loader.iter_byte_ranges()) == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 10, 25, 1000])
+def test_byte_ranges(chunk_size, tmp_file_factory):
+    test_data = [{"id": i, "text": "x" * (i % 7)} for i in range(50)]
+    jsonl_file = tmp_file_factory("data.jsonl", _jsonl(*test_data))
+
+    loader = JsonLinesLoader(jsonl_file, chunk_size=chunk_size)
+    byte_ranges = list(loader.iter_byte_ranges())
+    instances = [pair for byte_range in byte_ranges for pair in loader.iter_indexed_instances(byte_range)]
+    assert instances == list(enumerate(test_data))
+    if chunk_size == 1:
+        assert len(byte_ranges) == len(test_data)
+
+
+def test_invalid_line(tmp_file_factory):
+    jsonl_file = tmp_file_factory("data.jsonl", '{"id": 1}\n{"id": \n')
+
+    loader = JsonLinesLoader(jsonl_file)
+    with pytest.raises(ValueError, match="line 2"):
+        list(loader.iter_instances())
+
+
+@pytest.mark.parametrize("filename", ["data.jsonl", "data.ndjson"])
+def test_default_loader(filename):
+    assert isinstance(default_loader_for_file(filename), JsonLinesLoader)
@@ -31,3 +31,49 @@ def test_load_list_of_objects(tmp_file_factory):
     assert next(instances) == test_data[1]
     with pytest.raises(StopIteration):
         next(instances)
+
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_load_list_of_objects_with_json_pointer(streaming, tmp_file_factory):
+    test_data = {
+        "name": "container",
+        "skipped": [{"id": 0, "nested": {"text": 'with "quotes" and [brackets]'}}],
+        "persons": [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}],
+    }
+    json_file = tmp_file_factory("data.json", json.dumps(test_data, indent=2))
+
+    loader = JsonLoader(json_file, streaming=streaming, json_pointer="/persons")
+    assert list(loader.iter_instances()) == test_data["persons"]
+
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_load_with_nested_json_pointer(streaming, tmp_file_factory):
+    test_data = [{"id": 1}, {"a/b": {"items": [{"id": 2}, {"id": 3}]}}]
+    json_file = tmp_file_factory("data.json", json.dumps(test_data))
+
+    loader = JsonLoader(json_file, streaming=streaming, json_pointer="/1/a~1b/items")
+    assert list(loader.iter_instances()) == [{"id": 2}, {"id": 3}]
+
+
+def test_streaming_load(tmp_file_factory):
+    test_data = [{"id": i, "value": i * 1.5, "text": "x" * i} for i in range(500)]
+    json_file = tmp_file_factory("data.json", json.dumps(test_data))
+
+    loader = JsonLoader(json_file, streaming=True)
+    assert list(loader.iter_instances()) == test_data
+
+
+def test_streaming_load_object(tmp_file_factory):
+    test_data = {"hello": "world", "number": 1}
+    json_file = tmp_file_factory("data.json", json.dumps(test_data))
+
+    loader = JsonLoader(json_file, streaming=True)
+    assert list(loader.iter_instances()) == [test_data]
+
+
+def test_streaming_missing_json_pointer(tmp_file_factory):
+    json_file = tmp_file_factory("data.json", json.dumps({"persons": []}))
+
+    loader = JsonLoader(json_file, streaming=True, json_pointer="/organizations")
+    with pytest.raises(ValueError, match="organizations"):
+        list(loader.iter_instances())
@@ -0,0 +1,113 @@
+import pytest
+from linkml_runtime import SchemaView
+from linkml_runtime.linkml_model import SchemaDefinition
+from linkml_runtime.loaders import yaml_loader
+
+from linkml.validator import Validator
+from linkml.validator.loaders import NTriplesLoader
+from linkml.validator.plugins import JsonschemaValidationPlugin
+
+SCHEMA = """id: https://w3id.org/test/ntriples
+name: ntriples
+prefixes:
+  linkml: https://w3id.org/linkml/
+  ex: https://example.org/
+  schema: http://schema.org/
+imports:
+  - linkml:types
+default_prefix: ex
+default_range: string
+classes:
+  Person:
+    class_uri: schema:Person
+    attributes:
+      id:
+        identifier: true
+      name:
+        slot_uri: schema:name
+        required: true
+      age:
+        range: integer
+      active:
+        range: boolean
+      aliases:
+        multivalued: true
+      employer:
+        range: Organization
+      homepage:
+        range: uri
+  Employee:
+    is_a: Person
+  Organization:
+    attributes:
+      id:
+        identifier: true
+"""
+
+DATA = r"""# Sorted by subject
+<https://example.org/o1> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <https://example.org/Organization> .
+<https://example.org/p1> <http://schema.org/name> "Ada \"the Countess\"!"@en .
+<https://example.org/p1> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://schema.org/Person> .
+<https://example.org/p1> <https://example.org/age> "36"^^<http://www.w3.org/2001/XMLSchema#integer> .
+<https://example.org/p1> <https://example.org/aliases> "A" .
+<https://example.org/p1> <https://example.org/aliases> "Countess" .
+<https://example.org/p1> <https://example.org/employer> <https://example.org/o1> .
+<https://example.org/p1> <https://example.org/homepage> <https://example.org/ada> .
+
+_:b0 <http://schema.org/name> "Charles" .
+_:b0 <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <https://example.org/Employee> .
+_:b0 <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://schema.org/Person> .
+_:b0 <https://example.org/active> "true"^^<http://www.w3.org/2001/XMLSchema#boolean> .
+_:b0 <https://example.org/age> "fifty" .
+_:b0 <https://example.org/nickname> "Babbage" .
+"""
+
+
+@pytest.fixture(scope="module")
+def schema():
+    return yaml_loader.load(SCHEMA, SchemaDefinition)
+
+
+@pytest.mark.parametrize("quads", [False, True])
+def test_load(schema, tmp_path, quads):
+    data = DATA
+    if quads:
+        data = data.replace(" .\n", " <https://example.org/graph> .\n")
+    data_path = tmp_path / ("data.nq" if quads else "data.nt")
+    data_path.write_text(data)
+    loader = NTriplesLoader(data_path, schema, "Person")
+    assert list(loader.iter_indexed_instances()) == [
+        (
+            2,
+            {
+                "id": "ex:p1",
+                "name": 'Ada "the Countess"!',
+                "age": 36,
+                "aliases": ["A", "Countess"],
+                "employer": "ex:o1",
+                "homepage": "https://example.org/ada",
+            },
+        ),
+        (10, {"id": "_:b0", "name": "Charles", "active": True, "age": "fifty", "ex:nickname": "Babbage"}),
+    ]
+    assert [
+        instance["id"] for instance in NTriplesLoader(data_path, SchemaView(schema), "Employee").iter_instances()
+    ] == ["_:b0"]
+
+
+def test_validate(schema, tmp_path):
+    data_path = tmp_path / "data.nt"
+    data_path.write_text(DATA)
+    validator = Validator(schema, [JsonschemaValidationPlugin(closed=True)])
+    report = validator.validate_source(NTriplesLoader(data_path, schema, "Person"), "Person")
+    assert [(result.instance_index, result.message) for result in report.results] == [
+        (10, "Additional properties are not allowed ('ex:nickname' was unexpected) in /"),
+        (10, "'fifty' is not of type 'integer', 'null' in /age"),
+    ]
+
+
+def test_invalid_statement(schema, tmp_path):
+    data_path = tmp_path / "data.nt"
+    data_path.write_text('<https://example.org/p1> "name" "Ada" .\n')
+    with pytest.raises(ValueError, match="line 1"):
+        list(NTriplesLoader(data_path, schema, "Person").iter_instances())
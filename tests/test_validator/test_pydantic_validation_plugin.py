@@ -1,5 +1,9 @@
+import json
+
 import pytest
 
+from linkml.validator import Validator
+from linkml.validator.loaders import JsonLinesLoader
 from linkml.validator.plugins.pydantic_validation_plugin import PydanticValidationPlugin
 
 
@@ -50,3 +54,62 @@ def test_instance_closed(validation_context, instance, closed, valid):
         assert not results
     else:
         assert len(results) == 1
+
+
+BATCH = [
+    {"id": "1", "full_name": "Person One"},
+    {},
+    {"id": "3", "full_name": "Person Three", "aliases": "Person 3"},
+    {"id": "4", "full_name": "Person Four", "age": "old"},
+]
+
+
+def test_batch(validation_context):
+    plugin = PydanticValidationPlugin(batch_size=10)
+    results = list(plugin.process_batch(list(enumerate(BATCH)), validation_context))
+    assert [(result.instance_index, result.message) for result in results] == [
+        (1, "Field required in /id"),
+        (1, "Field required in /full_name"),
+        (2, "Input should be a valid list in /aliases"),
+        (3, "Input should be a valid integer, unable to parse string as an integer in /age"),
+    ]
+    assert results[2].instance == BATCH[2]
+
+
+def test_batch_from_json(validation_context):
+    plugin = PydanticValidationPlugin(batch_size=10, from_json=True)
+    batch = [(index, json.dumps(instance).encode()) for index, instance in enumerate(BATCH)]
+    results = list(plugin.process_batch(batch, validation_context))
+    expected = list(PydanticValidationPlugin(batch_size=10).process_batch(list(enumerate(BATCH)), validation_context))
+    # Pydantic words some messages differently for JSON input, so only compare error locations
+    assert [(r.instance_index, r.message.split(" in ")[-1], r.instance) for r in results] == [
+        (r.instance_index, r.message.split(" in ")[-1], r.instance) for r in expected
+    ]
+
+
+def test_batch_from_json_malformed(validation_context):
+    plugin = PydanticValidationPlugin(batch_size=10, from_json=True)
+    batch = [(0, b'{"id": "1", "full_name": "Person One"}'), (1, b'{"id": "2",'), (2, b"{}")]
+    results = list(plugin.process_batch(batch, validation_context))
+    assert [result.instance_index for result in results] == [1, 2, 2]
+    assert results[0].instance == b'{"id": "2",'
+    assert results[0].message.startswith("Invalid JSON")
+
+
+@pytest.mark.parametrize("last,indices", [(b'{"id": "3", "full_name": "Person Three"}', []), (b"{}", [2, 2])])
+def test_batch_from_json_several_documents(validation_context, last, indices):
+    plugin = PydanticValidationPlugin(batch_size=10, from_json=True)
+    valid = b'{"id": "1", "full_name": "Person One"}'
+    batch = [(0, valid + b", " + valid), (1, valid), (2, last)]
+    results = list(plugin.process_batch(batch, validation_context))
+    assert results[0].instance_index == 0
+    assert results[0].message.startswith("Invalid JSON")
+    assert [result.instance_index for result in results[1:]] == indices
+
+
+def test_validate_json_lines_raw(tmp_file_factory, validation_context):
+    lines = "".join(json.dumps(instance) + "\n" for instance in BATCH)
+    loader = JsonLinesLoader(tmp_file_factory("data.jsonl", lines), raw=True)
+    validator = Validator(validation_context._schema, [PydanticValidationPlugin(batch_size=3, from_json=True)])
+    results = list(validator.iter_results_from_source(loader, validation_context.target_class))
+    assert [result.instance_index for result in results] == [1, 1, 2, 3]
@@ -122,3 +122,31 @@ def test_missing_recommended_inlined_as_list(validation_context):
     assert next(result_iter).message == "Slot 'value1' is recommended on class 'Inlined' in /nested_inline_list/2"
     with pytest.raises(StopIteration):
         next(result_iter)
+
+
+def test_missing_recommended_in_siblings(validation_context):
+    """Locations of results in sibling objects should not include each other's slots"""
+
+    plugin = RecommendedSlotsPlugin()
+    instance = {
+        "nested": {"nonrec": "foo"},
+        "nested_inline_list": [{"id": "a", "value2": "1"}],
+    }
+    messages = [result.message for result in plugin.process(instance, validation_context)]
+    assert messages == [
+        "Slot 'rec' is recommended on class 'Object' in /",
+        "Slot 'rec' is recommended on class 'Object' in /nested",
+        "Slot 'value1' is recommended on class 'Inlined' in /nested_inline_list/0",
+    ]
+
+
+def test_deeply_nested(validation_context):
+    """Deeply nested data should not exceed the recursion limit"""
+
+    plugin = RecommendedSlotsPlugin()
+    instance = {"nonrec": "bottom"}
+    for _ in range(5000):
+        instance = {"rec": "foo", "nested": instance}
+    results = list(plugin.process(instance, validation_context))
+    assert len(results) == 1
+    assert results[0].message.endswith("/nested" * 5000)
@@ -0,0 +1,165 @@
+import asyncio
+import json
+import sqlite3
+
+import pytest
+from linkml_runtime.linkml_model import SchemaDefinition
+from linkml_runtime.loaders import yaml_loader
+
+from linkml.validator import Validator
+from linkml.validator.loaders import JsonLinesLoader
+from linkml.validator.plugins import JsonschemaValidationPlugin, ReferentialIntegrityPlugin
+from linkml.validator.report import Severity
+
+SCHEMA = """id: https://w3id.org/test/referential_integrity
+name: referential_integrity
+prefixes:
+  xsd: http://www.w3.org/2001/XMLSchema#
+default_range: string
+types:
+  string:
+    uri: xsd:string
+    base: str
+classes:
+  Thing:
+    attributes:
+      id:
+        identifier: true
+  Person:
+    is_a: Thing
+    attributes:
+      employer:
+        range: Organization
+      friends:
+        range: Person
+        multivalued: true
+      addresses:
+        range: Address
+        multivalued: true
+        inlined: true
+  Organization:
+    is_a: Thing
+  Company:
+    is_a: Organization
+  Address:
+    attributes:
+      label:
+        identifier: true
+      owner:
+        range: Person
+"""
+
+
+@pytest.fixture(scope="module")
+def schema():
+    return yaml_loader.load(SCHEMA, SchemaDefinition)
+
+
+def _person_data(tmp_path, persons, name="persons.jsonl"):
+    data_path = tmp_path / name
+    data_path.write_text("".join(json.dumps(person) + "\n" for person in persons))
+    return data_path
+
+
+def _messages(report):
+    return [(result.instance_index, result.message) for result in report.results]
+
+
+def test_dangling_references(schema, tmp_path):
+    validator = Validator(schema, [ReferentialIntegrityPlugin()])
+    persons = [
+        # Forward references to objects later in the data resolve
+        {"id": "p:1", "employer": "o:1", "friends": ["p:2", "p:3"]},
+        {"id": "p:2", "addresses": {"home": {"owner": "p:1"}, "work": {"owner": "p:9"}}},
+        {"id": "o:1"},
+    ]
+    report = validator.validate_source(JsonLinesLoader(_person_data(tmp_path, persons)), "Person")
+    assert _messages(report) == [
+        (0, "Reference 'o:1' in /employer does not resolve to an object of class 'Organization'"),
+        (0, "Reference 'p:3' in /friends/1 does not resolve to an object of class 'Person'"),
+        (1, "Reference 'p:9' in /addresses/work/owner does not resolve to an object of class 'Person'"),
+    ]
+    assert all(result.severity == Severity.ERROR for result in report.results)
+    assert all(result.type == "referential integrity" for result in report.results)
+
+
+def test_objects_of_descendant_classes(schema, tmp_path):
+    index_path = tmp_path / "index.sqlite"
+    validator = Validator(schema, [ReferentialIntegrityPlugin(index_path)])
+    assert validator.validate({"id": "c:1"}, "Company").results == []
+    # A Company is an Organization, but a Person is not
+    report = validator.validate({"id": "p:1", "employer": "c:1", "friends": ["c:1"]}, "Person")
+    assert _messages(report) == [(0, "Reference 'c:1' in /friends/0 does not resolve to an object of class 'Person'")]
+
+
+def test_temporary_index_is_emptied_after_each_run(schema):
+    validator = Validator(schema, [ReferentialIntegrityPlugin()])
+    assert validator.validate({"id": "p:1", "friends": ["p:1"]}, "Person").results == []
+    assert len(validator.validate({"id": "p:2", "friends": ["p:1"]}, "Person").results) == 1
+
+
+def test_persistent_index(schema, tmp_path):
+    index_path = tmp_path / "index.sqlite"
+    validator = Validator(schema, [ReferentialIntegrityPlugin(index_path)])
+    assert validator.validate({"id": "o:1"}, "Company").results == []
+
+    # Identifiers are kept for later runs, including those of other plugin instances
+    plugin = ReferentialIntegrityPlugin(index_path)
+    validator = Validator(schema, [plugin])
+    assert validator.validate({"id": "p:1", "employer": "o:1"}, "Person").results == []
+
+    plugin.clear()
+    assert len(validator.validate({"id": "p:1", "employer": "o:1"}, "Person").results) == 1
+    plugin.close()
+
+
+def test_sources(schema, tmp_path):
+    organizations_path = tmp_path / "organizations.yaml"
+    organizations_path.write_text("- id: o:1\n- id: o:2\n")
+    plugin = ReferentialIntegrityPlugin(sources={str(organizations_path): "Company"})
+    validator = Validator(schema, [plugin])
+    persons = [{"id": "p:1", "employer": "o:1"}, {"id": "p:2", "employer": "o:3"}]
+    for _ in range(2):
+        report = validator.validate_source(JsonLinesLoader(_person_data(tmp_path, persons)), "Person")
+        assert _messages(report) == [
+            (1, "Reference 'o:3' in /employer does not resolve to an object of class 'Organization'")
+        ]
+
+
+def test_parallel_workers(schema, tmp_path):
+    persons = [{"id": f"p:{i}", "friends": [f"p:{i + 1}"]} for i in range(50)]
+    data_path = _person_data(tmp_path, persons)
+    validator = Validator(schema, [ReferentialIntegrityPlugin(batch_size=7)], workers=2, chunk_size=10)
+    report = validator.validate_source(JsonLinesLoader(data_path), "Person")
+    assert _messages(report) == [(49, "Reference 'p:50' in /friends/0 does not resolve to an object of class 'Person'")]
+
+
+def test_stops_after_failure(schema):
+    validator = Validator(schema, [ReferentialIntegrityPlugin()], strict=True)
+    report = validator.validate({"id": "p:1", "friends": ["p:2", "p:3"]}, "Person")
+    assert len(report.results) == 1
+    # The references of the run are removed even though not all of them were reported
+    assert validator.validate({"id": "p:1"}, "Person").results == []
+
+
+def test_index_emptied_when_validation_stops_before_post_processing(schema, tmp_path):
+    plugin = ReferentialIntegrityPlugin()
+    validator = Validator(schema, [JsonschemaValidationPlugin(closed=True), plugin], max_errors=1)
+    persons = [{"id": "p:1", "friends": ["p:9"], "unknown": 1}, {"id": "p:2"}]
+    report = validator.validate_source(JsonLinesLoader(_person_data(tmp_path, persons)), "Person")
+    assert len(report.results) == 1
+    with sqlite3.connect(plugin.index_path) as connection:
+        assert connection.execute("SELECT count(*) FROM refs").fetchone() == (0,)
+        assert connection.execute("SELECT count(*) FROM identifiers").fetchone() == (0,)
+    connection.close()
+
+
+def test_async_validation(schema, tmp_path):
+    persons = [{"id": f"p:{i}", "friends": [f"p:{i + 1}"]} for i in range(20)]
+    data_path = _person_data(tmp_path, persons)
+    validator = Validator(schema, [ReferentialIntegrityPlugin(batch_size=3)], chunk_size=5)
+    # The connection to the index is opened in this thread, and then used by the executor's threads
+    expected = _messages(validator.validate_source(JsonLinesLoader(data_path), "Person"))
+    report = asyncio.run(validator.avalidate_source(JsonLinesLoader(data_path), "Person"))
+    assert _messages(report) == expected
+    assert expected == [(19, "Reference 'p:20' in /friends/0 does not resolve to an object of class 'Person'")]
@@ -0,0 +1,144 @@
+import csv
+import socket
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from linkml.validator.cli import cli
+from linkml.validator.server import ValidationServer, forward, parse_address, send_request
+
+PERSONINFO_SCHEMA = str(Path(__file__).parent / "input/personinfo.yaml")
+VALID_PERSON = {"id": "id:1", "full_name": "John Doe", "age": 35}
+INVALID_PERSON = {"id": "id:2", "full_name": "Jane Smith", "age": "asdf"}
+
+
+@pytest.fixture
+def validation_server():
+    server = ValidationServer("localhost:0")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.close()
+    thread.join()
+
+
+@pytest.fixture
+def csv_data_file(tmp_path):
+    data_path = tmp_path / "data.csv"
+    with open(data_path, "w") as data_file:
+        writer = csv.DictWriter(data_file, ["id", "full_name", "age"])
+        writer.writeheader()
+        writer.writerows([VALID_PERSON, INVALID_PERSON])
+    return data_path
+
+
+def test_parse_address():
+    assert parse_address("8765") == (socket.AF_INET, ("localhost", 8765))
+    assert parse_address("127.0.0.1:9000") == (socket.AF_INET, ("127.0.0.1", 9000))
+    assert parse_address("unix:/tmp/linkml.sock") == (socket.AF_UNIX, "/tmp/linkml.sock")
+    with pytest.raises(ValueError):
+        parse_address("localhost")
+
+
+def test_inline_instances(validation_server):
+    request = {"schema": PERSONINFO_SCHEMA, "target_class": "Person", "instances": [VALID_PERSON, INVALID_PERSON]}
+    response = send_request(validation_server.address, request)
+    assert response["exit_code"] == 1
+    [result] = response["results"]
+    assert result["instance_index"] == 1
+    assert result["instance"] == INVALID_PERSON
+    assert "'asdf' is not of type 'integer'" in result["message"]
+
+    send_request(validation_server.address, request)
+    info = validation_server.validators.info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_invalid_request(validation_server):
+    response = send_request(validation_server.address, {"instances": []})
+    assert response["exit_code"] == 2
+    assert "error" in response
+
+
+def test_forward_cli(validation_server, csv_data_file):
+    runner = CliRunner()
+    args = ["-s", PERSONINFO_SCHEMA, "-C", "Person", str(csv_data_file)]
+    local = runner.invoke(cli, args)
+    for _ in range(2):
+        forwarded = runner.invoke(cli, ["--server", validation_server.address] + args)
+        assert forwarded.output == local.output
+        assert forwarded.exit_code == local.exit_code == 1
+    info = validation_server.validators.info()
+    assert (info.hits, info.misses) == (1, 1)
+
+    # A validator with different options shares the validation context of the first one
+    runner.invoke(cli, ["--server", validation_server.address, "--max-errors", "10"] + args)
+    assert validation_server.validators.info().misses == 2
+    assert validation_server.contexts.info().currsize == 1
+
+
+def test_forward_relative_paths(validation_server, csv_data_file, monkeypatch):
+    monkeypatch.chdir(csv_data_file.parent)
+    response = forward(validation_server.address, ["-s", PERSONINFO_SCHEMA, "-C", "Person", csv_data_file.name])
+    assert response["exit_code"] == 1
+    assert response["output"].startswith(f"[ERROR] [{csv_data_file.name}/1]")
+
+
+# Reports whether the validator was imported by the linkml-validate entry point
+ENTRY_POINT = """
+import atexit, sys
+atexit.register(lambda: print("imported" if "linkml.validator" in sys.modules else "not imported", file=sys.stderr))
+from linkml.utils.validation_client import main
+main()
+"""
+
+
+@pytest.mark.parametrize("running", [True, False])
+def test_entry_point(validation_server, csv_data_file, tmp_path, running):
+    address = validation_server.address if running else f"unix:{tmp_path / 'missing.sock'}"
+    args = ["--server", address, "-s", PERSONINFO_SCHEMA, "-C", "Person", str(csv_data_file)]
+    completed = subprocess.run([sys.executable, "-c", ENTRY_POINT, *args], capture_output=True, text=True)
+    assert completed.returncode == 1
+    assert completed.stdout.startswith(f"[ERROR] [{csv_data_file}/1]")
+    # Forwarded invocations do not import the validator
+    assert completed.stderr.splitlines()[-1] == ("not imported" if running else "imported")
+
+
+def test_no_server_running(tmp_path, csv_data_file):
+    address = f"unix:{tmp_path / 'missing.sock'}"
+    assert forward(address, ["--help"]) is None
+
+    result = CliRunner().invoke(cli, ["--server", address, "-s", PERSONINFO_SCHEMA, "-C", "Person", str(csv_data_file)])
+    assert result.output.startswith(f"[ERROR] [{csv_data_file}/1]")
+    assert result.exit_code == 1
+
+
+def test_unix_socket(tmp_path):
+    server = ValidationServer(f"unix:{tmp_path / 'linkml.sock'}")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        request = {"schema": PERSONINFO_SCHEMA, "target_class": "Person", "instances": [VALID_PERSON]}
+        assert send_request(server.address, request) == {"results": [], "exit_code": 0}
+    finally:
+        server.shutdown()
+        server.close()
+        thread.join()
+    assert not (tmp_path / "linkml.sock").exists()
+
+
+def test_remote_clients_not_allowed_by_default():
+    with pytest.raises(ValueError, match="not a loopback address"):
+        ValidationServer("0.0.0.0:0")
+    result = CliRunner().invoke(cli, ["--serve", "0.0.0.0:0"])
+    assert result.exit_code == 1
+    assert "not a loopback address" in result.output
+
+    server = ValidationServer("0.0.0.0:0", allow_remote=True)
+    server.close()
+    ValidationServer("127.0.0.1:0").close()
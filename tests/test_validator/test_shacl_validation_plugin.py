@@ -0,0 +1,96 @@
+import re
+
+import pytest
+import rdflib
+
+from linkml.validator import Validator
+from linkml.validator.loaders.passthrough_loader import PassthroughLoader
+from linkml.validator.plugins.shacl_validation_plugin import ShaclValidationPlugin, _node_owners
+
+pytest.importorskip("pyshacl")
+
+SCHEMA = """
+id: http://example.org/shacl_test
+name: shacl_test
+prefixes:
+  linkml: https://w3id.org/linkml/
+  ex: http://example.org/
+default_prefix: ex
+imports:
+  - linkml:types
+default_range: string
+classes:
+  Person:
+    attributes:
+      id:
+        identifier: true
+      name:
+      age:
+        range: integer
+        maximum_value: 100
+      address:
+        range: Address
+        inlined: true
+  Address:
+    attributes:
+      street:
+      number:
+        range: integer
+        minimum_value: 1
+"""
+
+INSTANCES = [
+    {"id": "ex:0", "name": "Zero", "age": 30},
+    {"id": "ex:1", "name": "One", "age": 200},
+    {"id": "ex:2", "name": "Two", "address": {"street": "Main Street", "number": 0}},
+    {"id": "ex:3", "name": "Three", "not_a_slot": 1},
+    {"id": "ex:4", "name": "Four", "address": {"street": "Main Street", "number": 1}},
+]
+
+
+@pytest.fixture
+def schema_path(tmp_file_factory):
+    return tmp_file_factory("schema.yaml", SCHEMA)
+
+
+def _results(schema_path, plugin):
+    validator = Validator(schema_path, [plugin])
+    loader = PassthroughLoader(iter(INSTANCES))
+    return [
+        (result.instance_index, result.message)
+        for result in validator.iter_results_from_source(loader, "Person")
+        # Every instance is reported for its identifier slot, regardless of batching
+        if "ex:id" not in result.message
+    ]
+
+
+@pytest.mark.parametrize("batch_size", [None, 2, 10])
+def test_instance_index(schema_path, batch_size):
+    results = _results(schema_path, ShaclValidationPlugin(batch_size=batch_size))
+    assert sorted(index for index, _ in results) == [1, 2, 3]
+    messages = dict(results)
+    assert "Value is not <=" in messages[1]
+    # The focus node of this result is the nested address, which belongs to instance 2
+    assert "Value is not >=" in messages[2]
+    assert messages[3] == "failed at class instantiation stage"
+
+
+def test_batched_matches_unbatched(schema_path):
+    def components(results):
+        # Messages contain generated blank node identifiers, so only compare the violated constraint
+        return sorted((index, re.findall(r"shacl#\w+ConstraintComponent", message)) for index, message in results)
+
+    unbatched = _results(schema_path, ShaclValidationPlugin())
+    batched = _results(schema_path, ShaclValidationPlugin(batch_size=len(INSTANCES)))
+    assert components(batched) == components(unbatched)
+
+
+def test_node_owners_of_referenced_roots():
+    ex = rdflib.Namespace("http://example.org/")
+    graph = rdflib.Graph()
+    graph.add((ex.a, ex.knows, ex.b))
+    graph.add((ex.a, ex.address, ex.a_address))
+    graph.add((ex.b, ex.address, ex.b_address))
+    owners = _node_owners(graph, [ex.a, ex.b])
+    # The second root and the nodes under it belong to it, even though they are reachable from the first
+    assert owners == {ex.a: 0, ex.a_address: 0, ex.b: 1, ex.b_address: 1}
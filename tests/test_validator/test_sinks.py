@@ -0,0 +1,71 @@
+import io
+import json
+
+from linkml.validator.report import Severity, ValidationResult
+from linkml.validator.sinks import (
+    CappedResultSink,
+    CountingResultSink,
+    DeduplicatingResultSink,
+    JsonLinesResultSink,
+)
+
+
+def _result(message="problem", severity=Severity.ERROR, type="test", index=0):
+    return ValidationResult(type=type, severity=severity, message=message, instance_index=index)
+
+
+def test_json_lines_sink(tmp_path):
+    output = tmp_path / "results.jsonl"
+    with JsonLinesResultSink(output) as sink:
+        sink.accept(_result(index=0))
+        sink.accept(_result(message="other", severity=Severity.WARN, index=3))
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert lines == [
+        {"type": "test", "severity": "ERROR", "message": "problem", "instance_index": 0, "context": []},
+        {"type": "test", "severity": "WARN", "message": "other", "instance_index": 3, "context": []},
+    ]
+
+
+def test_json_lines_sink_stream():
+    stream = io.StringIO()
+    sink = JsonLinesResultSink(stream)
+    sink.accept(_result())
+    sink.close()
+    assert not stream.closed
+    assert json.loads(stream.getvalue())["message"] == "problem"
+
+
+def test_counting_sink():
+    sink = CountingResultSink()
+    for severity, result_type in [
+        (Severity.ERROR, "a"),
+        (Severity.ERROR, "a"),
+        (Severity.ERROR, "b"),
+        (Severity.WARN, "b"),
+    ]:
+        sink.accept(_result(severity=severity, type=result_type))
+    assert sink.total == 4
+    assert sink.by_severity() == {Severity.ERROR: 3, Severity.WARN: 1}
+    assert sink.by_type() == {"a": 2, "b": 2}
+
+
+def test_deduplicating_sink():
+    sink = DeduplicatingResultSink(examples_per_message=2, max_messages=2)
+    for i in range(5):
+        sink.accept(_result(message="common", index=i))
+    sink.accept(_result(message="rare", index=5))
+    sink.accept(_result(message="untracked", index=6))
+    top = sink.top()
+    assert [(message, count) for message, count, _ in top] == [("common", 5), ("rare", 1)]
+    assert [result.instance_index for result in top[0][2]] == [0, 1]
+    assert sink.overflow == 1
+
+
+def test_capped_sink():
+    counter = CountingResultSink()
+    sink = CappedResultSink(counter, max_per_type=2)
+    for i in range(5):
+        sink.accept(_result(type="a"))
+    sink.accept(_result(type="b"))
+    assert counter.by_type() == {"a": 2, "b": 1}
+    assert sink.dropped == {"a": 3}
@@ -0,0 +1,138 @@
+import sqlite3
+
+import pytest
+from linkml_runtime import SchemaView
+from linkml_runtime.linkml_model import SchemaDefinition
+from linkml_runtime.loaders import yaml_loader
+
+from linkml.utils.sqlutils import SQLStore
+from linkml.validator import Validator
+from linkml.validator.loaders import SqliteLoader
+from linkml.validator.plugins import JsonschemaValidationPlugin
+
+SCHEMA = """id: https://w3id.org/test/sqlite
+name: sqlite
+prefixes:
+  linkml: https://w3id.org/linkml/
+imports:
+  - linkml:types
+default_range: string
+classes:
+  Container:
+    tree_root: true
+    attributes:
+      persons:
+        range: Person
+        multivalued: true
+        inlined_as_list: true
+      organizations:
+        range: Organization
+        multivalued: true
+        inlined_as_list: true
+  Organization:
+    attributes:
+      id:
+        identifier: true
+      name:
+  Person:
+    attributes:
+      id:
+        identifier: true
+      name:
+        required: true
+      active:
+        range: boolean
+      aliases:
+        multivalued: true
+      address:
+        range: Address
+        inlined: true
+      employers:
+        range: Organization
+        multivalued: true
+      pets:
+        range: Pet
+        multivalued: true
+        inlined: true
+  Address:
+    attributes:
+      street:
+      city:
+  Pet:
+    attributes:
+      id:
+        identifier: true
+      species:
+"""
+
+PERSONS = [
+    {
+        "id": "p:1",
+        "name": "Ada",
+        "active": True,
+        "aliases": ["A", "Countess"],
+        "address": {"street": "Main", "city": "London"},
+    },
+    {"id": "p:2", "name": "Charles", "active": False},
+    {"id": "p:3", "name": "Mary", "address": {"city": "Paris"}},
+]
+ORGANIZATIONS = [{"id": "o:1", "name": "Analytical Engines"}, {"id": "o:2", "name": "Difference Engines"}]
+
+
+@pytest.fixture(scope="module")
+def schema():
+    return yaml_loader.load(SCHEMA, SchemaDefinition)
+
+
+@pytest.fixture(scope="module")
+def database(schema, tmp_path_factory):
+    path = tmp_path_factory.mktemp("sqlite") / "persons.db"
+    store = SQLStore(schema, database_path=path)
+    store.db_exists(force=True)
+    module = store.compile_native()
+    store.compile()
+    store.dump(yaml_loader.load({"persons": PERSONS, "organizations": ORGANIZATIONS}, target_class=module.Container))
+    store.engine.dispose()
+    # SQLStore cannot dump references to other objects and slots inlined as a dictionary
+    with sqlite3.connect(path) as connection:
+        connection.executemany(
+            'INSERT INTO "Person_employers" ("Person_id", employers_id) VALUES (?, ?)',
+            [("p:2", "o:1"), ("p:3", "o:1"), ("p:3", "o:2")],
+        )
+        connection.executemany(
+            'INSERT INTO Pet (id, species, "Person_id") VALUES (?, ?, ?)',
+            [("pet:1", "cat", "p:1"), ("pet:2", "dog", "p:1")],
+        )
+    connection.close()
+    return path
+
+
+@pytest.mark.parametrize("batch_size", [1, 1000])
+def test_load(schema, database, batch_size):
+    loader = SqliteLoader(database, schema, "Person", batch_size=batch_size)
+    instances = list(loader.iter_instances())
+    assert instances[0].pop("pets") == {
+        "pet:1": {"id": "pet:1", "species": "cat"},
+        "pet:2": {"id": "pet:2", "species": "dog"},
+    }
+    assert instances[1].pop("employers") == ["o:1"]
+    assert instances[2].pop("employers") == ["o:1", "o:2"]
+    assert instances == PERSONS
+
+
+def test_load_root(schema, database):
+    [container] = SqliteLoader(database, SchemaView(schema)).iter_instances()
+    assert container["organizations"] == ORGANIZATIONS
+    assert [person["id"] for person in container["persons"]] == ["p:1", "p:2", "p:3"]
+    assert container["persons"][2]["employers"] == ["o:1", "o:2"]
+
+
+def test_validate(schema, database):
+    validator = Validator(schema, [JsonschemaValidationPlugin(closed=True)])
+    report = validator.validate_source(SqliteLoader(database, schema, "Person"), "Person")
+    assert report.results == []
+
+
+def test_unknown_class(schema, database):
+    with pytest.raises(ValueError, match="No table for class"):
+        next(SqliteLoader(database, schema, "Unknown").iter_instances())
@@ -0,0 +1,204 @@
+import asyncio
+import json
+import os
+
+import pytest
+from linkml_runtime.linkml_model import SchemaDefinition
+from linkml_runtime.loaders import yaml_loader
+
+from linkml.validator import Validator
+from linkml.validator.loaders import JsonLinesLoader
+from linkml.validator.plugins import UniquenessPlugin
+from linkml.validator.plugins.uniqueness_plugin import _BloomFilter
+
+SCHEMA = """id: https://w3id.org/test/uniqueness
+name: uniqueness
+prefixes:
+  xsd: http://www.w3.org/2001/XMLSchema#
+default_range: string
+types:
+  string:
+    uri: xsd:string
+    base: str
+classes:
+  Person:
+    attributes:
+      id:
+        identifier: true
+      first_name:
+      last_name:
+      email:
+      addresses:
+        range: Address
+        multivalued: true
+        inlined: true
+    unique_keys:
+      name_key:
+        unique_key_slots:
+          - first_name
+          - last_name
+        consider_nulls_inequal: true
+      email_key:
+        unique_key_slots:
+          - email
+        consider_nulls_inequal: true
+  Employee:
+    is_a: Person
+  Address:
+    attributes:
+      id:
+        identifier: true
+      street:
+"""
+
+
+@pytest.fixture(scope="module")
+def schema():
+    return yaml_loader.load(SCHEMA, SchemaDefinition)
+
+
+def _validate(validator, tmp_path, persons):
+    data_path = tmp_path / "persons.jsonl"
+    data_path.write_text("".join(json.dumps(person) + "\n" for person in persons))
+    report = validator.validate_source(JsonLinesLoader(data_path), "Person")
+    return [(result.instance_index, result.message) for result in report.results]
+
+
+def test_duplicates(schema, tmp_path):
+    validator = Validator(schema, [UniquenessPlugin()])
+    persons = [
+        {"id": "p:1", "first_name": "Ada", "last_name": "Lovelace", "addresses": {"a:1": {"street": "Main"}}},
+        {"id": "p:2", "first_name": "Ada", "email": "ada@example.org"},
+        {"id": "p:1", "first_name": "Ada", "last_name": "Byron"},
+        {"id": "p:3", "first_name": "Ada", "last_name": "Lovelace", "email": "ada@example.org"},
+        {"id": "p:4", "addresses": [{"id": "a:1"}]},
+    ]
+    assert _validate(validator, tmp_path, persons) == [
+        (2, "Duplicate identifier 'p:1' in /, first seen in instance 0"),
+        (3, "Duplicate value ('Ada', 'Lovelace') of unique key 'name_key' in /, first seen in instance 0"),
+        (3, "Duplicate value 'ada@example.org' of unique key 'email_key' in /, first seen in instance 1"),
+        (4, "Duplicate identifier 'a:1' in /addresses/0, first seen in instance 0"),
+    ]
+    # Values are forgotten after each run
+    assert _validate(validator, tmp_path, persons[:1]) == []
+
+
+def test_missing_values_equal_by_default(tmp_path):
+    schema = yaml_loader.load(SCHEMA.replace("        consider_nulls_inequal: true\n", ""), SchemaDefinition)
+    validator = Validator(schema, [UniquenessPlugin()])
+    persons = [
+        {"id": "p:1", "first_name": "Ada", "email": "ada@example.org"},
+        {"id": "p:2", "first_name": "Ada"},
+        {"id": "p:3", "first_name": "Charles", "last_name": "Babbage"},
+    ]
+    assert _validate(validator, tmp_path, persons) == [
+        (1, "Duplicate value ('Ada', None) of unique key 'name_key' in /, first seen in instance 0"),
+        (2, "Duplicate value None of unique key 'email_key' in /, first seen in instance 1"),
+    ]
+
+
+def test_unique_keys_of_descendants(schema):
+    validator = Validator(schema, [UniquenessPlugin()])
+    report = validator.validate({"id": "p:1", "email": "x@example.org"}, "Employee")
+    assert report.results == []
+    report = validator.validate(
+        {"id": "p:1", "email": "x@example.org", "addresses": {"a:1": {"id": "p:1", "street": "Main"}}}, "Employee"
+    )
+    assert [result.message for result in report.results] == [
+        "Duplicate identifier 'p:1' in /addresses/a:1, first seen in instance 0"
+    ]
+
+
+@pytest.mark.parametrize("bloom_filter_capacity", [None, 100])
+def test_spill_to_disk(schema, tmp_path, bloom_filter_capacity):
+    plugin = UniquenessPlugin(5, bloom_filter_capacity=bloom_filter_capacity, spill_directory=tmp_path, batch_size=3)
+    validator = Validator(schema, [plugin])
+    persons = [{"id": f"p:{i}"} for i in range(20)] + [{"id": "p:2"}, {"id": "p:19"}]
+    assert _validate(validator, tmp_path, persons) == [
+        (20, "Duplicate identifier 'p:2' in /, first seen in instance 2"),
+        (21, "Duplicate identifier 'p:19' in /, first seen in instance 19"),
+    ]
+    assert plugin.spill_path.parent == tmp_path
+    plugin.close()
+
+
+def test_async_validation(schema, tmp_path):
+    plugin = UniquenessPlugin(5, batch_size=3)
+    validator = Validator(schema, [plugin], chunk_size=4)
+    persons = [{"id": f"p:{i}"} for i in range(20)] + [{"id": "p:2"}]
+    # The spill database is opened in this thread, and then used by the executor's threads
+    expected = _validate(validator, tmp_path, persons)
+    report = asyncio.run(validator.avalidate_source(JsonLinesLoader(tmp_path / "persons.jsonl"), "Person"))
+    assert [(result.instance_index, result.message) for result in report.results] == expected
+    assert expected == [(20, "Duplicate identifier 'p:2' in /, first seen in instance 2")]
+    plugin.close()
+
+
+def test_async_validation_stopped_early(schema, tmp_path):
+    plugin = UniquenessPlugin(batch_size=3)
+    validator = Validator(schema, [plugin], chunk_size=4)
+    data_path = tmp_path / "persons.jsonl"
+    data_path.write_text("".join(json.dumps({"id": f"p:{i % 10}"}) + "\n" for i in range(20)))
+
+    async def first_result():
+        results = validator.aiter_results_from_source(JsonLinesLoader(data_path), "Person")
+        result = await results.__anext__()
+        await results.aclose()
+        return result
+
+    assert asyncio.run(first_result()).instance_index == 10
+    # The values seen by the stopped run are forgotten
+    report = asyncio.run(validator.avalidate_source(JsonLinesLoader(data_path), "Person"))
+    assert [result.instance_index for result in report.results] == list(range(10, 20))
+    plugin.close()
+
+
+def test_parallel_workers(schema, tmp_path):
+    validator = Validator(schema, [UniquenessPlugin(batch_size=4)], workers=2, chunk_size=5)
+    persons = [{"id": f"p:{i % 15}"} for i in range(20)]
+    results = _validate(validator, tmp_path, persons)
+    assert [index for index, _ in results] == [15, 16, 17, 18, 19]
+
+
+def test_parallel_workers_report_smallest_index(schema, tmp_path):
+    persons = [
+        {"id": f"p:{i % 7}", "first_name": "Ada", "last_name": str(i % 5), "addresses": {"a:1": {}, f"a:{i}": {}}}
+        for i in range(40)
+    ]
+    expected = _validate(Validator(schema, [UniquenessPlugin()]), tmp_path, persons)
+    # Whichever worker gets to a value first, the results are those of sequential validation
+    for _ in range(3):
+        validator = Validator(schema, [UniquenessPlugin(batch_size=2)], workers=3, chunk_size=3, ordered=False)
+        assert _validate(validator, tmp_path, persons) == expected
+    assert expected[:3] == [
+        (1, "Duplicate identifier 'a:1' in /addresses/a:1, first seen in instance 0"),
+        (2, "Duplicate identifier 'a:1' in /addresses/a:1, first seen in instance 0"),
+        (3, "Duplicate identifier 'a:1' in /addresses/a:1, first seen in instance 0"),
+    ]
+
+
+def test_shared_values_report_smallest_index(schema):
+    plugin = UniquenessPlugin()
+    # Validate as a worker process would, with a later batch processed first
+    plugin._pid = None
+    context = Validator(schema, [plugin])._context("Person")
+    assert list(plugin.process_batch([(5, {"id": "p:1"}), (6, {"id": "p:2"})], context)) == []
+    assert list(plugin.process_batch([(1, {"id": "p:1"}), (2, {"id": "p:1"})], context)) == []
+    plugin._pid = os.getpid()
+    results = plugin.post_process(context)
+    assert [(result.instance_index, result.message) for result in results] == [
+        (2, "Duplicate identifier 'p:1' in /, first seen in instance 1"),
+        (5, "Duplicate identifier 'p:1' in /, first seen in instance 1"),
+    ]
+    # The recorded values are removed for the next run
+    assert plugin.post_process(context) is None
+    plugin.close()
+
+
+def test_bloom_filter():
+    bloom_filter = _BloomFilter(100)
+    digests = [UniquenessPlugin._digest("test", (i,)) for i in range(100)]
+    for digest in digests[:50]:
+        bloom_filter.add(digest)
+    assert all(digest in bloom_filter for digest in digests[:50])
+    assert sum(digest in bloom_filter for digest in digests[50:]) < 10
@@ -1,7 +1,11 @@
+import os
+
 import pytest
 import yaml
+from linkml_runtime.linkml_model import SchemaDefinition
+from linkml_runtime.loaders import yaml_loader
 
-from linkml.validator import validate
+from linkml.validator import clear_validator_cache, set_validator_cache_size, validate, validator_cache_info
 
 
 @pytest.fixture
@@ -76,3 +80,63 @@ def test_not_a_valid_schema():
     schema = {"foo": "bar"}
     with pytest.raises(ValueError, match="Invalid schema"):
         validate(instance, schema)
+
+
+@pytest.fixture
+def empty_validator_cache():
+    clear_validator_cache()
+    yield
+    clear_validator_cache()
+    set_validator_cache_size(32)
+
+
+def test_validator_reused_for_schema_file(personinfo_schema_path, empty_validator_cache):
+    for _ in range(3):
+        validate({"id": "1", "full_name": "Person A"}, personinfo_schema_path, "Person")
+    info = validator_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+    validate({"id": "1", "full_name": "Person A"}, personinfo_schema_path, "Person", strict=True)
+    assert validator_cache_info().misses == 2
+
+
+def test_validator_invalidated_on_schema_change(tmp_path, personinfo_schema_path, empty_validator_cache):
+    schema_path = tmp_path / "schema.yaml"
+    with open(personinfo_schema_path) as schema_file:
+        schema = yaml.safe_load(schema_file)
+    schema_path.write_text(yaml.safe_dump(schema))
+    instance = {"id": "1", "full_name": "Person A", "age": 30}
+    assert validate(instance, str(schema_path), "Person").results == []
+
+    schema["classes"]["Person"]["attributes"]["age"]["maximum_value"] = 20
+    schema_path.write_text(yaml.safe_dump(schema))
+    os.utime(schema_path, ns=(0, 0))
+    assert len(validate(instance, str(schema_path), "Person").results) == 1
+    assert validator_cache_info().misses == 2
+
+
+def test_validator_reused_for_schema_dict(personinfo_schema_path, empty_validator_cache):
+    with open(personinfo_schema_path) as schema_file:
+        schema = yaml.safe_load(schema_file)
+    validate({"id": "1", "full_name": "Person A"}, schema, "Person")
+    validate({"id": "1", "full_name": "Person A"}, dict(schema), "Person")
+    assert validator_cache_info().hits == 1
+
+
+def test_validator_cache_size(tmp_path, personinfo_schema_path, empty_validator_cache):
+    set_validator_cache_size(1)
+    with open(personinfo_schema_path) as schema_file:
+        schema = yaml.safe_load(schema_file)
+    other_schema = {**schema, "description": "another schema"}
+    for s in (schema, other_schema, schema):
+        validate({"id": "1", "full_name": "Person A"}, s, "Person")
+    info = validator_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 3, 1)
+
+
+def test_validator_reused_for_schema_definition(personinfo_schema_path, empty_validator_cache):
+    schema = yaml_loader.load(personinfo_schema_path, SchemaDefinition)
+    for _ in range(3):
+        validate({"id": "1", "full_name": "Person A"}, schema, "Person")
+    info = validator_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
@@ -1,13 +1,19 @@
+import asyncio
+import gc
+import time
+import weakref
+from collections import Counter
 from typing import Iterable
 
 import pytest
 from linkml_runtime.linkml_model import ClassDefinition, SchemaDefinition
 
 from linkml.validator import Validator
-from linkml.validator.loaders import Loader
-from linkml.validator.plugins import ValidationPlugin
+from linkml.validator.loaders import JsonLinesLoader, Loader
+from linkml.validator.plugins import JsonschemaValidationPlugin, ValidationPlugin
 from linkml.validator.report import Severity, ValidationResult
-from linkml.validator.validation_context import ValidationContext
+from linkml.validator.sinks import CountingResultSink, DeduplicatingResultSink
+from linkml.validator.validation_context import ValidationContext, ValidationContextRegistry
 
 SCHEMA = SchemaDefinition(
     id="testschema",
@@ -174,3 +180,334 @@ classes:
 
     report = validator.validate({"an_attribute": "something"})
     assert report.results == []
+
+
+class FailOnIdValidationPlugin(ValidationPlugin):
+    def __init__(self, failing_ids, severity=Severity.ERROR) -> None:
+        super().__init__()
+        self.failing_ids = failing_ids
+        self.severity = severity
+
+    def process(self, instance: dict, context: ValidationContext) -> Iterable[ValidationResult]:
+        if instance["id"] in self.failing_ids:
+            yield ValidationResult(
+                type="fail on id",
+                severity=self.severity,
+                message=f"Instance {instance['id']} failed",
+                instance=instance,
+                instantiates=context.target_class,
+            )
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_parallel_iter_results_from_source(ordered):
+    plugins = [FailOnIdValidationPlugin({3, 17, 42, 98})]
+    validator = Validator(SCHEMA, plugins, workers=3, chunk_size=7, ordered=ordered)
+    results = list(validator.iter_results_from_source(TestDataLoader(None, 100)))
+    assert len(results) == 4
+    for result in results:
+        assert result.instance_index == result.instance["id"]
+    indexes = [result.instance_index for result in results]
+    if ordered:
+        assert indexes == [3, 17, 42, 98]
+    else:
+        assert sorted(indexes) == [3, 17, 42, 98]
+
+
+def test_parallel_matches_serial():
+    plugins = [AcceptNothingValidationPlugin(2)]
+    serial = Validator(SCHEMA, plugins).validate_source(TestDataLoader(None, 25))
+    parallel = Validator(SCHEMA, plugins, workers=2, chunk_size=4).validate_source(TestDataLoader(None, 25))
+    assert [(r.instance_index, r.message) for r in parallel.results] == [
+        (r.instance_index, r.message) for r in serial.results
+    ]
+
+
+@pytest.mark.parametrize("strict,severity", [(True, Severity.ERROR), (False, Severity.FATAL)])
+def test_parallel_stops_on_failure(strict, severity):
+    plugins = [FailOnIdValidationPlugin({10, 11, 60}, severity=severity)]
+    validator = Validator(SCHEMA, plugins, strict=strict, workers=2, chunk_size=5)
+    results = list(validator.iter_results_from_source(TestDataLoader(None, 100)))
+    assert len(results) == 1
+    assert results[0].instance_index == 10
+
+
+def test_parallel_json_lines_byte_ranges(tmp_file_factory):
+    jsonl_file = tmp_file_factory("data.jsonl", "".join(f'{{"id": {i}}}\n\n' for i in range(30)))
+    plugins = [FailOnIdValidationPlugin({1, 14, 29})]
+    validator = Validator(SCHEMA, plugins, workers=2)
+    results = list(validator.iter_results_from_source(JsonLinesLoader(jsonl_file, chunk_size=16)))
+    assert [result.instance_index for result in results] == [2, 28, 58]
+
+
+def test_validate_source_into_sinks():
+    plugins = [AcceptNothingValidationPlugin(3)]
+    validator = Validator(SCHEMA, plugins, include_instances=False)
+    counter = CountingResultSink()
+    deduplicator = DeduplicatingResultSink()
+    validator.validate_source_into(TestDataLoader(None, 4), [counter, deduplicator])
+    assert counter.total == 12
+    top = deduplicator.top()
+    assert [count for _, count, _ in top] == [4, 4, 4]
+    example = top[0][2][0]
+    assert example.instance is None
+    assert example.instance_index == 0
+
+
+class BatchRecordingValidationPlugin(FailOnIdValidationPlugin):
+    batch_size = 4
+
+    def __init__(self, failing_ids) -> None:
+        super().__init__(failing_ids)
+        self.batch_sizes = []
+
+    def process_batch(self, batch, context: ValidationContext) -> Iterable[ValidationResult]:
+        self.batch_sizes.append(len(batch))
+        yield from super().process_batch(batch, context)
+
+
+def test_batched_plugins():
+    batched = BatchRecordingValidationPlugin({2, 9})
+    unbatched = FailOnIdValidationPlugin({5})
+    validator = Validator(SCHEMA, [batched, unbatched])
+    results = list(validator.iter_results_from_source(TestDataLoader(None, 10)))
+    assert batched.batch_sizes == [4, 4, 2]
+    assert [result.instance_index for result in results] == [2, 5, 9]
+    for result in results:
+        assert result.instance_index == result.instance["id"]
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_collect_stats(workers):
+    plugins = [AcceptNothingValidationPlugin(2), FailOnIdValidationPlugin({3})]
+    validator = Validator(SCHEMA, plugins, workers=workers, chunk_size=4, collect_stats=True)
+    report = validator.validate_source(TestDataLoader(None, 10))
+    stats = report.stats
+    assert stats is validator.last_stats
+    assert (stats.instances, stats.results) == (10, 21)
+    assert stats.seconds > 0
+    assert [plugin_stats.plugin for plugin_stats in stats.plugins] == [
+        "AcceptNothingValidationPlugin",
+        "FailOnIdValidationPlugin",
+    ]
+    assert [(p.instances, p.process.calls, p.results) for p in stats.plugins] == [(10, 10, 20), (10, 10, 1)]
+    assert stats.plugins[0].pre_process.calls >= 1
+    assert stats.plugins[0].post_process.calls == 1
+    [loader_stats] = stats.loaders
+    assert (loader_stats.loader, loader_stats.instances) == ("TestDataLoader", 10)
+
+
+def test_collect_stats_batched():
+    plugin = BatchRecordingValidationPlugin({2})
+    validator = Validator(SCHEMA, [plugin], collect_stats=True)
+    stats = validator.validate_source(TestDataLoader(None, 10)).stats
+    assert [(p.instances, p.process.calls, p.results) for p in stats.plugins] == [(10, 3, 1)]
+
+
+def test_no_stats_by_default():
+    validator = Validator(SCHEMA, [AcceptNothingValidationPlugin(1)])
+    assert validator.validate_source(TestDataLoader(None, 2)).stats is None
+
+
+def test_sample_rate():
+    validator = Validator(SCHEMA, [AcceptNothingValidationPlugin(1)], sample_rate=0.1, sample_seed=1)
+    report = validator.validate_source(TestDataLoader(None, 1000))
+    summary = report.summary
+    assert summary is validator.last_summary
+    assert summary.instances_seen == 1000
+    assert 50 < summary.instances_examined < 150
+    assert summary.instances_with_errors == summary.instances_examined == len(report.results)
+    assert summary.error_rate == 1
+    assert summary.estimated_instances_with_errors == 1000
+    indexes = [result.instance_index for result in report.results]
+    assert indexes == sorted(indexes)
+
+    # The same seed examines the same instances
+    repeated = validator.validate_source(TestDataLoader(None, 1000))
+    assert [result.instance_index for result in repeated.results] == indexes
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_sample_size(workers):
+    plugins = [FailOnIdValidationPlugin(set(range(0, 100, 2)))]
+    validator = Validator(SCHEMA, plugins, sample_size=10, sample_seed=3, workers=workers, chunk_size=3)
+    report = validator.validate_source(TestDataLoader(None, 100))
+    summary = report.summary
+    assert (summary.instances_seen, summary.instances_examined) == (100, 10)
+    assert summary.fraction_examined == 0.1
+    assert summary.instances_with_errors == len(report.results)
+    assert summary.estimated_instances_with_errors == summary.error_rate * 100
+    indexes = [result.instance_index for result in report.results]
+    assert indexes == sorted(indexes)
+
+
+def test_sample_size_larger_than_source():
+    validator = Validator(SCHEMA, [AcceptNothingValidationPlugin(1)], sample_size=10)
+    report = validator.validate_source(TestDataLoader(None, 4))
+    assert [result.instance_index for result in report.results] == [0, 1, 2, 3]
+    assert report.summary.fraction_examined == 1
+
+
+def test_sample_options_cannot_be_combined():
+    with pytest.raises(ValueError):
+        Validator(SCHEMA, [], sample_rate=0.5, sample_size=10)
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_max_errors(workers):
+    validator = Validator(SCHEMA, [AcceptNothingValidationPlugin(2)], max_errors=5, workers=workers, chunk_size=4)
+    report = validator.validate_source(TestDataLoader(None, 100))
+    assert len(report.results) == 5
+    summary = report.summary
+    assert summary.stopped_early
+    assert summary.instances_with_errors == 3
+    assert summary.instances_seen <= 100
+    # Workers validate whole chunks, while instances loaded ahead are not counted
+    assert summary.instances_examined == (3 if workers is None else 4)
+    assert summary.fraction_examined is None
+    assert summary.estimated_instances_with_errors is None
+
+
+def test_max_errors_per_type():
+    plugins = [AcceptNothingValidationPlugin(2), FailOnIdValidationPlugin({1, 2, 3})]
+    validator = Validator(SCHEMA, plugins, max_errors_per_type=3)
+    report = validator.validate_source(TestDataLoader(None, 10))
+    assert Counter(result.type for result in report.results) == {"accept nothing": 3, "fail on id": 3}
+    summary = report.summary
+    assert summary.suppressed_results == {"accept nothing": 17}
+    assert not summary.stopped_early
+    assert (summary.instances_seen, summary.instances_examined, summary.instances_with_errors) == (10, 10, 10)
+
+
+def test_instances_with_errors_batched():
+    # Batched plugins report on a whole batch in turn, so the results of an instance are interleaved with others
+    ids = set(range(1, 100, 3))
+    plugins = [BatchRecordingValidationPlugin(ids), FailOnIdValidationPlugin(ids)]
+    validator = Validator(SCHEMA, plugins, max_errors_per_type=1000, chunk_size=1)
+    report = validator.validate_source(TestDataLoader(None, 100))
+    assert [result.instance_index for result in report.results[:6]] == [1, 1, 4, 7, 4, 7]
+    assert report.summary.instances_with_errors == len(ids)
+
+
+def test_no_summary_by_default():
+    validator = Validator(SCHEMA, [AcceptNothingValidationPlugin(1)])
+    assert validator.validate_source(TestDataLoader(None, 2)).summary is None
+
+
+class WarmUpRecordingValidationPlugin(AcceptAnythingValidationPlugin):
+    def __init__(self) -> None:
+        self.warmed_up = []
+
+    def warm_up(self, context: ValidationContext) -> None:
+        self.warmed_up.append(context.target_class)
+
+
+class SlowValidationPlugin(AcceptAnythingValidationPlugin):
+    def process(self, instance: dict, context: ValidationContext) -> Iterable[ValidationResult]:
+        time.sleep(0.01)
+        return []
+
+
+def test_avalidate_source_matches_sync():
+    plugins = [AcceptNothingValidationPlugin(2), FailOnIdValidationPlugin({3, 17})]
+    validator = Validator(SCHEMA, plugins, chunk_size=4)
+    expected = validator.validate_source(TestDataLoader(None, 25))
+    report = asyncio.run(validator.avalidate_source(TestDataLoader(None, 25)))
+    assert [(r.instance_index, r.message) for r in report.results] == [
+        (r.instance_index, r.message) for r in expected.results
+    ]
+
+
+def test_avalidate():
+    validator = Validator(SCHEMA, [AcceptNothingValidationPlugin(2)])
+    report = asyncio.run(validator.avalidate({"id": 1}, "OtherClass"))
+    assert [result.message for result in report.results] == ["Error number 0", "Error number 1"]
+    assert report.results[0].instantiates == "OtherClass"
+
+
+def test_aiter_results_from_source_strict():
+    validator = Validator(SCHEMA, [FailOnIdValidationPlugin({5, 6, 20})], strict=True, chunk_size=4)
+
+    async def collect():
+        return [result async for result in validator.aiter_results_from_source(TestDataLoader(None, 30))]
+
+    assert [result.instance_index for result in asyncio.run(collect())] == [5]
+
+
+def test_awarm():
+    plugin = WarmUpRecordingValidationPlugin()
+    validator = Validator(SCHEMA, [plugin])
+    asyncio.run(validator.awarm("OtherClass"))
+    assert plugin.warmed_up == ["OtherClass"]
+
+
+def test_async_validation_does_not_block_event_loop():
+    validator = Validator(SCHEMA, [SlowValidationPlugin()], chunk_size=5)
+    ticks = []
+
+    async def tick():
+        while True:
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.005)
+
+    async def run():
+        ticker = asyncio.ensure_future(tick())
+        report = await validator.avalidate_source(TestDataLoader(None, 20))
+        ticker.cancel()
+        return report
+
+    assert asyncio.run(run()).results == []
+    assert len(ticks) > 5
+
+
+def test_context_registry_shared_between_validators():
+    registry = ValidationContextRegistry()
+    first = Validator(SCHEMA, [AcceptNothingValidationPlugin(1)], context_registry=registry)
+    second = Validator(SCHEMA, [FailOnIdValidationPlugin({1})], context_registry=registry)
+    assert first._context("OtherClass") is second._context("OtherClass")
+    assert first._context() is not first._context("OtherClass")
+    info = registry.info()
+    assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+
+    context = first._context("OtherClass")
+    registry.clear()
+    assert registry.info().currsize == 0
+    assert first._context("OtherClass") is not context
+
+
+def test_context_registry_eviction():
+    registry = ValidationContextRegistry(maxsize=1)
+    validator = Validator(SCHEMA, [], context_registry=registry)
+    context = validator._context("TreeRoot")
+    validator._context("OtherClass")
+    assert registry.info().currsize == 1
+    assert validator._context("TreeRoot") is not context
+
+
+def test_context_registry_artifacts(input_path):
+    registry = ValidationContextRegistry()
+    plugin = JsonschemaValidationPlugin(closed=True)
+    validator = Validator(input_path("personinfo.yaml"), [plugin], context_registry=registry)
+    assert registry.info().artifacts == 0
+    size = registry.approximate_size()
+    validator.validate({"id": "1"}, "Person")
+    assert registry.info().artifacts == 1
+    assert registry.approximate_size() > size
+    validator.validate({"id": "2"}, "Person")
+    assert validator._context("Person").timings["json_schema"].calls == 1
+
+
+def test_context_registry_with_workers():
+    registry = ValidationContextRegistry()
+    validator = Validator(SCHEMA, [FailOnIdValidationPlugin({3})], workers=2, chunk_size=2, context_registry=registry)
+    results = validator.validate_source(TestDataLoader(None, 10)).results
+    assert [result.instance_index for result in results] == [3]
+
+
+def test_contexts_released_with_validator():
+    validator = Validator(SCHEMA, [AcceptNothingValidationPlugin(1)])
+    validator.validate({"id": 1})
+    context = weakref.ref(validator._context())
+    del validator
+    gc.collect()
+    assert context() is None
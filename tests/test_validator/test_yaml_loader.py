@@ -59,3 +59,22 @@ b: two
     assert next(instances) == {"a": 5, "b": "six"}
     with pytest.raises(StopIteration):
         next(instances)
+
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_streaming(tmp_file_factory, streaming):
+    yaml_path = tmp_file_factory(
+        "data.yaml",
+        """
+- &first
+  a: 1
+- *first
+---
+[]
+---
+a: 3
+""",
+    )
+
+    loader = YamlLoader(yaml_path, streaming=streaming)
+    assert list(loader.iter_instances()) == [{"a": 1}, {"a": 1}, {"a": 3}]